@@ -0,0 +1,175 @@
+"""Commit bisection for capacity regressions — the engine behind `prescale bisect`.
+
+Each probe checks a commit out into a throwaway git worktree, boots the app
+there with the user's start command, and measures a single load level instead
+of a full ramp. The search itself is plain binary search over the first-parent
+ancestry path from good to bad, kept separate so it is testable without git.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlparse
+
+import httpx
+
+_LOG_TAIL = 20  # lines of server output quoted when a boot fails
+
+
+class BisectError(Exception):
+    pass
+
+
+def _git(*args: str, cwd: str | Path | None = None) -> str:
+    proc = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True,
+                          check=False)
+    if proc.returncode != 0:
+        detail = proc.stderr.strip().splitlines()
+        raise BisectError(f"git {args[0]} failed: {detail[-1] if detail else proc.returncode}")
+    return proc.stdout.strip()
+
+
+def resolve(rev: str, *, cwd: str | Path | None = None) -> str:
+    """Full sha for `rev`, or BisectError if it isn't a commit here."""
+    try:
+        return _git("rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}", cwd=cwd)
+    except BisectError:
+        raise BisectError(f"'{rev}' is not a commit in this repository.") from None
+
+
+def short(sha: str, *, cwd: str | Path | None = None) -> str:
+    return _git("rev-parse", "--short", sha, cwd=cwd)
+
+
+def subject(sha: str, *, cwd: str | Path | None = None) -> str:
+    return _git("log", "-1", "--format=%s", sha, cwd=cwd)
+
+
+def commits_between(good: str, bad: str, *, cwd: str | Path | None = None) -> list[str]:
+    """Commits after `good` up to and including `bad`, oldest first — the
+    candidates for "first bad commit"."""
+    good, bad = resolve(good, cwd=cwd), resolve(bad, cwd=cwd)
+    if good == bad:
+        raise BisectError("--good and --bad are the same commit.")
+    proc = subprocess.run(["git", "merge-base", "--is-ancestor", good, bad], cwd=cwd,
+                          capture_output=True, check=False)
+    if proc.returncode != 0:
+        raise BisectError("--good must be an ancestor of --bad.")
+    out = _git("rev-list", "--reverse", "--first-parent", "--ancestry-path",
+               f"{good}..{bad}", cwd=cwd)
+    return out.split()
+
+
+def first_bad(commits: list[str], is_bad: Callable[[str], bool]) -> str:
+    """Binary search for the first bad commit. The commit before `commits[0]`
+    is known good and `commits[-1]` is known bad, so only the interior is
+    probed: about log2(len) calls to `is_bad`."""
+    lo, hi = -1, len(commits) - 1  # lo: last known good, hi: first known bad
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if is_bad(commits[mid]):
+            hi = mid
+        else:
+            lo = mid
+    return commits[hi]
+
+
+@contextmanager
+def worktree(sha: str, *, repo: str | Path | None = None) -> Iterator[Path]:
+    """A detached checkout of `sha` in a temporary directory, removed on exit."""
+    path = Path(tempfile.mkdtemp(prefix="prescale-bisect-"))
+    try:
+        _git("worktree", "add", "--detach", "--force", str(path), sha, cwd=repo)
+        yield path
+    finally:
+        subprocess.run(["git", "worktree", "remove", "--force", str(path)], cwd=repo,
+                       capture_output=True, check=False)
+        shutil.rmtree(path, ignore_errors=True)
+        subprocess.run(["git", "worktree", "prune"], cwd=repo, capture_output=True,
+                       check=False)
+
+
+@contextmanager
+def server(command: str, *, cwd: Path, url: str, boot_timeout: float) -> Iterator[None]:
+    """Run `command` (a shell line) in `cwd` until `url` answers, then yield.
+    Any HTTP response counts as up — a 500 on / is the app's business, not a
+    boot failure, which is why the port must be free beforehand: an answer
+    from a server already listening there would pass for this checkout's. The
+    whole process group is stopped on exit."""
+    _ensure_port_free(url)
+    log_path = cwd / ".prescale-bisect.log"
+    with open(log_path, "wb") as log:
+        proc = subprocess.Popen(command, shell=True, cwd=cwd, stdout=log,
+                                stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                                start_new_session=True)
+    try:
+        _wait_until_up(proc, url, boot_timeout, log_path)
+        yield
+    finally:
+        _stop(proc)
+
+
+def _ensure_port_free(url: str) -> None:
+    parsed = urlparse(url)
+    host = parsed.hostname or "localhost"
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        socket.create_connection((host, port), timeout=1.0).close()
+    except OSError:
+        return  # nothing listening: the start command can have it
+    raise BisectError(f"something is already listening on {host}:{port}; stop it first, "
+                      "or every probe would measure that server instead of the "
+                      "checked-out commit.")
+
+
+def _wait_until_up(proc: subprocess.Popen, url: str, boot_timeout: float,
+                   log_path: Path) -> None:
+    deadline = time.monotonic() + boot_timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise BisectError(f"start command exited with code {proc.returncode}"
+                              f"{_log_tail(log_path)}")
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise BisectError(f"server didn't answer at {url} within {boot_timeout:g}s"
+                      f"{_log_tail(log_path)}")
+
+
+def _log_tail(log_path: Path) -> str:
+    try:
+        lines = log_path.read_text(errors="replace").splitlines()[-_LOG_TAIL:]
+    except OSError:
+        return ""
+    return ":\n" + "\n".join(lines) if lines else ""
+
+
+def _stop(proc: subprocess.Popen) -> None:
+    if proc.poll() is not None:
+        return
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+    else:
+        proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+        proc.wait()
@@ -0,0 +1,159 @@
+"""Bootstrap band on the breaking level (`run --bootstrap N`).
+
+Each resample redraws every level's requests with replacement and re-finds the
+first level that crosses the error or latency threshold; the band is the spread
+of "survives" across resamples. Resampling a million latencies 10k times is out
+of reach in pure Python, so each level's bootstrap distributions are computed
+exactly, once, and then sampled:
+
+* the resampled error count is Binomial(total, errors / total);
+* the resampled p95 is an order statistic of the sorted latencies, and the
+  chance that it lands at or below the j-th value is
+  P(Binomial(n, (j + 1) / n) >= r + 1) (the resample's rank-r value is <= x_j
+  iff at least r + 1 draws hit the lowest j + 1 values).
+
+Both become small inverse-CDF tables, so a resample costs one `random()` and a
+bisect per level. Errors and latencies are drawn independently (a stratified
+bootstrap). Seeded, so the same data and seed give the same band.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from prescale_cli.loadtest import StageResult
+
+_BAND = (0.10, 0.90)  # ~80% band, matching the analytic one
+_WINDOW_SD = 6        # tables cover +-6 sd; the mass outside is ~1e-9
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """Continued fraction for the incomplete beta (modified Lentz)."""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1, a - 1
+    c, d = 1.0, 1 - qab * x / qap
+    d = 1 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 300):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1 + aa * d
+        d = 1 / (d if abs(d) > tiny else tiny)
+        c = 1 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1 + aa * d
+        d = 1 / (d if abs(d) > tiny else tiny)
+        c = 1 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-12:
+            break
+    return h
+
+
+def betainc(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta I_x(a, b)."""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    ln_front = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                + a * math.log(x) + b * math.log1p(-x))
+    if x < (a + 1) / (a + b + 2):
+        return math.exp(ln_front) * _betacf(a, b, x) / a
+    return 1 - math.exp(ln_front) * _betacf(b, a, 1 - x) / b
+
+
+def binom_cdf(k: int, n: int, p: float) -> float:
+    """P(Binomial(n, p) <= k)."""
+    if k < 0:
+        return 0.0
+    if k >= n:
+        return 1.0
+    return betainc(n - k, k + 1, 1 - p)
+
+
+class _Table:
+    """Inverse-CDF sampler over a discrete distribution."""
+
+    def __init__(self, values: list[float], cdf: list[float]) -> None:
+        self.values = values
+        self.cdf = cdf
+        self.cdf[-1] = 1.0  # absorb the tail mass outside the window
+
+    def draw(self, rng: random.Random) -> float:
+        return self.values[bisect_left(self.cdf, rng.random())]
+
+
+def _window(center: float, sd: float, lo: int, hi: int) -> range:
+    span = math.ceil(_WINDOW_SD * sd) + 1
+    return range(max(lo, math.floor(center) - span), min(hi, math.ceil(center) + span) + 1)
+
+
+def error_table(errors: int, total: int) -> _Table:
+    """Bootstrap distribution of a level's error rate."""
+    if errors == 0 or errors == total:
+        return _Table([errors / total], [1.0])
+    p = errors / total
+    ks = _window(total * p, math.sqrt(total * p * (1 - p)), 0, total)
+    return _Table([k / total for k in ks], [binom_cdf(k, total, p) for k in ks])
+
+
+def quantile_table(n: int, at, q: float) -> _Table:
+    """Bootstrap distribution of the q-quantile of n sorted samples, where
+    `at(rank)` returns the rank-th smallest. Interpolates between neighbouring
+    order statistics like `percentile` does."""
+    pos = (n - 1) * q
+    r = int(pos)
+    frac = pos - r
+    if n == 1:
+        return _Table([at(0)], [1.0])
+    js = _window(pos, math.sqrt(n * q * (1 - q)), 0, n - 1)
+    values, cdf = [], []
+    for j in js:
+        lo = at(j)
+        values.append(lo + (at(min(j + 1, n - 1)) - lo) * frac)
+        cdf.append(1 - binom_cdf(r, n, (j + 1) / n))
+    return _Table(values, cdf)
+
+
+def _band_of(draws: list[int]) -> tuple[int, int]:
+    draws = sorted(draws)
+
+    def at(q: float) -> int:
+        return draws[min(len(draws) - 1, int(q * (len(draws) - 1) + 0.5))]
+
+    return at(_BAND[0]), at(_BAND[1])
+
+
+def bootstrap_band(stages: list[StageResult], *, latency_wall: float,
+                   error_threshold: float, survives_point: int, max_tested: int,
+                   resamples: int, seed: int | None = None) -> tuple[int, int, bool]:
+    """(low, high, stable) for survives_users from `resamples` bootstrap
+    resamples of every level — a drop-in for `confidence_band`."""
+    tables = []
+    for stage in stages:
+        err = error_table(stage.errors, stage.total) if stage.total else None
+        n, at = stage.ranked()
+        tables.append((err, quantile_table(n, at, 0.95) if n else None))
+
+    rng = random.Random(seed if seed is not None else 0)
+    draws = []
+    for _ in range(resamples):
+        survives = max_tested
+        for i, (err, p95) in enumerate(tables):
+            if ((err is not None and err.draw(rng) >= error_threshold)
+                    or (p95 is not None and p95.draw(rng) >= latency_wall)):
+                survives = stages[i - 1].users if i > 0 else 0
+                break
+        draws.append(survives)
+    low, high = _band_of(draws)
+    low, high = min(low, survives_point), max(high, survives_point)
+    return low, high, low == high
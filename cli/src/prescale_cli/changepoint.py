@@ -0,0 +1,147 @@
+"""In-stage changepoint detection: *when* inside a level things went wrong.
+
+Stage-level onset only says "the 150-user level failed". A pool that runs dry
+3s into that level is a cliff, not a slope, and the moment it happens is the
+clue. Each stage keeps 100ms ticks of its request stream (counts, error counts,
+latency sums); a CUSUM test over the stream finds the single most likely shift
+in mean latency or error rate. It's significant when the CUSUM statistic beats
+the 5% critical value of the Brownian-bridge supremum (Kolmogorov, 1.358) *and*
+the shift is big enough to matter. Pure and deterministic.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from prescale_cli.loadtest import StageResult
+
+TICK_SECONDS = 0.1
+_CRITICAL = 1.358        # sup|Brownian bridge| at alpha = 0.05
+_MIN_SIDE = 20           # requests needed on each side of a changepoint
+_LATENCY_FACTOR = 1.5    # mean latency must rise at least 1.5x ...
+_LATENCY_FLOOR_S = 0.01  # ... and by at least 10ms
+
+
+@dataclass
+class Tick:
+    """One TICK_SECONDS slice of a stage's request stream (by completion time)."""
+
+    total: int = 0
+    errors: int = 0
+    lat_n: int = 0        # successful requests (the ones with a latency)
+    lat_sum: float = 0.0
+    lat_sq: float = 0.0
+
+    def add(self, latency: float | None) -> None:
+        self.total += 1
+        if latency is None:
+            self.errors += 1
+            return
+        self.lat_n += 1
+        self.lat_sum += latency
+        self.lat_sq += latency * latency
+
+    def merge(self, other: Tick) -> None:
+        self.total += other.total
+        self.errors += other.errors
+        self.lat_n += other.lat_n
+        self.lat_sum += other.lat_sum
+        self.lat_sq += other.lat_sq
+
+
+@dataclass
+class Changepoint:
+    users: int
+    offset_s: float    # seconds into the stage
+    metric: str        # "latency" (mean, seconds) | "errors" (rate)
+    before: float
+    after: float
+    statistic: float   # normalised CUSUM; > 1.358 is significant
+
+
+def _cusum(counts: list[int], sums: list[float], sigma: float):
+    """(statistic, k): the most extreme point of the centred cumulative sum,
+    normalised so that under no change it behaves like a Brownian bridge.
+    k is the last tick of the 'before' segment."""
+    n = sum(counts)
+    if n == 0 or sigma <= 0:
+        return 0.0, None
+    mean = sum(sums) / n
+    best, best_k, c, seen = 0.0, None, 0.0, 0
+    for k, (cnt, total) in enumerate(zip(counts, sums)):
+        c += total - cnt * mean
+        seen += cnt
+        if seen >= _MIN_SIDE and n - seen >= _MIN_SIDE and -c > best:
+            best, best_k = -c, k  # before runs *below* the mean: an upward shift
+    return best / (sigma * math.sqrt(n)), best_k
+
+
+def _split(counts, sums, k):
+    n_before, n_after = sum(counts[:k + 1]), sum(counts[k + 1:])
+    return sum(sums[:k + 1]) / n_before, sum(sums[k + 1:]) / n_after
+
+
+def detect(ticks: list[Tick], *, users: int,
+           error_threshold: float = 0.02) -> Changepoint | None:
+    """The upward shift in error rate or mean latency within a stage, or None.
+    The two are tested separately (failed requests carry no latency); if both
+    shifted, the earlier one is where degradation began."""
+    if len(ticks) < 4:
+        return None
+    found = []
+
+    totals = [t.total for t in ticks]
+    errors = [float(t.errors) for t in ticks]
+    n = sum(totals)
+    p = sum(errors) / n if n else 0.0
+    stat, k = _cusum(totals, errors, math.sqrt(p * (1 - p)))
+    if k is not None and stat > _CRITICAL:
+        before, after = _split(totals, errors, k)
+        if after >= error_threshold:
+            found.append(Changepoint(users, round((k + 1) * TICK_SECONDS, 1), "errors",
+                                     before, after, stat))
+
+    counts = [t.lat_n for t in ticks]
+    sums = [t.lat_sum for t in ticks]
+    m = sum(counts)
+    if m:
+        mean = sum(sums) / m
+        var = sum(t.lat_sq for t in ticks) / m - mean * mean
+        stat, k = _cusum(counts, sums, math.sqrt(max(var, 0.0)))
+        if k is not None and stat > _CRITICAL:
+            before, after = _split(counts, sums, k)
+            if after >= before * _LATENCY_FACTOR and after - before >= _LATENCY_FLOOR_S:
+                found.append(Changepoint(users, round((k + 1) * TICK_SECONDS, 1),
+                                         "latency", before, after, stat))
+    return min(found, key=lambda c: c.offset_s) if found else None
+
+
+def onset_changepoint(stages: list[StageResult], onset: StageResult, *,
+                      error_threshold: float = 0.02) -> Changepoint | None:
+    """Where degradation began: a shift inside the level before onset (the cliff
+    started early but didn't sink the whole level) or else inside the onset
+    level itself."""
+    idx = stages.index(onset)
+    for stage in stages[max(0, idx - 1):idx + 1]:
+        if stage.ticks:
+            cp = detect(stage.ticks, users=stage.users, error_threshold=error_threshold)
+            if cp is not None:
+                return cp
+    return None
+
+
+def changepoint_block(cp: Changepoint) -> dict:
+    """The `verdict.changepoint` block."""
+    digits = 4 if cp.metric == "errors" else 1
+    scale = 1 if cp.metric == "errors" else 1000  # latency in ms
+    return {
+        "users": cp.users,
+        "offset_s": cp.offset_s,
+        "metric": cp.metric,
+        "before": round(cp.before * scale, digits),
+        "after": round(cp.after * scale, digits),
+        "statistic": round(cp.statistic, 2),
+    }
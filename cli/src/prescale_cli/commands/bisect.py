@@ -0,0 +1,172 @@
+"""`prescale bisect` - find the commit that cost capacity, one short probe at a time."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from urllib.parse import urlparse
+
+import click
+from rich.console import Console
+
+from prescale_cli.bisection import (
+    BisectError,
+    commits_between,
+    first_bad,
+    resolve,
+    server,
+    short,
+    subject,
+    worktree,
+)
+from prescale_cli.loadtest import LoadError, analyze, build_targets, run_loadtest
+from prescale_cli.result import build_result, list_results, write_result
+
+console = Console(stderr=True)  # progress; stdout stays clean for --json
+
+_LOCAL_HOSTS = {"localhost", "127.0.0.1", "0.0.0.0", "::1"}
+
+
+@click.command()
+@click.argument("url")
+@click.option("--good", "good", required=True, metavar="REV",
+              help="A commit that held the load.")
+@click.option("--bad", "bad", default="HEAD", show_default=True, metavar="REV",
+              help="A commit that doesn't.")
+@click.option("--start", "start", required=True, metavar="CMD",
+              help="Shell command that boots the server, run in each checkout.")
+@click.option("--path", "paths", multiple=True,
+              help="Extra route to test, relative to URL (repeatable).")
+@click.option("--users", "-u", "users", default=None, type=click.IntRange(min=1),
+              help="Load level to probe (default: what the --good commit survived "
+                   "in its saved run).")
+@click.option("--stage-seconds", "-s", default=10.0, show_default=True, type=float,
+              help="Seconds to hold the probe level on each commit.")
+@click.option("--latency-wall", default=2.0, show_default=True, type=float,
+              help="p95 seconds treated as broken.")
+@click.option("--error-threshold", default=0.02, show_default=True, type=float,
+              help="Error rate treated as broken.")
+@click.option("--method", default="GET", show_default=True, help="HTTP method.")
+@click.option("--timeout", default=10.0, show_default=True, type=float,
+              help="Per-request timeout in seconds.")
+@click.option("--boot-timeout", default=60.0, show_default=True, type=float,
+              help="Seconds to wait for the server to answer after --start.")
+@click.option("--no-warmup", "warmup", is_flag=True, flag_value=False, default=True,
+              help="Skip the warm-up requests before each probe.")
+@click.option("--json", "as_json", is_flag=True, help="Emit the outcome as JSON.")
+@click.option("--store", "store", type=click.Path(file_okay=False), default=None,
+              help="Directory for saved runs (default: ./.prescale).")
+@click.option("--no-save", "no_save", is_flag=True,
+              help="Don't save each probe to .prescale/runs/.")
+def bisect(url: str, good: str, bad: str, start: str, paths: tuple[str, ...],
+           users: int | None, stage_seconds: float, latency_wall: float,
+           error_threshold: float, method: str, timeout: float, boot_timeout: float,
+           warmup: bool, as_json: bool, store: str | None, no_save: bool) -> None:
+    """Find the first commit that breaks at a load level an older commit held.
+
+    Each probe checks a commit out into a temporary git worktree, boots it
+    with --start, and holds one load level for --stage-seconds instead of
+    running a full ramp. Run it from inside the repository; URL must be local.
+
+    \b
+    Examples:
+        prescale bisect --good v1.4.0 --start "make serve" http://localhost:8000
+        prescale bisect --good 3f2a1c9 --bad main -u 150 \\
+            --start "uvicorn app:app --port 8000" http://localhost:8000
+    """
+    parsed = urlparse(url)
+    if not parsed.scheme or not parsed.netloc:
+        console.print(f"[red]Error:[/red] '{url}' doesn't look like a URL "
+                      "(expected e.g. http://localhost:8000).")
+        raise SystemExit(1)
+    host = (parsed.hostname or "").lower()
+    if host not in _LOCAL_HOSTS:
+        console.print(f"[red]Error:[/red] bisect boots each commit locally; '{host}' "
+                      "isn't a local host.")
+        raise SystemExit(1)
+
+    try:
+        commits = commits_between(good, bad)
+        good_sha = resolve(good)
+    except BisectError as exc:
+        console.print(f"[red]Error:[/red] {exc}")
+        raise SystemExit(1)
+    if users is None:
+        users = _held_level(good_sha, store)
+        if users is None:
+            console.print(f"[red]Error:[/red] no saved run of {good} to take the load "
+                          "level from — pass --users N.")
+            raise SystemExit(1)
+
+    targets = build_targets(url, paths)
+    probes: list[dict] = []
+
+    def probe(sha: str) -> bool:
+        label = short(sha)
+        console.print(f"[dim]probing {label} at {users} users…[/dim]")
+        with worktree(sha) as checkout, server(start, cwd=checkout, url=url,
+                                              boot_timeout=boot_timeout):
+            stages, warning = asyncio.run(run_loadtest(
+                targets, levels=[users], stage_seconds=stage_seconds, method=method,
+                timeout=timeout, warmup=warmup))
+        report = analyze(stages, latency_wall=latency_wall,
+                         error_threshold=error_threshold)
+        failed = report.onset_users is not None
+        config = {
+            "method": method,
+            "max_users": users,
+            "stage_seconds": stage_seconds,
+            "latency_wall_s": latency_wall,
+            "error_threshold": error_threshold,
+            "max_rps": None,
+            "warmup": warmup,
+            "bisect": {"good": good_sha, "bad": commits[-1], "commit": sha},
+        }
+        result = build_result(report, url=url, targets=targets, config=config,
+                              warning=warning)
+        result["environment"] = {"git_commit": label, "git_branch": None}
+        if not no_save:
+            write_result(result, store=store)
+        probes.append({"commit": sha, "bad": failed, "result_id": result["id"],
+                       "onset_reason": report.onset_reason})
+        verdict = (f"[red]bad[/red] ({report.onset_reason})" if failed
+                   else "[green]good[/green]")
+        console.print(f"  {label}  {verdict}")
+        return failed
+
+    steps = (len(commits) - 1).bit_length()
+    console.print(f"Bisecting {len(commits)} commits at {users} users "
+                  f"(~{steps + 2} probes).")
+    try:
+        if not probe(commits[-1]):
+            _fail(f"{bad} holds {users} users in a {stage_seconds:g}s probe — try a "
+                  "higher --users or a longer --stage-seconds.")
+        if probe(good_sha):
+            _fail(f"{good} already breaks at {users} users in a {stage_seconds:g}s "
+                  "probe — try a lower --users.")
+        culprit = first_bad(commits, probe)
+    except (BisectError, LoadError) as exc:
+        _fail(str(exc))
+
+    if as_json:
+        click.echo(json.dumps({"first_bad": culprit, "users": users, "probes": probes},
+                              indent=2))
+        return
+    console.print(f"\nFirst bad commit: [bold]{short(culprit)}[/bold] {subject(culprit)}")
+    console.print(f"[dim]breaks at {users} users; its parent holds. "
+                  f"{len(probes)} probes"
+                  f"{'' if no_save else ' saved — see `prescale history`'}.[/dim]")
+
+
+def _held_level(good_sha: str, store: str | None) -> int | None:
+    """Users the newest saved run of `good_sha` survived."""
+    for row in list_results(store=store):
+        commit = row.get("commit")
+        if commit and good_sha.startswith(commit) and row.get("survives_users"):
+            return row["survives_users"]
+    return None
+
+
+def _fail(message: str):
+    console.print(f"[red]Error:[/red] {message}")
+    raise SystemExit(1)
@@ -9,7 +9,15 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from prescale_cli.compare import compare_results, resolve, to_markdown
+from prescale_cli.compare import (
+    compare_history,
+    compare_results,
+    history_baseline,
+    parse_history,
+    resolve,
+    route_change,
+    to_markdown,
+)
 from prescale_cli.result import AmbiguousResultError, ResultNotFoundError
 
 console = Console()
@@ -20,18 +28,22 @@ err = Console(stderr=True)
 @click.argument("new", required=False)
 @click.argument("old", required=False)
 @click.option("--baseline", default=None,
-              help="Result id or .json path to compare against (used as OLD).")
+              help="Result id or .json path to compare against (used as OLD), or "
+                   "history:N for the spread of the last N comparable runs.")
 @click.option("--regression-threshold", default=0.2, type=float,
               help="Fractional drop in survives_users that counts as a regression.")
 @click.option("--fail-on-regression", "fail_on_regression", is_flag=True,
               help="Exit non-zero if capacity regressed.")
+@click.option("--fail-on-route-regression", "fail_on_routes", is_flag=True,
+              help="Also exit non-zero if any route's p95 or error rate regressed at a "
+                   "level both runs tested.")
 @click.option("--json", "as_json", is_flag=True, help="Emit the comparison as JSON.")
 @click.option("--markdown", "as_md", is_flag=True,
               help="Emit a PR-comment-ready markdown block.")
 @click.option("--store", default=None, type=click.Path(file_okay=False),
               help="Directory holding saved runs (default: ./.prescale).")
 def compare(new: str | None, old: str | None, baseline: str | None,
-            regression_threshold: float, fail_on_regression: bool,
+            regression_threshold: float, fail_on_regression: bool, fail_on_routes: bool,
             as_json: bool, as_md: bool, store: str | None) -> None:
     """Compare two saved runs by capacity. Defaults to the latest two.
 
@@ -40,13 +52,27 @@ def compare(new: str | None, old: str | None, baseline: str | None,
         prescale compare
         prescale compare <new-id> <old-id>
         prescale compare --baseline prescale-baseline.json --fail-on-regression
+        prescale compare --baseline history:10 --fail-on-regression
     """
+    try:
+        history_n = parse_history(baseline)
+    except ValueError:
+        err.print("[red]Error:[/red] --baseline history:N needs a whole number N >= 1.")
+        raise SystemExit(1)
     try:
         new_r = resolve(new, store=store)
         if new_r is None:
             err.print("[red]Error:[/red] no saved runs to compare.")
             raise SystemExit(1)
-        old_r = resolve(baseline or old, store=store, exclude=new_r["id"])
+        if history_n is not None:
+            runs = history_baseline(new_r, history_n, store=store)
+            if not runs:
+                err.print("[red]Error:[/red] no earlier runs with the same target, "
+                          "routes and load settings to build a baseline from.")
+                raise SystemExit(1)
+            old_r = runs[0]
+        else:
+            old_r = resolve(baseline or old, store=store, exclude=new_r["id"])
     except (ResultNotFoundError, AmbiguousResultError) as exc:
         err.print(f"[red]Error:[/red] {exc}")
         raise SystemExit(1)
@@ -54,7 +80,10 @@ def compare(new: str | None, old: str | None, baseline: str | None,
         err.print("[red]Error:[/red] need a second run (or --baseline) to compare against.")
         raise SystemExit(1)
 
-    cmp = compare_results(old_r, new_r, threshold=regression_threshold)
+    if history_n is not None and len(runs) > 1:
+        cmp = compare_history(runs, new_r, threshold=regression_threshold)
+    else:
+        cmp = compare_results(old_r, new_r, threshold=regression_threshold)
 
     if as_json:
         click.echo(json.dumps(cmp, indent=2))
@@ -66,6 +95,13 @@ def compare(new: str | None, old: str | None, baseline: str | None,
     if fail_on_regression and cmp["regressed"]:
         err.print(f"[red]✗ regression:[/red] {cmp['summary']}")
         raise SystemExit(1)
+    routes = cmp["route_regressions"]
+    if fail_on_routes and routes:
+        worst = routes[0]
+        err.print(f"[red]✗ route regression:[/red] {worst['route']} at {worst['users']} "
+                  f"users (p95 {route_change(worst, 'p95_ms')})"
+                  + (f" and {len(routes) - 1} more" if len(routes) > 1 else ""))
+        raise SystemExit(1)
 
 
 def _render(cmp: dict) -> None:
@@ -82,10 +118,33 @@ def _render(cmp: dict) -> None:
     table.add_column("Peak req/s", justify="right")
     table.add_column("Commit")
     table.add_column("When")
-    for label, f in (("old", o), ("new", n)):
-        table.add_row(label, str(f["survives_users"]), f"{f['peak_rps']:.0f}",
+    base = cmp.get("baseline")
+    old_label = f"baseline ({len(base['runs'])} runs)" if base else "old"
+    for label, f in ((old_label, o), ("new", n)):
+        survives = str(f["survives_users"])
+        if base and f is o:
+            survives += f" ± {base['sd']:g}"
+        table.add_row(label, survives, f"{f['peak_rps']:.0f}",
                       f["commit"] or "-", f["created_at"] or "-")
     console.print(table)
     note = "" if (cmp["confident"] or not cmp["regressed"]) else \
         "  (confidence bands overlap — could be noise)"
+    if base and base["low"] is not None:
+        odds = (f" (p = {base['p_value']:.3f} of a run this low)"
+                if cmp["survives_delta"] < 0 else "")
+        console.print(f"[dim]Baseline: last {len(base['runs'])} comparable runs, 90% "
+                      f"range {base['low']}–{base['high']} users{odds}.[/dim]")
+    routes = cmp.get("route_regressions") or []
+    if routes:
+        rt = Table(show_header=True, header_style="bold magenta",
+                   title=f"Routes that regressed ({len(routes)})")
+        rt.add_column("Route")
+        rt.add_column("Users", justify="right")
+        rt.add_column("p95", justify="right")
+        rt.add_column("p99", justify="right")
+        rt.add_column("Errors", justify="right")
+        for r in routes:
+            rt.add_row(r["route"], str(r["users"]), route_change(r, "p95_ms"),
+                       route_change(r, "p99_ms"), route_change(r, "error_rate"))
+        console.print(rt)
     console.print(Panel(cmp["summary"] + note, border_style=color))
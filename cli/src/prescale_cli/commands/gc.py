@@ -0,0 +1,65 @@
+"""`prescale gc` - apply retention to .prescale/runs/ and compact old runs."""
+
+from __future__ import annotations
+
+import json
+
+import click
+from rich.console import Console
+
+from prescale_cli.result import compact_results, list_results
+from prescale_cli.retention import RetentionPolicy, plan_gc
+
+console = Console()
+
+
+@click.command()
+@click.option("--keep-last", "keep_last", default=20, show_default=True,
+              type=click.IntRange(min=0),
+              help="Always keep the newest N runs per host and branch whole.")
+@click.option("--daily-after", "daily_after", default=30, show_default=True,
+              type=click.IntRange(min=0), metavar="DAYS",
+              help="Past DAYS old, keep only the newest run of each day.")
+@click.option("--compact-after", "compact_after", default=90, show_default=True,
+              type=click.IntRange(min=0), metavar="DAYS",
+              help="Past DAYS old, keep the verdict but drop per-stage data.")
+@click.option("--dry-run", "dry_run", is_flag=True,
+              help="Show what would be dropped or compacted; change nothing.")
+@click.option("--json", "as_json", is_flag=True, help="Emit the plan as JSON.")
+@click.option("--store", "store", type=click.Path(file_okay=False), default=None,
+              help="Directory holding saved runs (default: ./.prescale).")
+def gc(keep_last: int, daily_after: int, compact_after: int, dry_run: bool,
+       as_json: bool, store: str | None) -> None:
+    """Prune and compact saved runs.
+
+    Compacted runs move into .prescale/rollup.jsonl: `history`, `show` and
+    `compare` still see their verdicts, just not their per-level tables.
+
+    \b
+    Examples:
+        prescale gc --dry-run
+        prescale gc --keep-last 50 --compact-after 60
+    """
+    policy = RetentionPolicy(keep_last=keep_last, daily_after_days=daily_after,
+                             compact_after_days=compact_after)
+    plan = plan_gc(list_results(store=store), policy)
+    if not dry_run and not plan.empty:
+        compact_results(drop=set(plan.drop), compact=set(plan.compact), store=store)
+
+    if as_json:
+        click.echo(json.dumps({"dry_run": dry_run, "keep": plan.keep,
+                               "compact": plan.compact, "drop": plan.drop}, indent=2))
+        return
+    if plan.empty:
+        console.print(f"[dim]Nothing to do — {len(plan.keep)} saved runs all within "
+                      "the retention policy.[/dim]")
+        return
+    verb = "Would" if dry_run else "Did"
+    console.print(f"{verb} drop [bold]{len(plan.drop)}[/bold], compact "
+                  f"[bold]{len(plan.compact)}[/bold], keep [bold]{len(plan.keep)}[/bold] "
+                  "saved runs.")
+    if dry_run:
+        for run_id in plan.drop:
+            console.print(f"  [red]drop[/red]     {run_id}")
+        for run_id in plan.compact:
+            console.print(f"  [yellow]compact[/yellow]  {run_id}")
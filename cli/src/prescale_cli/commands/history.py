@@ -9,7 +9,7 @@ import click
 from rich.console import Console
 from rich.table import Table
 
-from prescale_cli.result import list_results
+from prescale_cli.result import list_results, rebuild_index
 
 console = Console()
 
@@ -17,17 +17,27 @@ console = Console()
 @click.command()
 @click.option("-n", "limit", default=20, type=int, help="Max runs to show (0 = all).")
 @click.option("--json", "as_json", is_flag=True, help="Emit the run list as JSON.")
+@click.option("--host", default=None, help="Only runs against this host.")
+@click.option("--branch", default=None, help="Only runs recorded on this git branch.")
+@click.option("--since", default=None, metavar="DATE",
+              help="Only runs on or after DATE (e.g. 2026-06 or 2026-06-28).")
+@click.option("--reindex", is_flag=True,
+              help="Rebuild the run index from the saved files first.")
 @click.option("--store", "store", type=click.Path(file_okay=False), default=None,
               help="Directory holding saved runs (default: ./.prescale).")
-def history(limit: int, as_json: bool, store: str | None) -> None:
+def history(limit: int, as_json: bool, host: str | None, branch: str | None,
+            since: str | None, reindex: bool, store: str | None) -> None:
     """List saved runs, newest first.
 
     \b
     Examples:
         prescale history
         prescale history -n 5 --json
+        prescale history --branch main --since 2026-06
     """
-    runs = list_results(store=store)
+    if reindex:
+        rebuild_index(store=store)
+    runs = list_results(store=store, host=host, branch=branch, since=since)
     shown = runs[:limit] if limit and limit > 0 else runs
 
     if as_json:
@@ -53,12 +63,17 @@ def history(limit: int, as_json: bool, store: str | None) -> None:
 
 
 def _verdict(r: dict) -> str:
+    text = _outcome(r)
+    return f"{text} [dim]· compacted[/dim]" if r.get("compacted") else text
+
+
+def _outcome(r: dict) -> str:
     onset = r.get("onset_users")
     survives = r.get("survives_users")
     if onset is None:
         return (f"[green]held up[/green] (≥{survives})" if survives is not None
                 else "[green]held up[/green]")
-    reason = "latency" if r.get("onset_reason") == "latency" else "errors"
+    reason = r.get("onset_reason") or "errors"
     color = "red" if survives == 0 else "yellow"
     return f"[{color}]survives ~{survives}[/{color}] · breaks {onset} ({reason})"
 
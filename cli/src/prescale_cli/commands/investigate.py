@@ -10,12 +10,13 @@ import click
 from rich.console import Console
 from rich.panel import Panel
 
+from prescale_cli.events import EventStream
 from prescale_cli.investigate import _LATENCY_WALL_S
 from prescale_cli.investigate import investigate as run_investigate
 from prescale_cli.live import LiveRamp
 from prescale_cli.loadtest import LoadError
 from prescale_cli.render import render_investigation, render_terminal
-from prescale_cli.result import latest_id, load_result
+from prescale_cli.result import latest_id, load_header
 
 console = Console()
 
@@ -33,13 +34,17 @@ _LOCAL_HOSTS = {"localhost", "127.0.0.1", "0.0.0.0", "::1"}
 @click.option("--i-own-this", "yes", is_flag=True,
               help="Skip the confirmation prompt for non-local targets.")
 @click.option("--json", "as_json", is_flag=True, help="Emit the full Result as JSON.")
+@click.option("--events", "events", default=None, type=click.Choice(["ndjson"]),
+              help="Stream progress to stdout as it happens: one JSON event per "
+                   "stage, per probe and the final verdict.")
 @click.option("--store", "store", type=click.Path(file_okay=False), default=None,
               help="Directory for saved runs (default: ./.prescale).")
 @click.option("--fail-under", "fail_under", default=None, type=int,
               help="Exit non-zero if it survives fewer than N users (a CI gate).")
 def investigate(url: str | None, paths: tuple[str, ...], max_users: int,
                 stage_seconds: float, max_rps: float | None, yes: bool,
-                as_json: bool, store: str | None, fail_under: int | None) -> None:
+                as_json: bool, events: str | None, store: str | None,
+                fail_under: int | None) -> None:
     """Find what breaks first, then probe it to explain WHY - and how to fix it.
 
     With no URL, re-investigates the latest saved run's target.
@@ -50,14 +55,21 @@ def investigate(url: str | None, paths: tuple[str, ...], max_users: int,
         prescale investigate https://staging.myapp.com --i-own-this
         prescale investigate            # re-investigate the latest saved run
     """
+    if as_json and events:
+        console.print("[red]Error:[/red] --json and --events both write to stdout; "
+                      "pick one.")
+        raise SystemExit(1)
+    machine = as_json or events is not None
+
     if url is None:
         last = latest_id(store=store)
         if last is None:
             console.print("[dim]No saved runs yet — try "
                           "[bold]prescale investigate <url>[/bold].[/dim]")
             raise SystemExit(0)
-        url = load_result(last, store=store)["target"]["url"]
-        console.print(f"[dim]Re-investigating latest run: {url}[/dim]")
+        url = load_header(last, store=store)["target"]["url"]
+        if not machine:
+            console.print(f"[dim]Re-investigating latest run: {url}[/dim]")
 
     parsed = urlparse(url)
     if not parsed.scheme or not parsed.netloc:
@@ -67,9 +79,10 @@ def investigate(url: str | None, paths: tuple[str, ...], max_users: int,
 
     host = (parsed.hostname or "").lower()
     if host not in _LOCAL_HOSTS and not yes:
-        if as_json:
+        if machine:
             console.print(f"[red]Error:[/red] refusing non-local host '{host}' in "
-                          "--json mode without --i-own-this.")
+                          f"{'--json' if as_json else '--events'} mode without "
+                          "--i-own-this.")
             raise SystemExit(1)
         console.print(Panel(
             f"investigate sends real traffic to [bold]{host}[/bold] (a ramp plus a few "
@@ -78,7 +91,8 @@ def investigate(url: str | None, paths: tuple[str, ...], max_users: int,
         if not click.confirm("Proceed?", default=False):
             raise SystemExit(0)
 
-    live_mode = console.is_terminal and not as_json
+    live_mode = console.is_terminal and not machine
+    stream = EventStream() if events else None
     try:
         if live_mode:
             with LiveRamp(console, latency_wall=_LATENCY_WALL_S) as live:
@@ -86,16 +100,28 @@ def investigate(url: str | None, paths: tuple[str, ...], max_users: int,
                     url, max_users=max_users, paths=paths, stage_seconds=stage_seconds,
                     max_rps=max_rps, store=store,
                     progress_cb=live.starting, on_stage=live.finished,
+                    on_live=live.streaming,
                     on_probe=live.diagnosing))
+        elif stream is not None:
+            result = asyncio.run(run_investigate(
+                url, max_users=max_users, paths=paths, stage_seconds=stage_seconds,
+                max_rps=max_rps, store=store,
+                progress_cb=stream.starting, on_stage=stream.finished,
+                on_probe=stream.probing))
         else:
             result = asyncio.run(run_investigate(
                 url, max_users=max_users, paths=paths, stage_seconds=stage_seconds,
                 max_rps=max_rps, store=store))
     except LoadError as exc:
-        console.print(f"[red]Error:[/red] {exc}")
+        if stream is not None:
+            stream.emit("error", message=str(exc))
+        else:
+            console.print(f"[red]Error:[/red] {exc}")
         raise SystemExit(1)
 
-    if as_json:
+    if stream is not None:
+        stream.verdict(result)
+    elif as_json:
         click.echo(json.dumps(result, indent=2))
     else:
         render_terminal(result, show_ramp=not live_mode)
@@ -18,4 +18,4 @@ def profiles() -> None:
     for p in PROFILES.values():
         console.print(f"  [bold]{p.name}[/bold]")
         console.print(f"    {p.label} — peaks ~{p.peak_users} users, "
-                      f"{p.think_time_s:g}s think-time")
+                      f"{p.think_time_s:g}s {p.think_dist} think-time")
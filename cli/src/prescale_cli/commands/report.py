@@ -0,0 +1,58 @@
+"""`prescale report` - overlay several saved runs in one HTML report."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+from rich.console import Console
+
+from prescale_cli.overlay import build_overlay, render_overlay_html, select_runs
+from prescale_cli.result import ResultError
+
+console = Console()
+
+
+@click.command()
+@click.option("--runs", "runs", multiple=True, required=True, metavar="IDS|history:N",
+              help="Runs to overlay: ids or unique prefixes (space- or comma-separated, "
+                   "or repeat the option), or history:N for the newest N saved runs.")
+@click.argument("more_runs", nargs=-1, metavar="")
+@click.option("--host", default=None, help="history:N: only runs against this host.")
+@click.option("--branch", default=None, help="history:N: only runs on this git branch.")
+@click.option("--html", "html_path", type=click.Path(dir_okay=False),
+              default="prescale-report.html", show_default=True,
+              help="Where to write the report.")
+@click.option("--store", default=None, type=click.Path(file_okay=False),
+              help="Directory holding saved runs (default: ./.prescale).")
+def report(runs: tuple[str, ...], more_runs: tuple[str, ...], host: str | None,
+           branch: str | None, html_path: str, store: str | None) -> None:
+    """Overlay saved runs: capacity over commits, p95 per level, route deltas.
+
+    \b
+    Examples:
+        prescale report --runs history:20
+        prescale report --runs history:50 --branch main --html trend.html
+        prescale report --runs 20260628T1736 20260701T0912 20260702T1104
+    """
+    operands = [op for arg in (*runs, *more_runs) for op in arg.split(",") if op]
+    try:
+        ids = select_runs(operands, store=store, host=host, branch=branch)
+    except ValueError:
+        console.print("[red]Error:[/red] history:N needs a whole number N >= 1.")
+        raise SystemExit(1)
+    except ResultError as exc:
+        console.print(f"[red]Error:[/red] {exc}")
+        raise SystemExit(1)
+    if len(ids) < 2:
+        console.print(f"[red]Error:[/red] an overlay needs at least two runs; found "
+                      f"{len(ids)}.")
+        raise SystemExit(1)
+
+    overlay = build_overlay(ids, store=store)
+    Path(html_path).write_text(render_overlay_html(overlay), encoding="utf-8")
+    first, last = overlay.runs[0].facts, overlay.runs[-1].facts
+    console.print(f"Survives {first['survives_users']} → {last['survives_users']} users "
+                  f"across {len(ids)} runs; {len(overlay.route_deltas)} route regression"
+                  f"{'s' if len(overlay.route_deltas) != 1 else ''} oldest → newest.")
+    console.print(f"[green]✓[/green] Overlay report written to [cyan]{html_path}[/cyan]")
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import random
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -15,41 +16,76 @@ import click
 from rich.console import Console
 from rich.panel import Panel
 
+from prescale_cli.events import EventStream
 from prescale_cli.live import LiveRamp
 from prescale_cli.loadtest import (
+    THINK_DISTRIBUTIONS,
     LoadError,
     analyze,
+    analyze_spike,
     build_targets,
     check_robots,
     default_levels,
     discover_sitemap,
     route_label,
     run_loadtest,
+    run_spike,
+    unsettled_levels,
 )
 from prescale_cli.profiles import PROFILES, lookup, scenario_block
 from prescale_cli.render import render_terminal
 from prescale_cli.report import render_html
 from prescale_cli.result import build_result, write_result
+from prescale_cli.slo import DEFAULT_FILE as DEFAULT_SLO_FILE
+from prescale_cli.slo import RouteSLO, SloError, load_slos
+from prescale_cli.soak import (
+    analyze_soak,
+    annotate_timeline,
+    parse_duration,
+    run_soak,
+    soak_block,
+    window_stages,
+)
 
 console = Console()
 
 _LOCAL_HOSTS = {"localhost", "127.0.0.1", "0.0.0.0", "::1"}
 
 
+class _RepeatType(click.ParamType):
+    """A positive repeat count, or 'auto'."""
+
+    name = "N|auto"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, int) or str(value).lower() == "auto":
+            return value if isinstance(value, int) else "auto"
+        try:
+            count = int(value)
+        except ValueError:
+            self.fail(f"{value!r} is not a count or 'auto'.", param, ctx)
+        if count < 1:
+            self.fail("must be at least 1.", param, ctx)
+        return count
+
+
 @click.command()
 @click.argument("url")
 @click.option("--path", "paths", multiple=True,
               help="Extra route to test, relative to URL (repeatable). e.g. --path /api/search")
 @click.option("--from-sitemap", "from_sitemap", is_flag=True,
               help="Also pull GET routes from the site's sitemap.xml.")
-@click.option("--max-users", "-u", default=200, type=int,
-              help="Peak virtual users to ramp to.")
+@click.option("--max-users", "--users", "-u", "max_users", default=200, type=int,
+              help="Peak virtual users to ramp to (the held level for --soak).")
 @click.option("--stage-seconds", "-s", default=5.0, type=float,
               help="Seconds to hold each load level.")
 @click.option("--latency-wall", default=2.0, type=float,
               help="p95 latency (seconds) treated as the failure threshold.")
 @click.option("--error-threshold", default=0.02, type=float,
               help="Error rate (0-1) treated as the failure threshold.")
+@click.option("--slo", "slo_path", type=click.Path(dir_okay=False), default=None,
+              help="Per-route SLO file (default: ./prescale.yaml if present). Onset is "
+                   "the first level where any route breaks its own SLO.")
 @click.option("--method", "-m", default="GET",
               help="HTTP method to fire.")
 @click.option("--timeout", default=10.0, type=float,
@@ -58,32 +94,81 @@ _LOCAL_HOSTS = {"localhost", "127.0.0.1", "0.0.0.0", "::1"}
               help="Cap aggregate requests/sec (default: unlimited). A safety ceiling.")
 @click.option("--warmup/--no-warmup", "warmup", default=True,
               help="Run a brief warmup before measuring (default: on).")
-@click.option("--repeat", default=1, type=int,
-              help="Run the whole ramp N times and pool results (default: 1).")
+@click.option("--repeat", default="1", type=_RepeatType(),
+              help="Run the whole ramp N times and pool results (default: 1), or "
+                   "'auto' to re-sample only the levels near the cliff until the "
+                   "band is stable.")
+@click.option("--repeat-budget", "repeat_budget", default=120.0, type=float,
+              help="--repeat auto: at most this many extra seconds of re-sampling "
+                   "(default: 120).")
+@click.option("--bootstrap", default=0, type=click.IntRange(min=0), metavar="N",
+              help="Put the survives band on N bootstrap resamples instead of the "
+                   "analytic bounds (e.g. 10000; default: off).")
 @click.option("--think-time", "think_time", default=0.0, type=float,
               help="Seconds each virtual user pauses between requests (default: 0).")
+@click.option("--think-dist", "think_dist", default=None,
+              type=click.Choice(THINK_DISTRIBUTIONS, case_sensitive=False),
+              help="Think-time shape around --think-time as the mean (default: fixed, "
+                   "or the --profile's). Stochastic shapes also stagger each user's start.")
+@click.option("--seed", default=None, type=int,
+              help="Seed for stochastic think-times, to reproduce a run exactly.")
+@click.option("--shape", default="ramp", type=click.Choice(["ramp", "spike"]),
+              help="Load shape: step up a ladder (ramp) or jump from a baseline to "
+                   "--max-users and back (spike). Default: ramp.")
+@click.option("--spike-seconds", default=30.0, type=float,
+              help="Spike mode: seconds to hold the peak (default: 30).")
+@click.option("--baseline-users", default=None, type=int,
+              help="Spike mode: users before and after the spike (default: 10%% of peak).")
+@click.option("--recover-seconds", default=30.0, type=float,
+              help="Spike mode: seconds back at baseline to watch it recover (default: 30).")
+@click.option("--recovery-tolerance", default=0.2, type=float,
+              help="Spike mode: recovered once p95 and error rate are back within this "
+                   "fraction of baseline (default: 0.2).")
+@click.option("--soak", "soak", default=None, metavar="DURATION",
+              help="Hold --users for DURATION (e.g. 2h, 90m) and test for latency / "
+                   "error drift, in bounded memory.")
+@click.option("--soak-window", "soak_window", default=60.0, type=float,
+              help="Soak: seconds per stats window (default: 60).")
+@click.option("--watch-pid", "watch_pid", default=None, type=int,
+              help="Soak: sample this local PID's RSS and open FDs to spot leaks.")
 @click.option("--ignore-robots", "ignore_robots", is_flag=True,
               help="Skip the robots.txt courtesy check.")
 @click.option("--i-own-this", "yes", is_flag=True,
               help="Skip the confirmation prompt for non-local targets.")
 @click.option("--json", "as_json", is_flag=True,
               help="Emit the raw report as JSON.")
+@click.option("--events", "events", default=None, type=click.Choice(["ndjson"]),
+              help="Stream progress to stdout as it happens: one JSON event per "
+                   "stage start, stage end and the final verdict.")
+@click.option("--metrics-port", "metrics_port", default=None,
+              type=click.IntRange(1, 65535), metavar="PORT",
+              help="Serve live OpenMetrics at http://HOST:PORT/metrics while the run "
+                   "goes, for Prometheus / Grafana.")
+@click.option("--metrics-host", "metrics_host", default="127.0.0.1", show_default=True,
+              help="Interface for --metrics-port (0.0.0.0 to let another box scrape).")
 @click.option("--html", "html_path", type=click.Path(dir_okay=False), default=None,
               help="Write a shareable HTML report to PATH.")
 @click.option("--store", "store", type=click.Path(file_okay=False), default=None,
               help="Directory for saved runs (default: ./.prescale).")
 @click.option("--no-save", "no_save", is_flag=True,
               help="Don't save this run to .prescale/runs/.")
+@click.option("--compress", "compress", is_flag=True,
+              help="Save the run gzip-compressed, verdict first (.json.gz).")
 @click.option("--fail-under", "fail_under", default=None, type=int,
               help="Exit non-zero if it survives fewer than N users (a CI gate).")
 @click.option("--profile", "profile_name", default=None,
               help="Frame the run as a launch scenario (see `prescale profiles`).")
 def run(url: str, paths: tuple[str, ...], from_sitemap: bool, max_users: int,
         stage_seconds: float, latency_wall: float, error_threshold: float,
-        method: str, timeout: float, max_rps: float | None, warmup: bool,
-        repeat: int, think_time: float,
-        ignore_robots: bool, yes: bool, as_json: bool, html_path: str | None,
-        store: str | None, no_save: bool, fail_under: int | None,
+        slo_path: str | None, method: str, timeout: float, max_rps: float | None,
+        warmup: bool, repeat: int | str, repeat_budget: float, bootstrap: int,
+        think_time: float, think_dist: str | None, seed: int | None,
+        shape: str, spike_seconds: float, baseline_users: int | None,
+        recover_seconds: float, recovery_tolerance: float, soak: str | None,
+        soak_window: float, watch_pid: int | None,
+        ignore_robots: bool, yes: bool, as_json: bool, events: str | None,
+        metrics_port: int | None, metrics_host: str, html_path: str | None,
+        store: str | None, no_save: bool, compress: bool, fail_under: int | None,
         profile_name: str | None) -> None:
     """Load test URL and report what breaks first.
 
@@ -93,6 +178,9 @@ def run(url: str, paths: tuple[str, ...], from_sitemap: bool, max_users: int,
         prescale run https://staging.myapp.com --path /api/search --path /pricing
         prescale run https://staging.myapp.com --from-sitemap -u 500 --i-own-this
         prescale run https://staging.myapp.com --i-own-this --html report.html
+        prescale run http://localhost:8000 --shape spike -u 300 --spike-seconds 20
+        prescale run http://localhost:8000 --soak 2h --users 150 --watch-pid 4242
+        prescale run http://localhost:8000 --soak 2h --metrics-port 9105
     """
     parsed = urlparse(url)
     if not parsed.scheme or not parsed.netloc:
@@ -100,6 +188,45 @@ def run(url: str, paths: tuple[str, ...], from_sitemap: bool, max_users: int,
                       "(expected e.g. http://localhost:8000).")
         raise SystemExit(1)
 
+    soak_seconds = None
+    if soak is not None:
+        if shape != "ramp":
+            console.print("[red]Error:[/red] --soak can't be combined with --shape.")
+            raise SystemExit(1)
+        if repeat != 1:
+            console.print("[red]Error:[/red] --soak holds one level for its whole "
+                          "duration; --repeat doesn't apply.")
+            raise SystemExit(1)
+        try:
+            soak_seconds = parse_duration(soak)
+        except ValueError as exc:
+            console.print(f"[red]Error:[/red] {exc}")
+            raise SystemExit(1)
+        shape = "soak"
+    if repeat != 1 and shape == "spike":
+        console.print("[red]Error:[/red] --repeat re-runs a ramp's levels; a spike runs "
+                      "once. Run it again and compare the two.")
+        raise SystemExit(1)
+    if metrics_port is not None and shape == "spike":
+        console.print("[red]Error:[/red] --metrics-port covers ramps and soaks; "
+                      "a spike is over too quickly to scrape.")
+        raise SystemExit(1)
+
+    slos = None
+    if slo_path is None and Path(DEFAULT_SLO_FILE).is_file():
+        slo_path = DEFAULT_SLO_FILE
+    if slo_path is not None:
+        try:
+            slos = load_slos(slo_path, fallback=RouteSLO(
+                p95_ms=latency_wall * 1000, error_budget=error_threshold))
+        except SloError as exc:
+            console.print(f"[red]Error:[/red] {exc}")
+            raise SystemExit(1)
+        if bootstrap:
+            console.print("[red]Error:[/red] --bootstrap applies to the global thresholds; "
+                          "it can't be combined with per-route SLOs yet.")
+            raise SystemExit(1)
+
     prof = lookup(profile_name) if profile_name else None
     if profile_name and prof is None:
         console.print(f"[red]Error:[/red] unknown profile '{profile_name}'. "
@@ -108,13 +235,24 @@ def run(url: str, paths: tuple[str, ...], from_sitemap: bool, max_users: int,
     if prof is not None:
         max_users = prof.peak_users
         think_time = prof.think_time_s
+        think_dist = think_dist or prof.think_dist  # an explicit --think-dist wins
+    think_dist = (think_dist or "fixed").lower()
+    if seed is None and think_dist != "fixed" and think_time > 0:
+        seed = random.SystemRandom().randrange(2**31)  # recorded so it can be replayed
+
+    if as_json and events:
+        console.print("[red]Error:[/red] --json and --events both write to stdout; "
+                      "pick one.")
+        raise SystemExit(1)
+    machine = as_json or events is not None  # stdout is for a program, not a person
 
     host = (parsed.hostname or "").lower()
     is_local = host in _LOCAL_HOSTS
     if not is_local and not yes:
-        if as_json:
+        if machine:
             console.print(f"[red]Error:[/red] refusing to load-test non-local host "
-                          f"'{host}' in --json mode without --i-own-this.")
+                          f"'{host}' in {'--json' if as_json else '--events'} mode "
+                          "without --i-own-this.")
             raise SystemExit(1)
         console.print(Panel(
             f"You're about to send real traffic to [bold]{host}[/bold] "
@@ -127,19 +265,19 @@ def run(url: str, paths: tuple[str, ...], from_sitemap: bool, max_users: int,
 
     extra: list[str] = []
     if from_sitemap:
-        if not as_json:
+        if not machine:
             console.print("[dim]Discovering routes from sitemap.xml…[/dim]")
         try:
             extra = asyncio.run(discover_sitemap(url, timeout=timeout))
         except Exception:  # discovery is best-effort; never block the run
             extra = []
-        if not as_json:
+        if not machine:
             found = f"{len(extra)} route(s) found" if extra else "none found"
             console.print(f"  [dim]sitemap: {found}[/dim]")
 
     targets = build_targets(url, paths=paths, extra=extra)
 
-    if not ignore_robots and not as_json:
+    if not ignore_robots and not machine:
         disallowed = asyncio.run(check_robots(targets, timeout=timeout))
         if disallowed:
             console.print(f"[yellow]⚠ robots.txt disallows {len(disallowed)} of these "
@@ -148,7 +286,7 @@ def run(url: str, paths: tuple[str, ...], from_sitemap: bool, max_users: int,
             for route in disallowed[:8]:
                 console.print(f"    [yellow]{route_label(route)}[/yellow]")
 
-    if not as_json:
+    if not machine:
         cap = f", capped at {max_rps:g} req/s" if max_rps else ""
         console.print(f"\n[bold]PreScale[/bold] — load testing [cyan]{url}[/cyan]  "
                       f"({len(targets)} route{'s' if len(targets) != 1 else ''}{cap})")
@@ -157,31 +295,82 @@ def run(url: str, paths: tuple[str, ...], from_sitemap: bool, max_users: int,
                 console.print(f"  [dim]{route_label(target)}[/dim]")
             if len(targets) > 12:
                 console.print(f"  [dim]… +{len(targets) - 12} more[/dim]")
+        if metrics_port is not None:
+            console.print(f"  [dim]metrics: http://{metrics_host}:{metrics_port}/metrics"
+                          "[/dim]")
 
     levels = default_levels(max_users)
+    if baseline_users is None:
+        baseline_users = max(1, max_users // 10)
+    spike_cfg = soak_cfg = None
+    if shape == "soak":
+        soak_cfg = {"duration_s": soak_seconds, "window_s": soak_window,
+                    "watch_pid": watch_pid}
+    if shape == "spike":
+        spike_cfg = {"baseline_users": baseline_users, "spike_seconds": spike_seconds,
+                     "recover_seconds": recover_seconds, "tolerance": recovery_tolerance}
+
+    def measure(progress_cb=None, on_stage=None, on_live=None):
+        common = dict(method=method, timeout=timeout, max_rps=max_rps, warmup=warmup,
+                      think_time=think_time, think_dist=think_dist, seed=seed,
+                      progress_cb=progress_cb, on_stage=on_stage)
+        metrics = dict(metrics_port=metrics_port, metrics_host=metrics_host)
+        if shape == "soak":
+            return run_soak(targets, users=max_users, duration=soak_seconds,
+                            window_seconds=soak_window, watch_pid=watch_pid,
+                            **metrics, **common)
+        if shape == "spike":
+            return run_spike(targets, baseline_users=baseline_users, spike_users=max_users,
+                             baseline_seconds=stage_seconds, spike_seconds=spike_seconds,
+                             recover_seconds=recover_seconds, **common)
+        if repeat == "auto":
+            def resample(pooled):
+                return unsettled_levels(pooled, latency_wall=latency_wall,
+                                        error_threshold=error_threshold, slos=slos)
+
+            return run_loadtest(targets, levels=levels, stage_seconds=stage_seconds,
+                                resample=resample, resample_budget=repeat_budget,
+                                on_live=on_live, **metrics, **common)
+        return run_loadtest(targets, levels=levels, stage_seconds=stage_seconds,
+                            repeat=repeat, on_live=on_live, **metrics, **common)
 
-    live_mode = console.is_terminal and not as_json
+    live_mode = console.is_terminal and not machine
+    stream = EventStream() if events else None
     try:
         if live_mode:
             with LiveRamp(console, latency_wall=latency_wall) as live:
-                stages, warning = asyncio.run(run_loadtest(
-                    targets, levels=levels, stage_seconds=stage_seconds,
-                    method=method, timeout=timeout, max_rps=max_rps, warmup=warmup,
-                    repeat=repeat, think_time=think_time,
-                    progress_cb=live.starting, on_stage=live.finished,
-                ))
+                outcome = asyncio.run(measure(live.starting, live.finished,
+                                              live.streaming))
+        elif stream is not None:
+            outcome = asyncio.run(measure(stream.starting, stream.finished))
         else:
-            stages, warning = asyncio.run(run_loadtest(
-                targets, levels=levels, stage_seconds=stage_seconds,
-                method=method, timeout=timeout, max_rps=max_rps, warmup=warmup,
-                repeat=repeat, think_time=think_time,
-            ))
+            outcome = asyncio.run(measure())
     except LoadError as exc:
-        console.print(f"[red]Error:[/red] {exc}")
+        if stream is not None:
+            stream.emit("error", message=str(exc))
+        else:
+            console.print(f"[red]Error:[/red] {exc}")
         raise SystemExit(1)
 
+    spike_run = soak_run = None
+    timeline = None
+    if shape == "spike":
+        spike_run, warning = outcome
+        stages = [spike_run.baseline, spike_run.spike]
+        timeline = spike_run.seconds
+    elif shape == "soak":
+        soak_run, warning = outcome
+        stages = [soak_run.stage]
+        timeline = window_stages(soak_run)
+    else:
+        stages, warning = outcome
+
     report = analyze(stages, latency_wall=latency_wall, error_threshold=error_threshold,
-                     rate_capped=max_rps is not None)
+                     rate_capped=max_rps is not None, think_time=think_time,
+                     bootstrap=bootstrap, seed=seed, slos=slos)
+    if spike_run is not None:
+        report.spike = analyze_spike(spike_run, tolerance=recovery_tolerance,
+                                     error_threshold=error_threshold)
 
     config = {
         "method": method,
@@ -192,19 +381,33 @@ def run(url: str, paths: tuple[str, ...], from_sitemap: bool, max_users: int,
         "max_rps": max_rps,
         "warmup": warmup,
         "repeat": repeat,
+        "repeat_budget_s": repeat_budget if repeat == "auto" else None,
+        "bootstrap": bootstrap,
         "think_time_s": think_time,
+        "think_dist": think_dist,
+        "seed": seed,
+        "slo_file": slo_path,
+        "shape": shape,
+        "spike": spike_cfg,
+        "soak": soak_cfg,
         "fail_under": fail_under,
         "profile": prof.name if prof else None,
     }
-    result = build_result(report, url=url, targets=targets, config=config, warning=warning)
+    result = build_result(report, url=url, targets=targets, config=config, warning=warning,
+                          timeline=timeline)
+    if soak_run is not None:
+        result["verdict"]["soak"] = soak_block(analyze_soak(soak_run))
+        annotate_timeline(result, soak_run)
     if prof is not None:
         result["profile"] = scenario_block(prof, report.survives_users)
-    saved_path = None if no_save else write_result(result, store=store)
+    saved_path = None if no_save else write_result(result, store=store, compress=compress)
 
     if html_path:
         Path(html_path).write_text(render_html(result), encoding="utf-8")
 
-    if as_json:
+    if stream is not None:
+        stream.verdict(result)
+    elif as_json:
         click.echo(json.dumps(result, indent=2))
     else:
         render_terminal(result, show_ramp=not live_mode)
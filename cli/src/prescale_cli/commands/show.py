@@ -29,10 +29,12 @@ console = Console()
 @click.option("--json", "as_json", is_flag=True, help="Emit the saved Result as JSON.")
 @click.option("--html", "html_path", type=click.Path(dir_okay=False), default=None,
               help="Re-render the saved run to an HTML report at PATH.")
+@click.option("--all-routes", "all_routes", is_flag=True,
+              help="List every route, not just the worst few.")
 @click.option("--store", "store", type=click.Path(file_okay=False), default=None,
               help="Directory holding saved runs (default: ./.prescale).")
 def show(run_id: str | None, as_json: bool, html_path: str | None,
-         store: str | None) -> None:
+         all_routes: bool, store: str | None) -> None:
     """Re-render a saved run (defaults to the latest).
 
     \b
@@ -40,6 +42,7 @@ def show(run_id: str | None, as_json: bool, html_path: str | None,
         prescale show
         prescale show 20260628T173648Z-3b836f
         prescale show --html report.html
+        prescale show --all-routes
     """
     if run_id is None:
         run_id = latest_id(store=store)
@@ -63,6 +66,6 @@ def show(run_id: str | None, as_json: bool, html_path: str | None,
 
     console.print(f"[dim]{result['id']}  ·  {result['target']['url']}  ·  "
                   f"{result['created_at']}[/dim]")
-    render_terminal(result)
+    render_terminal(result, all_routes=all_routes)
     if html_path:
         console.print(f"\n[green]✓[/green] HTML report written to [cyan]{html_path}[/cyan]")
@@ -1,14 +1,33 @@
 """Capacity comparison between two saved Results — the basis for `prescale compare`
-and regression gating in CI. Pure logic + operand resolution (no network)."""
+and regression gating in CI. Pure logic + operand resolution (no network).
+
+`--baseline history:N` compares against the spread of the last N comparable runs
+instead of one: a drop only counts when the new run falls outside the baseline's
+prediction interval, so one noisy baseline can't fail CI on its own.
+"""
 
 from __future__ import annotations
 
-from prescale_cli.result import list_results, load_result
+import math
+import statistics
+
+from prescale_cli.bootstrap import betainc
+from prescale_cli.result import list_results, load_header, load_result
 
 _DEFAULT_THRESHOLD = 0.2
+HISTORY_PREFIX = "history:"
+# Config that must match for two runs to be comparable.
+_SETUP_KEYS = ("method", "max_users", "stage_seconds", "latency_wall_s", "error_threshold",
+               "max_rps", "think_time_s", "think_dist", "shape")
+_REGRESSION_P = 0.05  # one-sided: the new run is below the baseline's 90% interval
+_CONFIDENT_P = 0.01
+_ERROR_DELTA = 0.01   # a route's error rate must rise by at least a point
+_MIN_REQUESTS = 20    # per route and level, on each side, before we judge it
+_MD_ROUTES = 15       # regressed routes listed in a markdown comparison
 
 
-def _facts(result: dict) -> dict:
+def run_facts(result: dict) -> dict:
+    """The verdict numbers and provenance of one Result that a comparison reads."""
     v = result["verdict"]
     conf = v.get("confidence") or {}
     env = result.get("environment") or {}
@@ -29,7 +48,98 @@ def _facts(result: dict) -> dict:
 def compare_results(old: dict, new: dict, *, threshold: float = _DEFAULT_THRESHOLD) -> dict:
     """Diff two Results by capacity. A regression is a >threshold drop in
     survives_users; it's 'confident' when the M1 bands don't overlap."""
-    o, n = _facts(old), _facts(new)
+    cmp = _diff(run_facts(old), run_facts(new), threshold)
+    cmp["route_regressions"] = compare_routes(old, new, threshold=threshold)
+    return cmp
+
+
+def _normal_sf(z: float) -> float:
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def mann_whitney(old: list, new: list) -> float | None:
+    """One-sided Mann-Whitney U p-value that `new` latencies run higher than
+    `old`, from two [value, count] histograms on a shared bucket grid (normal
+    approximation, tie-corrected). None without enough data to say."""
+    n1, n2 = sum(c for _, c in old), sum(c for _, c in new)
+    if n1 < _MIN_REQUESTS or n2 < _MIN_REQUESTS:
+        return None
+    a, b = dict(map(tuple, old)), dict(map(tuple, new))
+    rank_new, seen, ties = 0.0, 0, 0.0
+    for value in sorted(a.keys() | b.keys()):
+        t = a.get(value, 0) + b.get(value, 0)
+        rank_new += b.get(value, 0) * (seen + (t + 1) / 2)  # midrank of the tie group
+        seen += t
+        ties += t ** 3 - t
+    big = n1 + n2
+    u = rank_new - n2 * (n2 + 1) / 2
+    var = n1 * n2 / 12 * ((big + 1) - ties / (big * (big - 1)))
+    if var <= 0:
+        return 1.0
+    return _normal_sf((u - n1 * n2 / 2 - 0.5) / math.sqrt(var))
+
+
+def two_proportion(old_errors: int, old_total: int, new_errors: int,
+                   new_total: int) -> float | None:
+    """One-sided p-value that the new error rate is higher (pooled z-test)."""
+    if old_total < _MIN_REQUESTS or new_total < _MIN_REQUESTS:
+        return None
+    p = (old_errors + new_errors) / (old_total + new_total)
+    se = math.sqrt(p * (1 - p) * (1 / old_total + 1 / new_total))
+    if se == 0:
+        return 1.0
+    return _normal_sf((new_errors / new_total - old_errors / old_total) / se)
+
+
+def compare_routes(old: dict, new: dict, *,
+                   threshold: float = _DEFAULT_THRESHOLD) -> list[dict]:
+    """Route-by-route, level-by-level: every route whose p95 grew by more than
+    `threshold` (and whose latencies shifted up, p < 0.05) or whose error rate
+    rose by a point or more (significantly), at a level both runs tested.
+    Worst first. Results saved before `latency_hist` existed are judged on
+    the p95 threshold alone."""
+    new_levels = {s["users"]: s for s in new.get("stages") or []}
+    out = []
+    for o_stage in old.get("stages") or []:
+        n_stage = new_levels.get(o_stage["users"])
+        if n_stage is None:
+            continue
+        for label, o in o_stage.get("routes", {}).items():
+            n = n_stage.get("routes", {}).get(label)
+            if n is None:
+                continue
+            reasons = []
+            p95_pct = (n["p95_ms"] - o["p95_ms"]) / o["p95_ms"] if o["p95_ms"] else 0.0
+            p_lat = None
+            if "latency_hist" in o and "latency_hist" in n:
+                p_lat = mann_whitney(o["latency_hist"], n["latency_hist"])
+                shifted = p_lat is not None and p_lat < _REGRESSION_P
+            else:
+                shifted = True  # saved before latency_hist: the threshold alone
+            if p95_pct >= threshold and shifted:
+                reasons.append("latency")
+            p_err = two_proportion(o["errors"], o["total"], n["errors"], n["total"])
+            if (n["error_rate"] - o["error_rate"] >= _ERROR_DELTA
+                    and p_err is not None and p_err < _REGRESSION_P):
+                reasons.append("errors")
+            if not reasons:
+                continue
+            out.append({
+                "route": label,
+                "users": o_stage["users"],
+                "reasons": reasons,
+                "p95_ms": [o["p95_ms"], n["p95_ms"]],
+                "p99_ms": [o["p99_ms"], n["p99_ms"]],
+                "p95_pct": round(p95_pct, 3),
+                "error_rate": [o["error_rate"], n["error_rate"]],
+                "p_latency": None if p_lat is None else round(p_lat, 4),
+                "p_errors": None if p_err is None else round(p_err, 4),
+            })
+    return sorted(out, key=lambda r: (-r["p95_pct"],
+                                      r["error_rate"][0] - r["error_rate"][1]))
+
+
+def _diff(o: dict, n: dict, threshold: float) -> dict:
     o_surv, n_surv = o["survives_users"], n["survives_users"]
     pct = (n_surv - o_surv) / o_surv if o_surv else 0.0
     regressed = pct <= -threshold
@@ -74,6 +184,121 @@ def resolve(operand: str | None, *, store=None, exclude: str | None = None) -> d
     return None
 
 
+def parse_history(operand: str | None) -> int | None:
+    """N for a `history:N` baseline, else None. Raises ValueError on a bad N."""
+    if operand is None or not operand.startswith(HISTORY_PREFIX):
+        return None
+    n = int(operand[len(HISTORY_PREFIX):])
+    if n < 1:
+        raise ValueError("history:N needs N >= 1")
+    return n
+
+
+def _setup(result: dict) -> tuple:
+    config = result.get("config") or {}
+    target = result.get("target") or {}
+    return (target.get("host"), tuple(sorted(target.get("routes") or [])),
+            tuple(config.get(k) for k in _SETUP_KEYS))
+
+
+def history_baseline(new: dict, n: int, *, store=None) -> list[dict]:
+    """The last `n` saved runs (before `new`) against the same host and routes
+    with the same load config, newest first. Only the newest is loaded in full
+    (for the route-level comparison); the rest are just headers."""
+    want = _setup(new)
+    out = []
+    for row in list_results(store=store, host=(new.get("target") or {}).get("host")):
+        if row["id"] >= new["id"]:
+            continue
+        header = load_header(row["id"], store=store)
+        if _setup(header) == want:
+            out.append(header if out else load_result(row["id"], store=store))
+            if len(out) == n:
+                break
+    return out
+
+
+def _t_sf(t: float, dof: int) -> float:
+    """P(T >= t) for Student's t with `dof` degrees of freedom."""
+    tail = 0.5 * betainc(dof / 2, 0.5, dof / (dof + t * t))
+    return tail if t >= 0 else 1 - tail
+
+
+def _t_quantile(p: float, dof: int) -> float:
+    """t such that P(T >= t) = p, by bisection (p < 0.5)."""
+    lo, hi = 0.0, 1e3
+    for _ in range(100):
+        mid = (lo + hi) / 2
+        if _t_sf(mid, dof) > p:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+
+def _spread(values: list[float], new: float) -> dict:
+    """Mean, sd and a 90% prediction interval for one more run drawn like
+    `values`, plus the one-sided p-value of `new` sitting that far below."""
+    n = len(values)
+    mean = statistics.fmean(values)
+    sd = statistics.stdev(values) if n > 1 else 0.0
+    if n < 2:
+        return {"mean": mean, "sd": sd, "low": None, "high": None, "p_value": None}
+    scale = sd * math.sqrt(1 + 1 / n)
+    half = _t_quantile(_REGRESSION_P, n - 1) * scale
+    if scale > 0:
+        p = 1 - _t_sf((new - mean) / scale, n - 1)
+    else:
+        p = 0.0 if new < mean else 1.0
+    return {"mean": mean, "sd": sd, "low": mean - half, "high": mean + half, "p_value": p}
+
+
+def compare_history(baseline: list[dict], new: dict, *,
+                    threshold: float = _DEFAULT_THRESHOLD) -> dict:
+    """Like `compare_results`, against the spread of several baseline runs. A
+    regression needs both a >threshold drop from the baseline mean and a new
+    run below the baseline's 90% prediction interval (one-sided p < 0.05);
+    it's confident at p < 0.01. Improvements mirror this above the interval."""
+    facts = [run_facts(r) for r in baseline]
+    surv = _spread([f["survives_users"] for f in facts], new["verdict"]["survives_users"])
+    peaks = [f["peak_rps"] for f in facts]
+
+    def rnd(x):
+        return None if x is None else round(x)
+
+    old = {
+        "id": f"{HISTORY_PREFIX}{len(facts)}",
+        "survives_users": round(surv["mean"]),
+        "survives_low": rnd(surv["low"]),
+        "survives_high": rnd(surv["high"]),
+        "peak_rps": round(statistics.fmean(peaks), 1),
+        "onset_users": None,
+        "commit": facts[0]["commit"],
+        "branch": facts[0]["branch"],
+        "created_at": facts[0]["created_at"],
+        "target": facts[0]["target"],
+    }
+    cmp = _diff(old, run_facts(new), threshold)
+    cmp["route_regressions"] = compare_routes(baseline[0], new, threshold=threshold)
+    p = surv["p_value"]
+    if p is not None:  # with 2+ runs the distribution decides, not the bands
+        cmp["regressed"] = cmp["regressed"] and p < _REGRESSION_P
+        cmp["improved"] = cmp["improved"] and 1 - p < _REGRESSION_P
+        tail = p if cmp["regressed"] else 1 - p if cmp["improved"] else 1.0
+        cmp["confident"] = tail < _CONFIDENT_P
+        cmp["summary"] = _summary(old, cmp["new"], cmp["survives_pct"],
+                                  cmp["regressed"], cmp["improved"])
+    cmp["baseline"] = {
+        "runs": [f["id"] for f in facts],
+        "mean": round(surv["mean"], 1),
+        "sd": round(surv["sd"], 1),
+        "low": rnd(surv["low"]),
+        "high": rnd(surv["high"]),
+        "p_value": None if p is None else round(p, 4),
+    }
+    return cmp
+
+
 def to_markdown(cmp: dict) -> str:
     o, n = cmp["old"], cmp["new"]
     if cmp["regressed"]:
@@ -82,11 +307,33 @@ def to_markdown(cmp: dict) -> str:
         emoji = "🟢"
     else:
         emoji = "⚪"
-    return "\n".join([
+    base = cmp.get("baseline")
+    label = f"baseline ({len(base['runs'])} runs)" if base else "old"
+    survives = (f"{o['survives_users']} ± {base['sd']:g}" if base
+                else str(o["survives_users"]))
+    lines = [
         f"### {emoji} PreScale — {cmp['summary']}",
         "",
         "| | survives | peak req/s | commit |",
         "|---|---:|---:|---|",
-        f"| old | {o['survives_users']} | {o['peak_rps']:.0f} | `{o['commit'] or '-'}` |",
+        f"| {label} | {survives} | {o['peak_rps']:.0f} | `{o['commit'] or '-'}` |",
         f"| new | {n['survives_users']} | {n['peak_rps']:.0f} | `{n['commit'] or '-'}` |",
-    ])
+    ]
+    routes = cmp.get("route_regressions") or []
+    if routes:
+        lines += ["", f"**Routes that regressed** ({len(routes)})", "",
+                  "| route | users | p95 | p99 | errors |", "|---|---:|---:|---:|---:|"]
+        for r in routes[:_MD_ROUTES]:
+            lines.append(f"| `{r['route']}` | {r['users']} | {route_change(r, 'p95_ms')} | "
+                         f"{route_change(r, 'p99_ms')} | {route_change(r, 'error_rate')} |")
+        if len(routes) > _MD_ROUTES:
+            lines.append(f"| … {len(routes) - _MD_ROUTES} more | | | | |")
+    return "\n".join(lines)
+
+
+def route_change(row: dict, key: str) -> str:
+    """'120 → 310ms' / '0.2% → 4.1%' for one column of a route regression."""
+    old, new = row[key]
+    if key == "error_rate":
+        return f"{old:.1%} → {new:.1%}"
+    return f"{old} → {new}ms"
@@ -0,0 +1,60 @@
+"""NDJSON progress events — `run --events ndjson`, `investigate --events ndjson`
+and the MCP tools' log notifications.
+
+One JSON object per line, written and flushed the moment it happens, so a CI
+dashboard or wrapper can follow a ramp (and kill it early) without scraping the
+live table. Every event has `event` and `t` (seconds since the stream opened):
+
+    stage_start  {"users"}                  a level begins
+    stage_end    {"users", "stage"}         a level ends; `stage` is the saved stage shape
+    probe        {"name"}                   investigate: headers, baseline or static
+    verdict      {"id", "verdict"}          the Result is built; plus `investigation`
+    error        {"message"}                the run couldn't start or finish
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from prescale_cli.result import stage_dict
+
+if TYPE_CHECKING:
+    from prescale_cli.loadtest import StageResult
+
+
+def _stdout(line: str) -> None:
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+
+
+class EventStream:
+    """Wire it like `LiveRamp`: pass `.starting` as `progress_cb`, `.finished` as
+    `on_stage` and `.probing` as `on_probe`, then call `.verdict` once the Result
+    exists. `write` gets one line per event (default: stdout, flushed)."""
+
+    def __init__(self, write: Callable[[str], None] | None = None) -> None:
+        self._write = write or _stdout
+        self._start = time.monotonic()
+
+    def emit(self, event: str, **fields) -> None:
+        record = {"event": event, "t": round(time.monotonic() - self._start, 3), **fields}
+        self._write(json.dumps(record))
+
+    def starting(self, users: int) -> None:
+        self.emit("stage_start", users=users)
+
+    def finished(self, stage: StageResult) -> None:
+        self.emit("stage_end", users=stage.users, stage=stage_dict(stage))
+
+    def probing(self, name: str) -> None:
+        self.emit("probe", name=name)
+
+    def verdict(self, result: dict) -> None:
+        fields = {"id": result["id"], "verdict": result["verdict"]}
+        if result.get("investigation"):
+            fields["investigation"] = result["investigation"]
+        self.emit("verdict", **fields)
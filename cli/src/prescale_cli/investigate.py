@@ -8,6 +8,7 @@ no LLM. The classifier and remediation map are pure functions.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 
 import httpx
@@ -28,6 +29,8 @@ _PROBE_SECONDS = 2.0
 _SLOW_BASELINE_MS = 800.0   # >= 0.8s at 1 VU => intrinsically slow
 _LATENCY_WALL_S = 2.0
 _ERROR_THRESHOLD = 0.02
+_HARNESS_RESIDUAL = 0.25    # >25% of VU-time unexplained => the load generator lagged
+_MIN_BASELINE_SAMPLES = 20  # culprit successes at the ramp's 1-VU level to stand in for a probe
 
 
 @dataclass
@@ -43,6 +46,7 @@ class Probes:
     cdn: str | None = None
     error_kinds: dict = field(default_factory=dict)
     status_counts: dict = field(default_factory=dict)
+    littles_residual: float | None = None  # at onset; None when rate-capped
 
 
 @dataclass
@@ -66,6 +70,14 @@ def _evidence(p: Probes) -> list[str]:
         ev.append("errors under load: " + ", ".join(f"{k} ({v})" for k, v in worst))
     if p.throughput_plateaued:
         ev.append("throughput plateaued while users kept rising")
+    if p.littles_residual is not None:
+        explained = 1 - p.littles_residual
+        if p.littles_residual >= _HARNESS_RESIDUAL:
+            ev.append(f"Little's law explains only {explained:.0%} of the {p.onset_users} "
+                      "users — time was lost in the load generator, not the target")
+        else:
+            ev.append(f"Little's law explains {explained:.0%} of the {p.onset_users} "
+                      "users — the target set the pace")
     if p.server:
         ev.append(f"server: {p.server}")
     return ev
@@ -111,6 +123,10 @@ def classify(p: Probes) -> Diagnosis:
         return Diagnosis("slow_endpoint", "high",
                          "Slow even at 1 user — an intrinsically slow endpoint "
                          "(slow query / N+1 / heavy compute).", ev)
+    if p.littles_residual is not None and p.littles_residual >= _HARNESS_RESIDUAL:
+        return Diagnosis("harness_bound", "medium",
+                         "The load generator couldn't keep its users busy — this latency "
+                         "wall may be the harness, not the target.", ev)
     if p.throughput_plateaued:
         return Diagnosis("concurrency_ceiling", "high",
                          "Latency climbs while throughput is flat — a concurrency ceiling "
@@ -153,6 +169,11 @@ _REMEDIATION = {
         "Profile the route — it's slow even at 1 user (likely a slow query or N+1).",
         "Add an index, a cache, or pagination; move heavy work off the request path.",
     ],
+    "harness_bound": [
+        "Re-run from a machine with more CPU headroom, or with fewer users / routes.",
+        "Check the load generator's CPU during the run — a saturated event loop "
+        "delays every request it sends.",
+    ],
     "unknown": [
         "Re-run with --repeat 3 for a tighter read, and inspect the per-route breakdown.",
         "Check app logs and DB/connection metrics around the onset level.",
@@ -184,10 +205,15 @@ def remediate(diag: Diagnosis, stack: dict) -> list[str]:
     return lines
 
 
-async def _headers(client, url):
+async def _get(client, url) -> httpx.Response | None:
     try:
-        r = await client.get(url)
+        return await client.get(url)
     except httpx.HTTPError:
+        return None
+
+
+def _stack(r: httpx.Response | None) -> tuple[str | None, str | None]:
+    if r is None:
         return None, None
     h = {k.lower(): v for k, v in r.headers.items()}
     cdn = next((label for marker, label in _CDN_MARKERS.items() if marker in h), None)
@@ -196,21 +222,36 @@ async def _headers(client, url):
     return h.get("server"), cdn
 
 
-async def _static_probe(client, base_url, onset):
-    try:
-        page = await client.get(base_url)
-        assets = extract_assets(page.text, base_url)
-    except httpx.HTTPError:
-        assets = []
-    if not assets:
+def _ramp_baseline(stages, culprit) -> float | None:
+    """The culprit's p95 at the ramp's 1-VU level — the same measurement the
+    baseline probe would take — when that level got enough of its requests."""
+    first = stages[0] if stages else None
+    stat = first.routes.get(culprit) if first is not None and first.users == 1 else None
+    if stat is None or stat.successes < _MIN_BASELINE_SAMPLES:
+        return None
+    return stat.pct(0.95) * 1000
+
+
+async def _baseline_probe(client, url) -> float | None:
+    base = await measure_route(client, url, users=1, seconds=_PROBE_SECONDS)
+    return base.pct(0.95) * 1000 if base.routes else None
+
+
+async def _static_probe(client, asset, onset):
+    if asset is None:
         return None, None
-    stage = await measure_route(client, assets[0], users=onset, seconds=_PROBE_SECONDS)
+    stage = await measure_route(client, asset, users=onset, seconds=_PROBE_SECONDS)
     ok = stage.error_rate < _ERROR_THRESHOLD and stage.pct(0.95) < _LATENCY_WALL_S
-    return route_label(assets[0]), ok
+    return route_label(asset), ok
 
 
-async def gather_probes(base_url, report, stages, targets, *, transport=None) -> Probes:
-    """Run the active probes on the culprit route + a static reference."""
+async def gather_probes(base_url, report, stages, targets, *, transport=None,
+                        rate_capped=False, on_probe=None) -> Probes:
+    """Run the active probes on the culprit route + a static reference.
+    `on_probe(name)` is called as each one starts: headers, baseline, static.
+    The baseline is skipped (no event) when the ramp's 1-user level already
+    measured it."""
+    on_probe = on_probe or (lambda name: None)
     culprit = report.culprit_route
     onset = report.onset_users
     culprit_url = next((t for t in targets if route_label(t) == culprit), base_url)
@@ -218,28 +259,46 @@ async def gather_probes(base_url, report, stages, targets, *, transport=None) ->
     cstat = onset_stage.routes.get(culprit) if onset_stage else None
     p = Probes(
         culprit_route=culprit, onset_users=onset,
-        loaded_p95_ms=(cstat.pct(0.95) * 1000) if (cstat and cstat.latencies) else None,
+        loaded_p95_ms=(cstat.pct(0.95) * 1000) if (cstat and cstat.successes) else None,
         throughput_plateaued=report.saturated,
         error_kinds=dict(cstat.error_kinds) if cstat else {},
         status_counts=dict(cstat.status_counts) if cstat else {},
     )
+    # Under a rate cap, gate waits are unexplained time by design.
+    if onset_stage is not None and not rate_capped and report.littles_residuals:
+        p.littles_residual = report.littles_residuals[stages.index(onset_stage)]
     async with open_client(max_conns=onset + 10, transport=transport) as client:
-        base = await measure_route(client, culprit_url, users=1, seconds=_PROBE_SECONDS)
-        p.baseline_p95_ms = base.pct(0.95) * 1000 if base.routes else None
-        p.server, p.cdn = await _headers(client, culprit_url)
-        p.static_route, p.static_ok = await _static_probe(client, base_url, onset)
+        on_probe("headers")
+        # The culprit's headers and the page's asset list: untimed GETs, so they
+        # overlap — and are one GET when the culprit is the page itself.
+        urls = list(dict.fromkeys([culprit_url, base_url]))
+        got = dict(zip(urls, await asyncio.gather(*(_get(client, u) for u in urls))))
+        p.server, p.cdn = _stack(got[culprit_url])
+        page = got[base_url]
+        assets = extract_assets(page.text, base_url) if page is not None else []
+        asset = assets[0] if assets else None
+
+        # The timed probes stay one after another: the static asset is on the
+        # same origin, so its load would slow the very baseline it's compared to.
+        p.baseline_p95_ms = _ramp_baseline(stages, culprit)
+        if p.baseline_p95_ms is None:
+            on_probe("baseline")
+            p.baseline_p95_ms = await _baseline_probe(client, culprit_url)
+        on_probe("static")
+        p.static_route, p.static_ok = await _static_probe(client, asset, onset)
     return p
 
 
 async def investigate(url, *, max_users=200, paths=(), stage_seconds=5.0,
                       max_rps=None, store=None, transport=None, progress_cb=None,
-                      on_stage=None, on_probe=None) -> dict:
+                      on_stage=None, on_probe=None, on_live=None) -> dict:
     """Ramp to find the culprit, probe it, and attach a diagnosis to the Result."""
     targets = build_targets(url, paths=tuple(paths))
     levels = default_levels(max_users)
     stages, warning = await run_loadtest(
         targets, levels=levels, stage_seconds=stage_seconds, max_rps=max_rps,
-        transport=transport, progress_cb=progress_cb, on_stage=on_stage)
+        transport=transport, progress_cb=progress_cb, on_stage=on_stage,
+        on_live=on_live)
     report = analyze(stages, latency_wall=_LATENCY_WALL_S,
                      error_threshold=_ERROR_THRESHOLD, rate_capped=max_rps is not None)
     config = {"method": "GET", "max_users": max_users, "stage_seconds": stage_seconds,
@@ -248,9 +307,8 @@ async def investigate(url, *, max_users=200, paths=(), stage_seconds=5.0,
     result = build_result(report, url=url, targets=targets, config=config, warning=warning)
 
     if report.onset_users is not None and report.culprit_route:
-        if on_probe:
-            on_probe()
-        probes = await gather_probes(url, report, stages, targets, transport=transport)
+        probes = await gather_probes(url, report, stages, targets, transport=transport,
+                                     rate_capped=max_rps is not None, on_probe=on_probe)
         diag = classify(probes)
         stack = {k: v for k, v in {"server": probes.server, "cdn": probes.cdn}.items() if v}
         result["investigation"] = {
@@ -2,22 +2,29 @@
 
 Renders the same Load-ramp table as `render.py`, but fills it in stage-by-stage
 so you watch latency and errors climb as the load rises — instead of a bare
-spinner. Non-TTY and `--json` callers skip this entirely.
+spinner. The level in flight shows running figures read from its sink on each
+refresh. Non-TTY and `--json` callers skip this entirely.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from rich.console import Console
 from rich.live import Live
 from rich.table import Table
 
-from prescale_cli.loadtest import StageResult
+from prescale_cli.loadtest import LiveStats, StageResult
 from prescale_cli.render import _err, _ms
 
+if TYPE_CHECKING:
+    from prescale_cli.loadtest import _Sink
+
 
-def _ramp_table(rows: list[tuple[int, StageResult | None]], latency_wall: float,
-                caption: str | None = None) -> Table:
-    """Build the Load-ramp table. A `None` stage is a level still in flight."""
+def _ramp_table(rows: list[tuple[int, StageResult | LiveStats | None]],
+                latency_wall: float, caption: str | None = None) -> Table:
+    """Build the Load-ramp table. A `LiveStats` row is a level still in flight;
+    `None` is one that hasn't answered a request yet."""
     table = Table(show_header=True, header_style="bold magenta", title="Load ramp",
                   caption=caption, caption_style="dim")
     table.add_column("Users", justify="right")
@@ -27,38 +34,55 @@ def _ramp_table(rows: list[tuple[int, StageResult | None]], latency_wall: float,
     table.add_column("p99", justify="right")
     table.add_column("Errors", justify="right")
     for users, stage in rows:
-        if stage is None:
+        running = isinstance(stage, LiveStats)
+        if stage is None or (running and not stage.requests):
             dim = "[dim]…[/dim]"
             table.add_row(str(users), dim, dim, dim, dim, "[dim]running…[/dim]")
             continue
         p95 = stage.pct(0.95) * 1000
         crossed = stage.error_rate >= 0.02 or p95 >= latency_wall * 1000
+        style = "bold red" if crossed else None
+        if running:
+            style = "red" if crossed else "dim"
         table.add_row(
-            str(stage.users),
+            f"{stage.users}…" if running else str(stage.users),
             f"{stage.rps:.0f}",
             _ms(stage.pct(0.5) * 1000),
             _ms(p95),
             _ms(stage.pct(0.99) * 1000),
             _err(stage.error_rate),
-            style="bold red" if crossed else None,
+            style=style,
         )
     return table
 
 
 class LiveRamp:
     """Context manager wiring a live ramp table to the loadtest callbacks:
-    pass `.starting` as `progress_cb` and `.finished` as `on_stage`."""
+    pass `.starting` as `progress_cb`, `.finished` as `on_stage` and
+    `.streaming` as `on_live`.
+
+    The table is rebuilt on rich's own refresh thread, 12 times a second,
+    from a snapshot of the in-flight sink — the workers only ever bump
+    counters, so rendering never sits on the request path."""
 
     def __init__(self, console: Console, *, latency_wall: float = 2.0) -> None:
         self.latency_wall = latency_wall
         self._order: list[int] = []
         self._stage: dict[int, StageResult | None] = {}
+        self._sink: tuple[int, _Sink] | None = None
         self._caption: str | None = "warming up…"
-        self._live = Live(self._render(), console=console,
+        self._live = Live(console=console, get_renderable=self._render,
                           refresh_per_second=12, transient=False)
 
+    def _row(self, users: int) -> StageResult | LiveStats | None:
+        stage = self._stage.get(users)
+        sink = self._sink
+        if stage is None and sink is not None and sink[0] == users:
+            return sink[1].live(users)
+        return stage
+
     def _render(self) -> Table:
-        return _ramp_table([(u, self._stage.get(u)) for u in self._order],
+        return _ramp_table([(u, self._row(u)) for u in list(self._order)],
                            self.latency_wall, self._caption)
 
     def starting(self, users: int) -> None:
@@ -66,18 +90,23 @@ class LiveRamp:
             self._order.append(users)
         self._stage[users] = None
         self._caption = None  # rows now show the activity
-        self._live.update(self._render())
+        self._live.refresh()
+
+    def streaming(self, users: int, sink: _Sink) -> None:
+        self._sink = (users, sink)
 
     def finished(self, stage: StageResult) -> None:
         if stage.users not in self._stage:
             self._order.append(stage.users)
         self._stage[stage.users] = stage
-        self._live.update(self._render())
+        self._sink = None
+        self._live.refresh()
 
-    def diagnosing(self) -> None:
+    def diagnosing(self, probe: str | None = None) -> None:
         """Ramp is done; the probes are running — label the pause."""
-        self._caption = "diagnosing the culprit route…"
-        self._live.update(self._render())
+        self._caption = (f"diagnosing the culprit route ({probe})…" if probe
+                         else "diagnosing the culprit route…")
+        self._live.refresh()
 
     def __enter__(self) -> LiveRamp:
         self._live.__enter__()
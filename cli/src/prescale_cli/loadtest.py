@@ -9,8 +9,11 @@ server.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import itertools
 import math
+import random
 import time
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
@@ -20,6 +23,11 @@ from urllib.robotparser import RobotFileParser
 import httpx
 
 from prescale_cli import __version__
+from prescale_cli.bootstrap import bootstrap_band
+from prescale_cli.changepoint import TICK_SECONDS, Changepoint, Tick, onset_changepoint
+from prescale_cli.scalability import UslFit, fit_usl
+from prescale_cli.slo import REASONS as SLO_REASONS
+from prescale_cli.slo import Breach, SloConfig, slo_band, slo_onset, unmet_min_rps
 
 
 class LoadError(Exception):
@@ -176,6 +184,58 @@ async def check_robots(targets: list[str], *, timeout: float = 10.0) -> list[str
     return disallowed_targets(resp.text, targets, _USER_AGENT)
 
 
+class LatencyHistogram:
+    """Log-bucketed latency histogram: fixed memory whatever the request count,
+    with ~1% relative error per bucket. Used instead of a raw latency list where
+    samples would grow without bound (soak runs)."""
+
+    _FLOOR = 1e-4                  # 0.1ms; everything faster shares bucket 0
+    _LOG_GROWTH = math.log(1.02)   # each bucket is 2% wider than the last
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.count = 0
+
+    def _index(self, value: float) -> int:
+        if value <= self._FLOOR:
+            return 0
+        return int(math.log(value / self._FLOOR) / self._LOG_GROWTH) + 1
+
+    def _value(self, index: int) -> float:
+        """Geometric midpoint of a bucket (its representative value)."""
+        if index == 0:
+            return self._FLOOR
+        return self._FLOOR * math.exp((index - 0.5) * self._LOG_GROWTH)
+
+    def add(self, value: float, n: int = 1) -> None:
+        i = self._index(value)
+        self.counts[i] = self.counts.get(i, 0) + n
+        self.count += n
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for i, n in other.counts.items():
+            self.counts[i] = self.counts.get(i, 0) + n
+        self.count += other.count
+
+    def buckets(self):
+        """(representative value, count) for every non-empty bucket, ascending."""
+        return [(self._value(i), self.counts[i]) for i in sorted(self.counts)]
+
+    def value_at_rank(self, rank: int) -> float:
+        """The (0-based) rank-th smallest value, to bucket precision."""
+        seen = 0
+        for i in sorted(self.counts):
+            seen += self.counts[i]
+            if seen > rank:
+                return self._value(i)
+        return self._value(max(self.counts)) if self.counts else 0.0
+
+    def percentile(self, p: float) -> float:
+        if not self.count:
+            return 0.0
+        return self.value_at_rank(round((self.count - 1) * p))
+
+
 @dataclass
 class RouteStat:
     """Per-route outcome within a stage."""
@@ -185,14 +245,41 @@ class RouteStat:
     latencies: list[float] = field(default_factory=list)  # successful, seconds
     status_counts: dict[int, int] = field(default_factory=dict)
     error_kinds: dict[str, int] = field(default_factory=dict)
+    hist: LatencyHistogram | None = None  # streaming sinks fill this, not `latencies`
+    busy: float = 0.0  # seconds spent in requests, failed ones included
 
     @property
     def error_rate(self) -> float:
         return self.errors / self.total if self.total else 0.0
 
+    @property
+    def successes(self) -> int:
+        """How many latency samples this route holds."""
+        return self.hist.count if self.hist is not None else len(self.latencies)
+
     def pct(self, p: float) -> float:
+        if self.hist is not None:
+            return self.hist.percentile(p)
         return percentile(sorted(self.latencies), p)
 
+    def pct_bounds(self, q: float) -> tuple[float, float] | None:
+        """`quantile_bounds` for this route's latencies (None if it has none)."""
+        return _pct_bounds(self.hist, self.latencies, q)
+
+    def error_rate_bounds(self) -> tuple[float, float]:
+        return wilson_bounds(self.errors, self.total)
+
+
+def _pct_bounds(hist: LatencyHistogram | None, latencies: list[float],
+                q: float) -> tuple[float, float] | None:
+    if hist is not None:
+        if not hist.count:
+            return None
+        lo, hi = _order_stat_ranks(hist.count, q)
+        return hist.value_at_rank(lo), hist.value_at_rank(hi)
+    lats = sorted(latencies)
+    return quantile_bounds(lats, q) if lats else None
+
 
 @dataclass
 class StageResult:
@@ -203,6 +290,7 @@ class StageResult:
     duration: float
     routes: dict[str, RouteStat] = field(default_factory=dict)
     samples: int = 1
+    ticks: list[Tick] = field(default_factory=list)  # TICK_SECONDS slices, in order
 
     @property
     def total(self) -> int:
@@ -221,21 +309,63 @@ class StageResult:
     def rps(self) -> float:
         return self.total / self.duration if self.duration else 0.0
 
+    @property
+    def busy(self) -> float:
+        return sum(r.busy for r in self.routes.values())
+
     def _merged_latencies(self) -> list[float]:
         merged: list[float] = []
         for route in self.routes.values():
             merged.extend(route.latencies)
         return merged
 
+    def _merged_hist(self) -> LatencyHistogram | None:
+        """All routes' latencies as one histogram, or None for a list-backed stage."""
+        if all(r.hist is None for r in self.routes.values()):
+            return None
+        merged = LatencyHistogram()
+        for route in self.routes.values():
+            if route.hist is not None:
+                merged.merge(route.hist)
+            for lat in route.latencies:
+                merged.add(lat)
+        return merged
+
+    def has_latencies(self) -> bool:
+        return any(r.successes for r in self.routes.values())
+
     def pct(self, p: float) -> float:
+        hist = self._merged_hist()
+        if hist is not None:
+            return hist.percentile(p)
         return percentile(sorted(self._merged_latencies()), p)
 
-    def worst_route(self, by: str):
-        """(label, RouteStat) of the most-degraded route, or None."""
+    def pct_bounds(self, q: float) -> tuple[float, float] | None:
+        """`quantile_bounds` for this stage's latencies (None if it has none)."""
+        hist = self._merged_hist()
+        return _pct_bounds(hist, [] if hist is not None else self._merged_latencies(), q)
+
+    def ranked(self):
+        """(n, at) over this stage's latencies, where `at(rank)` is the rank-th
+        smallest — sorted once, for callers that walk many order statistics."""
+        hist = self._merged_hist()
+        if hist is not None:
+            return hist.count, hist.value_at_rank
+        lats = sorted(self._merged_latencies())
+        return len(lats), lats.__getitem__
+
+    def worst_route(self, by: str, saturated: frozenset[str] = frozenset(),
+                    wall: float = math.inf):
+        """(label, RouteStat) of the most-degraded route, or None. By latency,
+        routes over `wall` rank first, then routes in `saturated` (past their
+        throughput knee), then the highest p95."""
         if not self.routes:
             return None
         if by == "latency":
-            return max(self.routes.items(), key=lambda kv: kv[1].pct(0.95))
+            def key(kv):
+                p95 = kv[1].pct(0.95)
+                return p95 >= wall, kv[0] in saturated, p95
+            return max(self.routes.items(), key=key)
         return max(self.routes.items(), key=lambda kv: (kv[1].error_rate, kv[1].errors))
 
 
@@ -256,6 +386,16 @@ class RunReport:
     survives_low: int | None = None
     survives_high: int | None = None
     stable: bool = True
+    resamples: int = 0  # >0: the band is a bootstrap over this many resamples
+    littles_residuals: list[float | None] = field(default_factory=list)  # per stage
+    slos: SloConfig | None = None
+    slo_breaches: list[Breach] = field(default_factory=list)  # at onset, worst first
+    slo_unmet: list[Breach] = field(default_factory=list)     # min_rps never reached
+    routes: dict[str, RouteSaturation] = field(default_factory=dict)
+    saturated_route: str | None = None  # first route users queued on past the plateau
+    spike: SpikeInfo | None = None
+    usl: UslFit | None = None
+    changepoint: Changepoint | None = None  # where inside a level degradation began
 
 
 @dataclass
@@ -265,18 +405,128 @@ class SaturationInfo:
     peak_rps: float
 
 
+@dataclass
+class RouteSaturation(SaturationInfo):
+    latency_knee_users: int | None = None  # first level where p95 bent upward
+    queued_users: float = 0.0  # VUs in flight on this route at the top level (Little's law)
+
+
+@dataclass
+class SpikeRun:
+    """A `--shape spike` run: baseline, an instant jump, then back to baseline.
+    `seconds` is the per-second timeline; `spike_start`/`spike_end` index into it."""
+
+    baseline: StageResult
+    spike: StageResult
+    recovery: StageResult
+    seconds: list[StageResult]
+    spike_start: int
+    spike_end: int
+
+
+@dataclass
+class SpikeInfo:
+    baseline_users: int
+    spike_users: int
+    spike_seconds: float
+    baseline_p95_ms: float
+    baseline_error_rate: float
+    peak_p95_ms: float
+    peak_error_rate: float
+    time_to_degrade_s: int | None  # None = held through the spike
+    time_to_recover_s: int | None  # None = not back within the recovery window
+    tolerance: float
+
+    @property
+    def degraded(self) -> bool:
+        return self.time_to_degrade_s is not None
+
+    @property
+    def recovered(self) -> bool:
+        return self.time_to_recover_s is not None
+
+
+@dataclass
+class LiveStats:
+    """A level still in flight, as the live table sees it: throughput and error
+    rate over the last `LIVE_WINDOW` seconds, latency over the stage so far."""
+
+    users: int
+    elapsed: float
+    requests: int  # every outcome so far, successes and errors
+    rps: float
+    error_rate: float
+    hist: LatencyHistogram
+
+    def pct(self, p: float) -> float:
+        return self.hist.percentile(p)
+
+
+LIVE_WINDOW = 2.0  # seconds of ticks behind the live rps / error-rate figures
+_LIVE_TICKS = int(LIVE_WINDOW / TICK_SECONDS)
+
+
 class _Sink:
     """Per-stage accumulator, keyed by route label. A 5xx/429 is a failure;
-    everything else with a status code counts toward latency."""
-
-    def __init__(self) -> None:
+    everything else with a status code counts toward latency. A `streaming`
+    sink keeps latencies in histograms instead of raw lists (bounded memory).
+    Once `start` is set (monotonic), outcomes are also filed into ticks by
+    completion time, for in-stage changepoint detection, and successful
+    latencies into one stage-wide histogram that `live()` reads. With
+    `keep_ticks=False` (soaks) only the last `LIVE_WINDOW` of ticks is kept,
+    so memory stays flat however long the stage runs."""
+
+    def __init__(self, streaming: bool = False, keep_ticks: bool = True) -> None:
         self.routes: dict[str, RouteStat] = {}
+        self.streaming = streaming
+        self.keep_ticks = keep_ticks
+        self.start: float | None = None
+        self.ticks: list[Tick] = []
+        self.first_tick = 0  # index of ticks[0]; moves on when old ticks are dropped
+        self.latency = LatencyHistogram()
+        self.requests = 0  # running totals since `start`, so readers never rescan ticks
+        self.lat_sum = 0.0
+
+    def _tick(self, latency: float | None) -> None:
+        if self.start is None:
+            return
+        idx = max(self.first_tick, int((time.monotonic() - self.start) / TICK_SECONDS))
+        while self.first_tick + len(self.ticks) <= idx:
+            self.ticks.append(Tick())
+        if not self.keep_ticks and len(self.ticks) > _LIVE_TICKS:
+            drop = len(self.ticks) - _LIVE_TICKS
+            del self.ticks[:drop]
+            self.first_tick += drop
+        self.ticks[idx - self.first_tick].add(latency)
+        self.requests += 1
+        if latency is not None:
+            self.latency.add(latency)
+            self.lat_sum += latency
+
+    def live(self, users: int) -> LiveStats:
+        """Snapshot the stage so far. Safe to call from another thread (the
+        live table's refresh): it only copies counters the workers bump, so the
+        request path never waits on rendering."""
+        elapsed = max(0.0, time.monotonic() - (self.start or time.monotonic()))
+        last = int(elapsed / TICK_SECONDS)
+        first = max(0, last - _LIVE_TICKS + 1)
+        base = self.first_tick
+        window = self.ticks[max(0, first - base):max(0, last + 1 - base)]
+        span = elapsed - first * TICK_SECONDS
+        total = sum(t.total for t in window)
+        errors = sum(t.errors for t in window)
+        hist = LatencyHistogram()
+        hist.counts = self.latency.counts.copy()
+        hist.count = sum(hist.counts.values())
+        return LiveStats(users=users, elapsed=elapsed, requests=self.requests,
+                         rps=total / span if span > 0 else 0.0,
+                         error_rate=errors / total if total else 0.0, hist=hist)
 
     def _stat(self, target: str) -> RouteStat:
         label = route_label(target)
         stat = self.routes.get(label)
         if stat is None:
-            stat = RouteStat()
+            stat = RouteStat(hist=LatencyHistogram() if self.streaming else None)
             self.routes[label] = stat
         return stat
 
@@ -286,24 +536,61 @@ class _Sink:
     def record_response(self, target: str, status: int, latency: float) -> None:
         stat = self._stat(target)
         stat.total += 1
+        stat.busy += latency
         stat.status_counts[status] = stat.status_counts.get(status, 0) + 1
+        self._tick(None if status >= 500 or status == 429 else latency)
         if status >= 500:
             stat.errors += 1
             self._kind(stat, "5xx")
         elif status == 429:
             stat.errors += 1
             self._kind(stat, "rate limited (429)")
+        elif stat.hist is not None:
+            stat.hist.add(latency)
         else:
             stat.latencies.append(latency)
 
-    def record_error(self, target: str, kind: str) -> None:
+    def record_error(self, target: str, kind: str, latency: float = 0.0) -> None:
         stat = self._stat(target)
         stat.total += 1
         stat.errors += 1
+        stat.busy += latency
         self._kind(stat, kind)
+        self._tick(None)
 
     def to_stage(self, users: int, duration: float) -> StageResult:
-        return StageResult(users=users, duration=duration, routes=self.routes)
+        return StageResult(users=users, duration=duration, routes=self.routes,
+                           ticks=self.ticks if self.keep_ticks else [])
+
+
+class _SecondsSink:
+    """Drop-in for `_Sink` that files each outcome under the whole second (since
+    `start`, on the monotonic clock) in which it completed."""
+
+    def __init__(self, start: float) -> None:
+        self.start = start
+        self.buckets: dict[int, _Sink] = {}
+
+    def _bucket(self) -> _Sink:
+        sec = int(time.monotonic() - self.start)
+        bucket = self.buckets.get(sec)
+        if bucket is None:
+            bucket = _Sink()
+            self.buckets[sec] = bucket
+        return bucket
+
+    def record_response(self, target: str, status: int, latency: float) -> None:
+        self._bucket().record_response(target, status, latency)
+
+    def record_error(self, target: str, kind: str, latency: float = 0.0) -> None:
+        self._bucket().record_error(target, kind, latency)
+
+    def to_stage(self, users: int, duration: float) -> StageResult:
+        if not self.buckets:
+            return StageResult(users=users, duration=duration)
+        merged = _merge_stages([b.to_stage(users, 0.0) for b in self.buckets.values()])
+        merged.duration, merged.samples = duration, 1
+        return merged
 
 
 class _RateGate:
@@ -330,12 +617,42 @@ class _RateGate:
         return True
 
 
+THINK_DISTRIBUTIONS = ("fixed", "exponential", "uniform", "lognormal")
+
+# Shape of the log-normal think-time: sigma=1 gives a long right tail (a few
+# users linger a lot) while keeping the configured mean.
+_LOGNORMAL_SIGMA = 1.0
+
+
+def think_sampler(mean: float, dist: str = "fixed", rng: random.Random | None = None):
+    """A zero-arg callable drawing one think-time (seconds) with the given mean.
+
+    `fixed` always returns `mean` (the legacy behaviour). The stochastic shapes
+    break VU lockstep so arrivals come in realistic bursts: `exponential`
+    (memoryless, Poisson-like arrivals), `uniform` on [0, 2*mean], and
+    `lognormal` (heavy tail)."""
+    if dist not in THINK_DISTRIBUTIONS:
+        raise ValueError(f"Unknown think-time distribution '{dist}'.")
+    if mean <= 0 or dist == "fixed":
+        return lambda: mean
+    rng = rng or random.Random()
+    if dist == "exponential":
+        return lambda: rng.expovariate(1.0 / mean)
+    if dist == "uniform":
+        return lambda: rng.uniform(0.0, 2.0 * mean)
+    mu = math.log(mean) - _LOGNORMAL_SIGMA ** 2 / 2  # keeps E[X] == mean
+    return lambda: rng.lognormvariate(mu, _LOGNORMAL_SIGMA)
+
+
 async def _worker(client: httpx.AsyncClient, method: str, deadline: float,
                   sink: _Sink, pick, gate: _RateGate | None = None,
-                  think_time: float = 0.0) -> None:
+                  think=None, start_delay: float = 0.0) -> None:
     """Closed-loop VU: pick a route and fire requests until the stage deadline
-    (respecting the optional rate gate and any think-time between requests)."""
+    (respecting the optional rate gate and any think-time between requests).
+    `think` draws each pause; `start_delay` staggers this VU's first request."""
     loop = asyncio.get_running_loop()
+    if start_delay > 0:
+        await asyncio.sleep(min(start_delay, max(0.0, deadline - loop.time())))
     while loop.time() < deadline:
         if gate is not None and not await gate.wait(deadline):
             break
@@ -345,26 +662,46 @@ async def _worker(client: httpx.AsyncClient, method: str, deadline: float,
             resp = await client.request(method, target)
             sink.record_response(target, resp.status_code, time.perf_counter() - start)
         except httpx.TimeoutException:
-            sink.record_error(target, "timeout")
+            sink.record_error(target, "timeout", time.perf_counter() - start)
         except httpx.ConnectError:
-            sink.record_error(target, "connection refused")
+            sink.record_error(target, "connection refused", time.perf_counter() - start)
         except httpx.HTTPError:
-            sink.record_error(target, "network")
-        if think_time and loop.time() < deadline:
-            await asyncio.sleep(think_time)
+            sink.record_error(target, "network", time.perf_counter() - start)
+        pause = think() if think is not None else 0.0
+        if pause > 0 and loop.time() < deadline:
+            await asyncio.sleep(pause)
 
 
 async def _run_stage(client: httpx.AsyncClient, targets: list[str], method: str,
                      users: int, duration: float, gate: _RateGate | None = None,
-                     think_time: float = 0.0) -> StageResult:
-    sink = _Sink()
+                     think_time: float = 0.0, think_dist: str = "fixed",
+                     rng: random.Random | None = None, sink=None,
+                     on_live=None) -> StageResult:
+    own_sink = sink is None
+    sink = _Sink() if own_sink else sink
     cycle = itertools.cycle(targets)  # round-robin spreads load evenly across routes
+    # Each VU gets its own RNG (derived from the stage's) so its draws don't
+    # depend on how the event loop interleaves VUs: same seed, same schedule.
+    stochastic = think_time > 0 and think_dist != "fixed"
+    stage_rng = rng or random.Random()
+    vus = []
+    for _ in range(users):
+        vu_rng = random.Random(stage_rng.getrandbits(64)) if stochastic else None
+        think = think_sampler(think_time, think_dist, vu_rng)
+        # A random start offset within the first think period stops every VU
+        # from firing its first request in the same instant.
+        offset = vu_rng.uniform(0.0, min(think_time, duration)) if vu_rng else 0.0
+        vus.append((think, offset))
     loop = asyncio.get_running_loop()
     start = loop.time()
     deadline = start + duration
+    if own_sink:
+        sink.start = time.monotonic()
+        if on_live:
+            on_live(users, sink)
     await asyncio.gather(
-        *(_worker(client, method, deadline, sink, lambda: next(cycle), gate, think_time)
-          for _ in range(users))
+        *(_worker(client, method, deadline, sink, lambda: next(cycle), gate, think, offset)
+          for think, offset in vus)
     )
     # Use actual elapsed wall-time (workers finish their in-flight request after the
     # deadline) so rps reflects true throughput instead of inflating with concurrency.
@@ -383,13 +720,23 @@ def _merge_stages(group: list[StageResult]) -> StageResult:
                 merged[label] = m
             m.total += rs.total
             m.errors += rs.errors
+            m.busy += rs.busy
             m.latencies.extend(rs.latencies)
+            if rs.hist is not None:
+                if m.hist is None:
+                    m.hist = LatencyHistogram()
+                m.hist.merge(rs.hist)
             for code, n in rs.status_counts.items():
                 m.status_counts[code] = m.status_counts.get(code, 0) + n
             for kind, n in rs.error_kinds.items():
                 m.error_kinds[kind] = m.error_kinds.get(kind, 0) + n
+    # Ticks line up by offset into the stage: repeats of a level overlay.
+    ticks = [Tick() for _ in range(max((len(s.ticks) for s in group), default=0))]
+    for stage in group:
+        for tick, t in zip(ticks, stage.ticks):
+            tick.merge(t)
     return StageResult(users=group[0].users, duration=sum(s.duration for s in group),
-                       routes=merged, samples=len(group))
+                       routes=merged, samples=len(group), ticks=ticks)
 
 
 def _warmup_plan(levels: list[int], stage_seconds: float) -> tuple[int, float]:
@@ -398,6 +745,40 @@ def _warmup_plan(levels: list[int], stage_seconds: float) -> tuple[int, float]:
     return min(10, max(levels)), min(2.0, stage_seconds)
 
 
+async def _preflight(client: httpx.AsyncClient, method: str, url: str) -> str | None:
+    """One request to confirm the target is reachable. Raises LoadError if it
+    isn't; returns a warning if it answered with an error status."""
+    try:
+        preflight = await client.request(method, url)
+    except httpx.HTTPError as exc:
+        raise LoadError(f"Couldn't reach {url}: {exc}") from exc
+    if preflight.status_code >= 400:
+        return (
+            f"First request returned HTTP {preflight.status_code} — "
+            "results may reflect a broken endpoint, not a load limit."
+        )
+    return None
+
+
+def _metrics(port: int | None, host: str):
+    """`metrics.metrics_server` when a port is given, else a no-op context."""
+    if port is None:
+        return contextlib.nullcontext()
+    from prescale_cli.metrics import metrics_server  # only when asked for
+
+    return metrics_server(port, host)
+
+
+def _both(first, second):
+    if second is None:
+        return first
+
+    def call(*args):
+        first(*args)
+        second(*args)
+    return call
+
+
 async def run_loadtest(
     targets: list[str],
     *,
@@ -410,40 +791,57 @@ async def run_loadtest(
     warmup: bool = True,
     repeat: int = 1,
     think_time: float = 0.0,
+    think_dist: str = "fixed",
+    seed: int | None = None,
     progress_cb=None,
     on_stage=None,
+    on_live=None,
     transport: httpx.AsyncBaseTransport | None = None,
+    resample=None,
+    resample_budget: float = 120.0,
+    metrics_port: int | None = None,
+    metrics_host: str = "127.0.0.1",
 ) -> tuple[list[StageResult], str | None]:
     """Preflight the target, then ramp through `levels`, spreading each stage's
     load across `targets`. Stops early once a stage is more than `hard_stop_rate`
-    failed. Returns (stages, warning)."""
+    failed. `seed` makes stochastic think-times reproducible. Returns
+    (stages, warning).
+
+    `on_live(users, sink)` is handed each measured stage's in-flight sink as it
+    starts; call `sink.live(users)` to read it while the stage runs.
+
+    `metrics_port` serves an OpenMetrics `/metrics` endpoint on
+    `metrics_host:metrics_port` for the life of the run (see `metrics`).
+
+    `resample` (pooled stages -> levels to sample again) drives `--repeat auto`:
+    after the ramp, only the levels it names are re-run, round after round,
+    until it names none or `resample_budget` seconds are spent."""
     if not targets:
         raise LoadError("No targets to test.")
+    if think_dist not in THINK_DISTRIBUTIONS:
+        raise ValueError(f"Unknown think-time distribution '{think_dist}'.")
+    # Stages run one after another, so drawing each stage's seed from one RNG
+    # in order keeps the whole run reproducible from a single seed.
+    rng = random.Random(seed)
     max_conns = max(levels) + 50
     limits = httpx.Limits(max_connections=max_conns, max_keepalive_connections=max_conns)
-    warning: str | None = None
 
     gate = _RateGate(max_rps) if max_rps else None
-    async with httpx.AsyncClient(
+    async with _metrics(metrics_port, metrics_host) as exporter, httpx.AsyncClient(
         timeout=timeout, limits=limits, follow_redirects=True,
         headers={"User-Agent": _USER_AGENT}, transport=transport,
     ) as client:
-        try:
-            preflight = await client.request(method, targets[0])
-        except httpx.HTTPError as exc:
-            raise LoadError(f"Couldn't reach {targets[0]}: {exc}") from exc
-        if preflight.status_code >= 400:
-            warning = (
-                f"First request returned HTTP {preflight.status_code} — "
-                "results may reflect a broken endpoint, not a load limit."
-            )
+        if exporter is not None:
+            on_live = _both(exporter.watch, on_live)
+        warning = await _preflight(client, method, targets[0])
 
         if warmup:
             # Discarded: warms caches/JIT/connection pools so the first measured
             # level isn't cold. Still rate-gated, since it's real traffic.
             warmup_users, warmup_seconds = _warmup_plan(levels, stage_seconds)
             await _run_stage(client, targets, method, warmup_users, warmup_seconds,
-                             gate, think_time)
+                             gate, think_time, think_dist,
+                             random.Random(rng.getrandbits(64)))
 
         # --repeat pools several ramps per level, so run-to-run variance (cache
         # state, GC, noisy neighbours) widens the confidence band honestly.
@@ -453,17 +851,132 @@ async def run_loadtest(
                 if progress_cb:
                     progress_cb(users)
                 stage = await _run_stage(client, targets, method, users, stage_seconds,
-                                         gate, think_time)
+                                         gate, think_time, think_dist,
+                                         random.Random(rng.getrandbits(64)),
+                                         on_live=on_live)
                 by_level.setdefault(users, []).append(stage)
                 if on_stage:
                     on_stage(stage)
                 if stage.error_rate >= hard_stop_rate:
                     break
 
+        if resample is not None:
+            loop = asyncio.get_running_loop()
+            budget_end = loop.time() + resample_budget
+            while True:
+                todo = resample([_merge_stages(by_level[u]) for u in sorted(by_level)])
+                if not todo or loop.time() + len(todo) * stage_seconds > budget_end:
+                    break
+                for users in todo:
+                    if progress_cb:
+                        progress_cb(users)
+                    stage = await _run_stage(client, targets, method, users, stage_seconds,
+                                             gate, think_time, think_dist,
+                                             random.Random(rng.getrandbits(64)),
+                                             on_live=on_live)
+                    by_level[users].append(stage)
+                    if on_stage:
+                        on_stage(stage)
+
     stages = [_merge_stages(by_level[u]) for u in sorted(by_level)]
     return stages, warning
 
 
+async def run_spike(
+    targets: list[str],
+    *,
+    baseline_users: int,
+    spike_users: int,
+    baseline_seconds: float,
+    spike_seconds: float,
+    recover_seconds: float,
+    method: str = "GET",
+    timeout: float = 10.0,
+    max_rps: float | None = None,
+    warmup: bool = True,
+    think_time: float = 0.0,
+    think_dist: str = "fixed",
+    seed: int | None = None,
+    progress_cb=None,
+    on_stage=None,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> tuple[SpikeRun, str | None]:
+    """Hold `baseline_users`, jump instantly to `spike_users` for `spike_seconds`,
+    then drop back to baseline for `recover_seconds`. The baseline VUs run
+    throughout; the extra spike VUs join and leave on the clock, so the jump is
+    a step, not a ramp. Every outcome is bucketed per second. Returns
+    (spike run, warning)."""
+    if not targets:
+        raise LoadError("No targets to test.")
+    if think_dist not in THINK_DISTRIBUTIONS:
+        raise ValueError(f"Unknown think-time distribution '{think_dist}'.")
+    baseline_users = max(1, min(baseline_users, spike_users))
+    extra = spike_users - baseline_users
+    rng = random.Random(seed)
+    max_conns = spike_users + 50
+    limits = httpx.Limits(max_connections=max_conns, max_keepalive_connections=max_conns)
+    gate = _RateGate(max_rps) if max_rps else None
+
+    async with httpx.AsyncClient(
+        timeout=timeout, limits=limits, follow_redirects=True,
+        headers={"User-Agent": _USER_AGENT}, transport=transport,
+    ) as client:
+        warning = await _preflight(client, method, targets[0])
+        if warmup:
+            warmup_users, warmup_seconds = _warmup_plan([baseline_users], baseline_seconds)
+            await _run_stage(client, targets, method, warmup_users, warmup_seconds,
+                             gate, think_time, think_dist,
+                             random.Random(rng.getrandbits(64)))
+
+        total = baseline_seconds + spike_seconds + recover_seconds
+        start = time.monotonic()
+        sink = _SecondsSink(start)
+        if progress_cb:
+            progress_cb(baseline_users)
+
+        async def surge() -> None:
+            await asyncio.sleep(baseline_seconds)
+            if progress_cb:
+                progress_cb(spike_users)
+            if extra > 0:
+                await _run_stage(client, targets, method, extra, spike_seconds, gate,
+                                 think_time, think_dist, random.Random(rng.getrandbits(64)),
+                                 sink=sink)
+
+        base_rng = random.Random(rng.getrandbits(64))
+        await asyncio.gather(
+            _run_stage(client, targets, method, baseline_users, total, gate,
+                       think_time, think_dist, base_rng, sink=sink),
+            surge(),
+        )
+
+    spike_start = int(baseline_seconds)
+    spike_end = int(baseline_seconds + spike_seconds)
+    last = max(sink.buckets, default=-1)
+    seconds: list[StageResult] = []
+    for sec in range(last + 1):
+        users = spike_users if spike_start <= sec < spike_end else baseline_users
+        bucket = sink.buckets.get(sec) or _Sink()
+        seconds.append(bucket.to_stage(users, 1.0))
+
+    def phase(lo: int, hi: int, users: int) -> StageResult:
+        group = seconds[lo:hi] or [StageResult(users=users, duration=0.0)]
+        merged = _merge_stages(group)
+        merged.samples = 1
+        return merged
+
+    run = SpikeRun(
+        baseline=phase(0, spike_start, baseline_users),
+        spike=phase(spike_start, spike_end, spike_users),
+        recovery=phase(spike_end, len(seconds), baseline_users),
+        seconds=seconds, spike_start=spike_start, spike_end=spike_end,
+    )
+    if on_stage:
+        on_stage(run.baseline)
+        on_stage(run.spike)
+    return run, warning
+
+
 def open_client(*, timeout: float = 10.0, max_conns: int = 64,
                 transport: httpx.AsyncBaseTransport | None = None) -> httpx.AsyncClient:
     """A client with PreScale's standard headers/limits — for `investigate` probes."""
@@ -478,17 +991,127 @@ async def measure_route(client: httpx.AsyncClient, url: str, *, users: int,
     return await _run_stage(client, [url], method, users, seconds)
 
 
+def _plateau(series: list[tuple[int, float]]) -> SaturationInfo:
+    """Knee of a (users, rps) series: the first level within 15% of peak, if
+    users kept rising well past it."""
+    peak = max((rps for _, rps in series), default=0.0)
+    if len(series) < 3 or peak <= 0:
+        return SaturationInfo(False, None, peak)
+    knee = next(users for users, rps in series if rps >= 0.85 * peak)
+    last = series[-1][0]
+    plateaued = knee < last and last >= knee * 1.5
+    return SaturationInfo(plateaued, knee if plateaued else None, peak)
+
+
 def detect_saturation(stages: list[StageResult]) -> SaturationInfo:
     """Throughput plateau: if rps stops climbing while users keep rising, the
     target has hit a concurrency ceiling (capacity) — not just slow responses."""
+    return _plateau([(s.users, s.rps) for s in stages if s.duration > 0])
+
+
+# A route's latency knee: p95 at least this many times its lightest-load p95,
+# and up by at least _KNEE_FLOOR_S (so 2ms -> 4ms jitter isn't a knee).
+_KNEE_FACTOR = 2.0
+_KNEE_FLOOR_S = 0.05
+
+
+# A route is where users queue once its in-flight VUs grow this much past the
+# plateau: 1.5x, and by at least one whole user (so 0.01 -> 0.02 isn't a queue).
+_QUEUE_GROWTH = 1.5
+_QUEUE_FLOOR = 1.0
+
+
+def route_saturation(stages: list[StageResult]) -> dict[str, RouteSaturation]:
+    """Per-route throughput ceiling and latency knee. Every VU takes the next
+    route round-robin, so each route's rps is the total's share and plateaus
+    exactly when the total does; what tells routes apart is where the users
+    pile up. A route is saturated when throughput plateaus while the VUs in
+    flight on it (busy seconds / duration, Little's law) keep growing — the
+    route the extra users end up waiting on."""
     rateable = [s for s in stages if s.duration > 0]
-    peak = max((s.rps for s in rateable), default=0.0)
-    if len(rateable) < 3 or peak <= 0:
-        return SaturationInfo(False, None, peak)
-    knee = next(s for s in rateable if s.rps >= 0.85 * peak)
-    last = rateable[-1]
-    plateaued = knee.users < last.users and last.users >= knee.users * 1.5
-    return SaturationInfo(plateaued, knee.users if plateaued else None, peak)
+    labels = list(dict.fromkeys(label for s in rateable for label in s.routes))
+    out: dict[str, RouteSaturation] = {}
+    for label in labels:
+        stats = [(s.users, s.routes.get(label), s.duration) for s in rateable]
+        sat = _plateau([(u, st.total / d if st else 0.0) for u, st, d in stats])
+        inflight = {u: st.busy / d if st else 0.0 for u, st, d in stats}
+        queued = inflight[rateable[-1].users] if rateable else 0.0
+        if sat.saturated:
+            at_knee = inflight[sat.knee_users]
+            if queued < at_knee * _QUEUE_GROWTH or queued - at_knee < _QUEUE_FLOOR:
+                sat = SaturationInfo(False, None, sat.peak_rps)
+        latency_knee = None
+        baseline = None
+        for stage in rateable:
+            stat = stage.routes.get(label)
+            if stat is None or not stat.successes:
+                continue
+            p95 = stat.pct(0.95)
+            if baseline is None:
+                baseline = p95
+            elif p95 >= baseline * _KNEE_FACTOR and p95 - baseline >= _KNEE_FLOOR_S:
+                latency_knee = stage.users
+                break
+        out[label] = RouteSaturation(sat.saturated, sat.knee_users, sat.peak_rps,
+                                     latency_knee, queued)
+    return out
+
+
+def first_saturated(routes: dict[str, RouteSaturation]) -> str | None:
+    """The route that saturated at the lowest level (ties: the one holding the
+    most queued users at the top level), or None."""
+    saturated = [(r.knee_users, -r.queued_users, label) for label, r in routes.items()
+                 if r.saturated]
+    return min(saturated)[2] if saturated else None
+
+
+# Consecutive healthy seconds needed before we call the target recovered, so
+# one lucky second in the middle of the backlog doesn't count.
+_RECOVERY_STREAK = 3
+
+
+def analyze_spike(run: SpikeRun, *, tolerance: float = 0.2,
+                  error_threshold: float = 0.02) -> SpikeInfo:
+    """Time-to-degrade, peak damage and time-to-recover for a spike run.
+
+    A second is healthy when its p95 is within `tolerance` (relative) of the
+    baseline p95 and its error rate within `tolerance` of the baseline rate
+    (plus `error_threshold` of absolute slack, since a 0% baseline allows no
+    relative headroom). A second with no completed requests is unhealthy."""
+    base = run.baseline
+    base_p95 = base.pct(0.95) if base.has_latencies() else 0.0
+    base_err = base.error_rate
+    p95_limit = base_p95 * (1 + tolerance)
+    err_limit = base_err * (1 + tolerance) + error_threshold
+
+    def healthy(sec: StageResult) -> bool:
+        if not sec.total or sec.error_rate > err_limit:
+            return False
+        return not sec.has_latencies() or sec.pct(0.95) <= p95_limit
+
+    window = run.seconds[run.spike_start:run.spike_end]
+    degrade = next((i for i, sec in enumerate(window) if not healthy(sec)), None)
+
+    after = run.seconds[run.spike_start:]
+    peak_p95 = max((sec.pct(0.95) for sec in after if sec.has_latencies()),
+                   default=0.0)
+    peak_err = max((sec.error_rate for sec in after), default=0.0)
+
+    recover: int | None = None
+    tail = run.seconds[run.spike_end:]
+    streak = min(_RECOVERY_STREAK, len(tail))  # a short window can't hold a full streak
+    for i in range(len(tail) - streak + 1 if streak else 0):
+        if all(healthy(sec) for sec in tail[i:i + streak]):
+            recover = i
+            break
+
+    return SpikeInfo(
+        baseline_users=base.users, spike_users=run.spike.users,
+        spike_seconds=float(run.spike_end - run.spike_start),
+        baseline_p95_ms=base_p95 * 1000, baseline_error_rate=base_err,
+        peak_p95_ms=peak_p95 * 1000, peak_error_rate=peak_err,
+        time_to_degrade_s=degrade, time_to_recover_s=recover, tolerance=tolerance,
+    )
 
 
 def _bottleneck_hint(stat: RouteStat, reason: str, sat: SaturationInfo) -> str:
@@ -543,6 +1166,13 @@ def wilson_bounds(successes: int, n: int, z: float = _BAND_Z) -> tuple[float, fl
     return max(0.0, center - half), min(1.0, center + half)
 
 
+def _order_stat_ranks(n: int, q: float, z: float = _BAND_Z) -> tuple[int, int]:
+    """Ranks bracketing the q-quantile of n samples (normal approx to the binomial)."""
+    mean = n * q
+    sd = math.sqrt(n * q * (1 - q))
+    return max(0, math.floor(mean - z * sd)), min(n - 1, math.ceil(mean + z * sd))
+
+
 def quantile_bounds(sorted_vals: list[float], q: float,
                     z: float = _BAND_Z) -> tuple[float, float]:
     """Approximate CI for the q-quantile via order statistics (normal approx)."""
@@ -551,10 +1181,7 @@ def quantile_bounds(sorted_vals: list[float], q: float,
         return 0.0, 0.0
     if n == 1:
         return sorted_vals[0], sorted_vals[0]
-    mean = n * q
-    sd = math.sqrt(n * q * (1 - q))
-    lo = max(0, math.floor(mean - z * sd))
-    hi = min(n - 1, math.ceil(mean + z * sd))
+    lo, hi = _order_stat_ranks(n, q, z)
     return sorted_vals[lo], sorted_vals[hi]
 
 
@@ -577,54 +1204,140 @@ def _survives_before(stages, onset, max_tested):
     return stages[idx - 1].users if idx > 0 else 0
 
 
-def confidence_band(stages, *, latency_wall, error_threshold, survives_point,
-                    max_tested) -> tuple[int, int, bool]:
-    """A band on survives_users from within-run uncertainty: re-find onset using
-    pessimistic (upper-bound) and optimistic (lower-bound) estimates of each
-    level's error rate and p95. Deterministic — same data, same band."""
+def _band_onsets(stages, *, latency_wall, error_threshold):
+    """(pessimistic onset, optimistic onset): onset re-found using the upper and
+    the lower bound of each level's error rate and p95."""
+    # Bounds per level, computed once (each p95 bound sorts the level's latencies).
+    errs = {id(s): wilson_bounds(s.errors, s.total) if s.total else (0.0, 0.0)
+            for s in stages}
+    p95s = {id(s): s.pct_bounds(0.95) for s in stages}
+
     def err_hi(s):
-        return wilson_bounds(s.errors, s.total)[1] if s.total else 0.0
+        return errs[id(s)][1]
 
     def err_lo(s):
-        return wilson_bounds(s.errors, s.total)[0] if s.total else 0.0
+        return errs[id(s)][0]
 
     def p95_hi(s):
-        lats = sorted(s._merged_latencies())
-        return quantile_bounds(lats, 0.95)[1] if lats else None
+        bounds = p95s[id(s)]
+        return bounds[1] if bounds else None
 
     def p95_lo(s):
-        lats = sorted(s._merged_latencies())
-        return quantile_bounds(lats, 0.95)[0] if lats else None
+        bounds = p95s[id(s)]
+        return bounds[0] if bounds else None
 
     onset_lo = _onset_with(stages, err_hi, p95_hi,
                            latency_wall=latency_wall, error_threshold=error_threshold)
     onset_hi = _onset_with(stages, err_lo, p95_lo,
                            latency_wall=latency_wall, error_threshold=error_threshold)
+    return onset_lo, onset_hi
+
+
+def confidence_band(stages, *, latency_wall, error_threshold, survives_point,
+                    max_tested) -> tuple[int, int, bool]:
+    """A band on survives_users from within-run uncertainty: re-find onset using
+    pessimistic (upper-bound) and optimistic (lower-bound) estimates of each
+    level's error rate and p95. Deterministic — same data, same band."""
+    onset_lo, onset_hi = _band_onsets(stages, latency_wall=latency_wall,
+                                      error_threshold=error_threshold)
     low = min(_survives_before(stages, onset_lo, max_tested), survives_point)
     high = max(_survives_before(stages, onset_hi, max_tested), survives_point)
     return low, high, low == high
 
 
+def littles_residual(stage: StageResult, think_time: float = 0.0) -> float | None:
+    """Share of the stage's VU-time that Little's law can't account for.
+
+    A closed loop keeps every VU either in a request or thinking, so
+    users ~= rps * (latency + think). Busy time over the stage is the mean
+    number of requests in flight; adding rps * think gives the users the
+    measurements explain. The rest went to places we don't time — rate-gate
+    waits, event-loop lag between requests, a starved load generator — so a
+    large residual says the harness, not the target, set the pace."""
+    if not stage.total or stage.duration <= 0 or stage.users <= 0:
+        return None
+    explained = stage.busy / stage.duration + stage.rps * think_time
+    return 1 - explained / stage.users
+
+
+def unsettled_levels(stages: list[StageResult], *, latency_wall: float,
+                     error_threshold: float, slos: SloConfig | None = None) -> list[int]:
+    """Levels more samples could settle: from the pessimistic onset up to (not
+    including) the optimistic one. Those straddle a threshold; levels below
+    pass even pessimistically and the optimistic onset fails even optimistically.
+    Empty once the band is stable."""
+    if slos is not None:
+        onset_lo = slo_onset(stages, slos, side=1)[0]
+        onset_hi = slo_onset(stages, slos, side=-1)[0]
+    else:
+        onset_lo, onset_hi = _band_onsets(stages, latency_wall=latency_wall,
+                                          error_threshold=error_threshold)
+    if onset_lo is None or onset_lo is onset_hi:
+        return []
+    start = stages.index(onset_lo)
+    end = stages.index(onset_hi) if onset_hi is not None else len(stages)
+    return [s.users for s in stages[start:end]]
+
+
+def fit_scalability(stages: list[StageResult], *, latency_wall: float,
+                    think_time: float = 0.0) -> UslFit | None:
+    """USL fit over the levels' goodput (successful req/s), so fast-failing
+    errors don't masquerade as throughput."""
+    points = [(s.users, (s.total - s.errors) / s.duration,
+               s.pct(0.95) if s.has_latencies() else 0.0)
+              for s in stages if s.duration > 0]
+    return fit_usl(points, latency_wall=latency_wall, think_time=think_time)
+
+
 def analyze(stages: list[StageResult], *, latency_wall: float,
-            error_threshold: float, rate_capped: bool = False) -> RunReport:
+            error_threshold: float, rate_capped: bool = False,
+            think_time: float = 0.0, bootstrap: int = 0,
+            seed: int | None = None, slos: SloConfig | None = None) -> RunReport:
     """Find the first level that crosses the error or latency threshold, and the
-    route most responsible for it."""
+    route most responsible for it. Also fits the USL to project capacity past
+    the levels tested (skipped under a rate cap, which would be the ceiling).
+    `bootstrap` > 0 swaps the analytic band for that many seeded resamples.
+    With `slos`, onset is instead the first level where any route breaks its
+    own SLO (and the band re-checks each route against its own limits). Past
+    onset, the onset level and the one before are scanned for the moment
+    inside a level where latency or errors shifted."""
+    band = confidence_band
+    if bootstrap > 0:
+        band = functools.partial(bootstrap_band, resamples=bootstrap, seed=seed)
     onset: StageResult | None = None
     reason: str | None = None
-    for stage in stages:
-        if stage.total and stage.error_rate >= error_threshold:
-            onset, reason = stage, "errors"
-            break
-        if stage._merged_latencies() and stage.pct(0.95) >= latency_wall:
-            onset, reason = stage, "latency"
-            break
+    breaches: list[Breach] = []
+    if slos is not None:
+        def band(stages, *, survives_point, max_tested, **_):
+            return slo_band(stages, slos, survives_point=survives_point,
+                            max_tested=max_tested)
+
+        onset, breaches = slo_onset(stages, slos)
+        reason = SLO_REASONS[breaches[0].slo] if breaches else None
+    else:
+        for stage in stages:
+            if stage.total and stage.error_rate >= error_threshold:
+                onset, reason = stage, "errors"
+                break
+            if stage.has_latencies() and stage.pct(0.95) >= latency_wall:
+                onset, reason = stage, "latency"
+                break
 
     sat = detect_saturation(stages)
+    routes = route_saturation(stages)
     if rate_capped:  # the plateau would be our own ceiling, not the app's
         sat = SaturationInfo(False, None, sat.peak_rps)
+        routes = {label: RouteSaturation(False, None, r.peak_rps, r.latency_knee_users,
+                                         r.queued_users)
+                  for label, r in routes.items()}
+    saturated_route = first_saturated(routes)
+    residuals = [littles_residual(s, think_time) for s in stages]
     max_tested = stages[-1].users if stages else 0
+    usl = None if rate_capped else fit_scalability(
+        stages, latency_wall=latency_wall, think_time=think_time)
+    unmet = unmet_min_rps(stages, slos) if slos is not None else []
     if onset is None:
-        low, high, stable = confidence_band(
+        low, high, stable = band(
             stages, latency_wall=latency_wall, error_threshold=error_threshold,
             survives_point=max_tested, max_tested=max_tested)
         return RunReport(
@@ -632,18 +1345,31 @@ def analyze(stages: list[StageResult], *, latency_wall: float,
             latency_wall=latency_wall, saturated=sat.saturated,
             saturation_users=sat.knee_users, peak_rps=sat.peak_rps,
             survives_low=low, survives_high=high, stable=stable,
+            resamples=max(0, bootstrap), littles_residuals=residuals, routes=routes,
+            saturated_route=saturated_route, usl=usl, slos=slos, slo_unmet=unmet,
         )
 
     idx = stages.index(onset)
     survives = stages[idx - 1].users if idx > 0 else 0
-    worst = onset.worst_route("latency" if reason == "latency" else "errors")
+    past_knee = frozenset(label for label, r in routes.items()
+                          if r.saturated and r.knee_users <= onset.users)
+    if breaches:  # the route that broke its own SLO worst is the culprit
+        worst = (breaches[0].route, onset.routes[breaches[0].route])
+    else:
+        worst = onset.worst_route("latency" if reason == "latency" else "errors",
+                                  saturated=past_knee, wall=latency_wall)
     culprit = worst[0] if worst else None
-    bottleneck = _bottleneck_hint(worst[1], reason, sat) if worst else None
+    # A culprit the users queued on is a ceiling, whatever the hint would say.
+    hint_sat = sat if sat.saturated else routes.get(culprit, sat)
+    hint_reason = "errors" if reason == "errors" else "latency"
+    bottleneck = _bottleneck_hint(worst[1], hint_reason, hint_sat) if worst else None
     marginal = (onset.users == max_tested and reason == "errors"
-                and onset.error_rate < 2 * error_threshold)
-    low, high, stable = confidence_band(
+                and (breaches[0].severity < 2 if breaches
+                     else onset.error_rate < 2 * error_threshold))
+    low, high, stable = band(
         stages, latency_wall=latency_wall, error_threshold=error_threshold,
         survives_point=survives, max_tested=max_tested)
+    changepoint = onset_changepoint(stages, onset, error_threshold=error_threshold)
     return RunReport(
         stages=stages,
         survives_users=survives,
@@ -658,4 +1384,13 @@ def analyze(stages: list[StageResult], *, latency_wall: float,
         peak_rps=sat.peak_rps,
         marginal=marginal,
         survives_low=low, survives_high=high, stable=stable,
+        resamples=max(0, bootstrap),
+        littles_residuals=residuals,
+        routes=routes,
+        saturated_route=saturated_route,
+        usl=usl,
+        slos=slos,
+        slo_breaches=breaches,
+        slo_unmet=unmet,
+        changepoint=changepoint,
     )
@@ -1,22 +1,45 @@
 """Main CLI entry point for PreScale."""
 
+import importlib
+
 import click
 
 from prescale_cli import __version__
-from prescale_cli.commands import (
-    audit,
-    compare,
-    history,
-    investigate,
-    mcp,
-    profiles,
-    run,
-    schema,
-    show,
-)
-
-
-@click.group()
+
+
+class LazyGroup(click.Group):
+    """A click group that imports each subcommand's module only when that
+    command is looked up, so `prescale history --json` doesn't pay for httpx,
+    the load engine and the HTML report just to list saved runs."""
+
+    def __init__(self, *args, lazy_commands: dict[str, str], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands  # name -> "module.attr"
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, name: str) -> click.Command | None:
+        if name not in self.commands and name in self.lazy_commands:
+            module, attr = self.lazy_commands[name].rsplit(".", 1)
+            self.add_command(getattr(importlib.import_module(module), attr), name)
+        return super().get_command(ctx, name)
+
+
+@click.group(cls=LazyGroup, lazy_commands={
+    "run": "prescale_cli.commands.run.run",
+    "investigate": "prescale_cli.commands.investigate.investigate",
+    "audit": "prescale_cli.commands.audit.audit",
+    "history": "prescale_cli.commands.history.history",
+    "gc": "prescale_cli.commands.gc.gc",
+    "compare": "prescale_cli.commands.compare.compare",
+    "bisect": "prescale_cli.commands.bisect.bisect",
+    "profiles": "prescale_cli.commands.profiles.profiles",
+    "report": "prescale_cli.commands.report.report",
+    "show": "prescale_cli.commands.show.show",
+    "schema": "prescale_cli.commands.schema.schema",
+    "mcp": "prescale_cli.commands.mcp.mcp",
+})
 @click.version_option(version=__version__, prog_name="prescale")
 def cli() -> None:
     """PreScale - launch-readiness load testing for developers.
@@ -31,24 +54,16 @@ def cli() -> None:
         prescale investigate http://localhost:8000  # ...and why, plus how to fix it
         prescale audit https://myapp.com            # static scaling-hygiene check
         prescale history                            # list saved runs
+        prescale gc                                 # prune and compact old runs
         prescale compare                            # capacity diff of the last two runs
+        prescale report --runs history:20           # overlay runs: capacity over commits
+        prescale bisect --good v1.2 --start CMD URL # find the commit that cost capacity
         prescale profiles                           # launch scenarios for --profile
         prescale show                               # re-render the latest saved run
         prescale mcp                                # MCP server for coding agents
     """
 
 
-cli.add_command(run.run)
-cli.add_command(investigate.investigate)
-cli.add_command(audit.audit)
-cli.add_command(history.history)
-cli.add_command(compare.compare)
-cli.add_command(profiles.profiles)
-cli.add_command(show.show)
-cli.add_command(schema.schema)
-cli.add_command(mcp.mcp)
-
-
 def main() -> None:
     """Main entry point."""
     cli()
@@ -6,7 +6,7 @@ Tool docstrings are the agent-facing contract — keep them clear and concise.
 
 from __future__ import annotations
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
 from prescale_cli import mcp_tools
 from prescale_cli.result import schema_json
@@ -17,25 +17,30 @@ def build_server(allow: set[str]) -> FastMCP:
 
     @server.tool()
     async def load_test(url: str, max_users: int = 100, paths: list[str] | None = None,
-                        stage_seconds: float = 3.0, max_rps: float | None = None) -> dict:
+                        stage_seconds: float = 3.0, max_rps: float | None = None,
+                        *, ctx: Context) -> dict:
         """Load-test a URL and return a plain-English readiness verdict — what breaks
         first and at what concurrency. Point it at the app's local or preview URL.
         Returns a compact summary (verdict, survives band, culprit route, run id);
         call get_run(id) for the full breakdown. Only local hosts are allowed unless
         the host was allowlisted when this server was started."""
-        return await mcp_tools.run_summary(
-            url, allow=allow, max_users=max_users, paths=tuple(paths or ()),
-            stage_seconds=stage_seconds, max_rps=max_rps)
+        # Progress goes to the client as MCP log notifications, one NDJSON line each.
+        async with mcp_tools.notifying(ctx.info) as events:
+            return await mcp_tools.run_summary(
+                url, allow=allow, max_users=max_users, paths=tuple(paths or ()),
+                stage_seconds=stage_seconds, max_rps=max_rps, events=events)
 
     @server.tool()
     async def investigate(url: str, max_users: int = 100, paths: list[str] | None = None,
-                          stage_seconds: float = 3.0, max_rps: float | None = None) -> dict:
+                          stage_seconds: float = 3.0, max_rps: float | None = None,
+                          *, ctx: Context) -> dict:
         """Load-test a URL, then probe the route that breaks first to diagnose WHY —
         a bottleneck class with confidence and evidence — and prescribe a fix. Returns
         the verdict plus an `investigation` block. Local hosts only unless allowlisted."""
-        return await mcp_tools.investigate_summary(
-            url, allow=allow, max_users=max_users, paths=tuple(paths or ()),
-            stage_seconds=stage_seconds, max_rps=max_rps)
+        async with mcp_tools.notifying(ctx.info) as events:
+            return await mcp_tools.investigate_summary(
+                url, allow=allow, max_users=max_users, paths=tuple(paths or ()),
+                stage_seconds=stage_seconds, max_rps=max_rps, events=events)
 
     @server.tool()
     async def audit(url: str) -> dict:
@@ -45,9 +50,10 @@ def build_server(allow: set[str]) -> FastMCP:
         return await mcp_tools.audit_summary(url)
 
     @server.tool()
-    async def list_runs() -> list[dict]:
-        """List saved PreScale runs (newest first) with their verdict one-liners."""
-        return mcp_tools.list_runs()
+    async def list_runs(host: str | None = None, branch: str | None = None) -> list[dict]:
+        """List saved PreScale runs (newest first) with their verdict one-liners,
+        optionally only those against one host or recorded on one git branch."""
+        return mcp_tools.list_runs(host=host, branch=branch)
 
     @server.tool()
     async def get_run(run_id: str) -> dict:
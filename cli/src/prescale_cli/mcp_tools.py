@@ -8,11 +8,15 @@ lives in `mcp_server.py`.
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from urllib.parse import urlparse
 
 import httpx
 
 from prescale_cli.audit import run_audit
+from prescale_cli.events import EventStream
 from prescale_cli.investigate import investigate
 from prescale_cli.loadtest import analyze, build_targets, default_levels, run_loadtest
 from prescale_cli.result import build_result, list_results, load_result, write_result
@@ -57,6 +61,26 @@ def _gate(url: str, allow: set[str]) -> str:
     return host
 
 
+@asynccontextmanager
+async def notifying(send: Callable[[str], Awaitable[None]]) -> AsyncIterator[EventStream]:
+    """An EventStream whose lines go to the async `send` (an MCP log notification)
+    one at a time, in order, from a single queue. Leaving the block drains the
+    queue, so every event — the verdict included — is sent before the tool
+    returns its response."""
+    queue: asyncio.Queue[str | None] = asyncio.Queue()
+
+    async def drain() -> None:
+        while (line := await queue.get()) is not None:
+            await send(line)
+
+    sender = asyncio.create_task(drain())
+    try:
+        yield EventStream(queue.put_nowait)
+    finally:
+        queue.put_nowait(None)
+        await sender
+
+
 def summarize_result(result: dict) -> dict:
     """A compact, token-lean projection of a Result for an agent tool reply."""
     v = result["verdict"]
@@ -97,9 +121,11 @@ async def run_summary(url: str, *, allow: set[str], max_users: int = MCP_DEFAULT
                       paths: tuple[str, ...] = (),
                       stage_seconds: float = MCP_DEFAULT_STAGE_SECONDS,
                       max_rps: float | None = None, store=None,
-                      transport: httpx.AsyncBaseTransport | None = None) -> dict:
+                      transport: httpx.AsyncBaseTransport | None = None,
+                      events: EventStream | None = None) -> dict:
     """Load-test `url` (host must be local or allowlisted), persist the Result,
-    and return a compact summary. Non-local targets get a default rate ceiling."""
+    and return a compact summary. Non-local targets get a default rate ceiling.
+    `events`, if given, gets the same progress events as `run --events ndjson`."""
     host = _gate(url, allow)
     if max_rps is None and host not in _LOCAL_HOSTS:
         max_rps = MCP_DEFAULT_MAX_RPS  # safety ceiling for non-local hosts
@@ -109,6 +135,8 @@ async def run_summary(url: str, *, allow: set[str], max_users: int = MCP_DEFAULT
     stages, warning = await run_loadtest(
         targets, levels=levels, stage_seconds=stage_seconds, max_rps=max_rps,
         transport=transport,
+        progress_cb=events.starting if events else None,
+        on_stage=events.finished if events else None,
     )
     report = analyze(stages, latency_wall=2.0, error_threshold=0.02,
                      rate_capped=max_rps is not None)
@@ -119,6 +147,8 @@ async def run_summary(url: str, *, allow: set[str], max_users: int = MCP_DEFAULT
     }
     result = build_result(report, url=url, targets=targets, config=config, warning=warning)
     write_result(result, store=store)
+    if events:
+        events.verdict(result)
     return summarize_result(result)
 
 
@@ -127,7 +157,8 @@ async def investigate_summary(url: str, *, allow: set[str],
                               paths: tuple[str, ...] = (),
                               stage_seconds: float = MCP_DEFAULT_STAGE_SECONDS,
                               max_rps: float | None = None, store=None,
-                              transport: httpx.AsyncBaseTransport | None = None) -> dict:
+                              transport: httpx.AsyncBaseTransport | None = None,
+                              events: EventStream | None = None) -> dict:
     """Load-test, find the culprit, probe it, and return the verdict summary plus the
     `investigation` block (bottleneck class, confidence, evidence, fix)."""
     host = _gate(url, allow)
@@ -135,7 +166,12 @@ async def investigate_summary(url: str, *, allow: set[str],
         max_rps = MCP_DEFAULT_MAX_RPS
     result = await investigate(
         url, max_users=max_users, paths=tuple(paths), stage_seconds=stage_seconds,
-        max_rps=max_rps, store=store, transport=transport)
+        max_rps=max_rps, store=store, transport=transport,
+        progress_cb=events.starting if events else None,
+        on_stage=events.finished if events else None,
+        on_probe=events.probing if events else None)
+    if events:
+        events.verdict(result)
     summary = summarize_result(result)
     summary["investigation"] = result.get("investigation")
     return summary
@@ -156,9 +192,9 @@ async def audit_summary(url: str) -> dict:
     }
 
 
-def list_runs(store=None) -> list[dict]:
-    """Saved-run summaries, newest first."""
-    return list_results(store=store)
+def list_runs(store=None, host: str | None = None, branch: str | None = None) -> list[dict]:
+    """Saved-run summaries, newest first, optionally for one host or branch."""
+    return list_results(store=store, host=host, branch=branch)
 
 
 def get_run(run_id: str, store=None) -> dict:
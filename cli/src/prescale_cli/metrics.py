@@ -0,0 +1,169 @@
+"""OpenMetrics endpoint for a run in progress — `run --metrics-port`.
+
+Served from the load generator's own event loop, so a scrape never races the
+workers: it reads the in-flight `_Sink` (the same counters, running sums and
+latency histogram the run already keeps) plus running totals folded in from
+finished stages, and renders them on request. Nothing is added to the request
+path — no locks, no per-request allocations — and a scrape costs the same an
+hour into a soak as a second in: it never rescans the stage's ticks.
+
+    prescale_users                        gauge      VUs in the level being measured
+    prescale_requests_total               counter    by route and HTTP status
+    prescale_errors_total                 counter    by route and kind (5xx, timeout, …)
+    prescale_request_duration_seconds     histogram  successful requests, all routes
+    prescale_loop_lag_seconds             gauge      generator event-loop lag, last sample
+    prescale_loop_lag_max_seconds         gauge      worst lag seen this run
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from prescale_cli.loadtest import LatencyHistogram, LoadError
+
+if TYPE_CHECKING:
+    from prescale_cli.loadtest import _Sink
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Prometheus' default latency buckets (seconds).
+_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_LAG_INTERVAL = 0.25  # seconds between event-loop lag samples
+
+
+def _label(value: object) -> str:
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+class MetricsExporter:
+    """Running totals for one run. `watch(users, sink)` is the `on_live` hook:
+    it folds the previous stage's sink into the totals and starts reading the
+    new one."""
+
+    def __init__(self) -> None:
+        self.users = 0
+        self.loop_lag = 0.0
+        self.loop_lag_max = 0.0
+        self._sink: _Sink | None = None
+        self._status: dict[tuple[str, int], int] = {}
+        self._errors: dict[tuple[str, str], int] = {}
+        self._latency = LatencyHistogram()
+        self._latency_sum = 0.0
+
+    def watch(self, users: int, sink: _Sink) -> None:
+        if self._sink is not None and self._sink is not sink:
+            self._fold(self._sink, self._status, self._errors, self._latency)
+            self._latency_sum += self._sink.lat_sum
+        self.users = users
+        self._sink = sink
+
+    @staticmethod
+    def _fold(sink: _Sink, status: dict, errors: dict, latency: LatencyHistogram) -> None:
+        for route, stat in sink.routes.items():
+            for code, n in stat.status_counts.items():
+                status[route, code] = status.get((route, code), 0) + n
+            for kind, n in stat.error_kinds.items():
+                errors[route, kind] = errors.get((route, kind), 0) + n
+        latency.merge(sink.latency)
+
+    def render(self) -> str:
+        """The exposition, finished stages plus the one in flight."""
+        status, errors = dict(self._status), dict(self._errors)
+        latency = LatencyHistogram()
+        latency.merge(self._latency)
+        latency_sum = self._latency_sum
+        if self._sink is not None:
+            self._fold(self._sink, status, errors, latency)
+            latency_sum += self._sink.lat_sum
+
+        lines = [
+            "# TYPE prescale_users gauge",
+            "# HELP prescale_users Virtual users in the level being measured.",
+            f"prescale_users {self.users}",
+            "# TYPE prescale_requests counter",
+            "# HELP prescale_requests Requests that got an HTTP response, by route and status.",
+        ]
+        lines += [f'prescale_requests_total{{route="{_label(route)}",status="{code}"}} {n}'
+                  for (route, code), n in sorted(status.items())]
+        lines += [
+            "# TYPE prescale_errors counter",
+            "# HELP prescale_errors Failed requests, by route and kind.",
+        ]
+        lines += [f'prescale_errors_total{{route="{_label(route)}",kind="{_label(kind)}"}} {n}'
+                  for (route, kind), n in sorted(errors.items())]
+        lines += [
+            "# TYPE prescale_request_duration_seconds histogram",
+            "# HELP prescale_request_duration_seconds Latency of successful requests.",
+            "# UNIT prescale_request_duration_seconds seconds",
+        ]
+        buckets, seen = latency.buckets(), 0
+        i = 0
+        for bound in _BUCKETS:
+            while i < len(buckets) and buckets[i][0] <= bound:
+                seen += buckets[i][1]
+                i += 1
+            lines.append(f'prescale_request_duration_seconds_bucket{{le="{bound}"}} {seen}')
+        lines += [
+            f'prescale_request_duration_seconds_bucket{{le="+Inf"}} {latency.count}',
+            f"prescale_request_duration_seconds_count {latency.count}",
+            f"prescale_request_duration_seconds_sum {latency_sum:.6f}",
+            "# TYPE prescale_loop_lag_seconds gauge",
+            "# HELP prescale_loop_lag_seconds How late the load generator's event loop "
+            "woke up, last sample.",
+            "# UNIT prescale_loop_lag_seconds seconds",
+            f"prescale_loop_lag_seconds {self.loop_lag:.6f}",
+            "# TYPE prescale_loop_lag_max_seconds gauge",
+            "# HELP prescale_loop_lag_max_seconds Worst event-loop lag seen this run.",
+            "# UNIT prescale_loop_lag_max_seconds seconds",
+            f"prescale_loop_lag_max_seconds {self.loop_lag_max:.6f}",
+            "# EOF",
+        ]
+        return "\n".join(lines) + "\n"
+
+    async def _track_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            before = loop.time()
+            await asyncio.sleep(_LAG_INTERVAL)
+            self.loop_lag = max(0.0, loop.time() - before - _LAG_INTERVAL)
+            self.loop_lag_max = max(self.loop_lag_max, self.loop_lag)
+
+    async def _handle(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await reader.readline()
+            while (await reader.readline()).strip():
+                pass  # headers: nothing we need
+            parts = request.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                body, head = self.render().encode(), f"200 OK\r\nContent-Type: {CONTENT_TYPE}"
+            else:
+                body, head = b"not found\n", "404 Not Found\r\nContent-Type: text/plain"
+            writer.write(f"HTTP/1.1 {head}\r\nContent-Length: {len(body)}\r\n"
+                         "Connection: close\r\n\r\n".encode() + body)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+@asynccontextmanager
+async def metrics_server(port: int, host: str = "127.0.0.1") -> AsyncIterator[MetricsExporter]:
+    """Serve `/metrics` on `host:port` for the life of the block."""
+    exporter = MetricsExporter()
+    try:
+        server = await asyncio.start_server(exporter._handle, host, port)
+    except OSError as exc:
+        raise LoadError(f"Couldn't serve metrics on {host}:{port}: {exc.strerror or exc}") \
+            from exc
+    lag = asyncio.create_task(exporter._track_lag())
+    try:
+        yield exporter
+    finally:
+        lag.cancel()
+        server.close()
+        await server.wait_closed()
@@ -0,0 +1,221 @@
+"""Several saved runs on one page — `prescale report --runs`.
+
+Capacity over commits, p95 per level across runs, and route-level deltas from
+the oldest run to the newest, rendered as one self-contained HTML file in the
+same style as the single-run report.
+
+Runs are picked from the store index and read one at a time: each is boiled
+down to its verdict facts and a per-level series (a few numbers per level), and
+its stage arrays are dropped before the next is loaded. Only the oldest and the
+newest stay whole, for `compare_routes`, so a hundred-run overlay holds two
+Results in memory, not a hundred.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from prescale_cli import __version__
+from prescale_cli.compare import compare_routes, parse_history, run_facts
+from prescale_cli.render import TOP_ROUTES
+from prescale_cli.report import CSS, MIDDOT, RARROW, esc, fmt_ms, svg_polyline, svg_text
+from prescale_cli.result import list_results, load_header, load_result
+
+
+@dataclass
+class RunDigest:
+    """What the overlay draws of one run: `facts` as `compare` reads them, and
+    (users, p95 ms, req/s, error rate) per level."""
+
+    facts: dict
+    latency_wall_s: float
+    levels: list[tuple[int, float, float, float]] = field(default_factory=list)
+
+
+@dataclass
+class Overlay:
+    runs: list[RunDigest]  # oldest first
+    route_deltas: list[dict]  # compare_routes(oldest, newest)
+
+
+def select_runs(operands: list[str], *, store=None, host: str | None = None,
+                branch: str | None = None) -> list[str]:
+    """Run ids for `--runs`: ids or unique prefixes, and `history:N` for the
+    newest N in the index (narrowed by `host` / `branch`). Oldest first, no
+    repeats. Raises ValueError on a bad `history:N`; ResultError on an unknown id."""
+    ids: list[str] = []
+    for operand in operands:
+        n = parse_history(operand)
+        if n is not None:
+            ids += [r["id"] for r in list_results(store=store, host=host, branch=branch)[:n]]
+        else:
+            ids.append(load_header(operand, store=store)["id"])
+    return sorted(set(ids))  # ids lead with their UTC timestamp
+
+
+def digest(result: dict) -> RunDigest:
+    return RunDigest(
+        facts=run_facts(result),
+        latency_wall_s=(result.get("config") or {}).get("latency_wall_s", 2.0),
+        levels=[(s["users"], s["p95_ms"], s["rps"], s["error_rate"])
+                for s in result.get("stages") or []],
+    )
+
+
+def build_overlay(ids: list[str], *, store=None) -> Overlay:
+    """Digest every run in `ids` (oldest first), then diff the ends route by route."""
+    runs, first, last = [], None, None
+    for i, run_id in enumerate(ids):
+        result = load_result(run_id, store=store)
+        runs.append(digest(result))
+        if i == 0:
+            first = result
+        last = result
+    deltas = compare_routes(first, last) if len(ids) > 1 else []
+    return Overlay(runs=runs, route_deltas=deltas)
+
+
+def _label(run: RunDigest) -> str:
+    return run.facts.get("commit") or (run.facts.get("created_at") or "")[:10]
+
+
+def _capacity_chart(runs: list[RunDigest]) -> str:
+    w, h, pl, pr, pt, pb = 600, 180, 40, 40, 24, 24
+    plot_w, plot_h = w - pl - pr, h - pt - pb
+    ymax = max(max(r.facts["survives_high"] or r.facts["survives_users"] for r in runs),
+               1) * 1.15
+    n = len(runs)
+
+    def x(i: int) -> float:
+        return pl + plot_w * (i / (n - 1) if n > 1 else 0.5)
+
+    def y(v: float) -> float:
+        return h - pb - plot_h * v / ymax
+
+    parts = [f'<line x1="{pl}" y1="{h - pb}" x2="{w - pr}" y2="{h - pb}" '
+             'stroke="#23252a" stroke-width="1"/>']
+    for i, r in enumerate(runs):
+        lo, hi = r.facts["survives_low"], r.facts["survives_high"]
+        if lo is not None and hi is not None and lo != hi:
+            parts.append(f'<line x1="{x(i):.1f}" y1="{y(lo):.1f}" x2="{x(i):.1f}" '
+                         f'y2="{y(hi):.1f}" stroke="#5e6ad2" stroke-width="3" '
+                         'opacity=".3" stroke-linecap="round"/>')
+    parts.append(svg_polyline([(x(i), y(r.facts["survives_users"])) for i, r in enumerate(runs)],
+                           "#5e6ad2"))
+    every = max(1, n // 8)  # a label per point would collide past a handful of runs
+    for i, r in enumerate(runs):
+        parts.append(f'<circle cx="{x(i):.1f}" cy="{y(r.facts["survives_users"]):.1f}" r="3" '
+                     'fill="#5e6ad2"/>')
+        if i % every == 0 or i == n - 1:
+            parts.append(svg_text(x(i), h - 8, _label(r)))
+    newest = runs[-1].facts["survives_users"]
+    parts.append(svg_text(x(n - 1) + 6, y(newest) + 3, str(newest), "#f7f8f8", "start"))
+    return (f'<svg viewBox="0 0 {w} {h}" preserveAspectRatio="none">'
+            f'{"".join(parts)}</svg>')
+
+
+def _levels_chart(runs: list[RunDigest]) -> str:
+    series = [r for r in runs if r.levels]
+    if not series:
+        return ""
+    w, h, pl, pr, pt, pb = 600, 180, 40, 40, 24, 24
+    plot_w, plot_h = w - pl - pr, h - pt - pb
+    wall_ms = runs[-1].latency_wall_s * 1000
+    xmax = max(u for r in series for u, *_ in r.levels) or 1
+    ymax = max(max(p for r in series for _, p, *_ in r.levels), wall_ms) * 1.15 or 1.0
+
+    def xy(users: int, p95: float) -> tuple[float, float]:
+        return pl + plot_w * users / xmax, h - pb - plot_h * p95 / ymax
+
+    wall_y = h - pb - plot_h * wall_ms / ymax
+    parts = [
+        f'<line x1="{pl}" y1="{h - pb}" x2="{w - pr}" y2="{h - pb}" stroke="#23252a" '
+        'stroke-width="1"/>',
+        f'<line x1="{pl}" y1="{wall_y:.0f}" x2="{w - pr}" y2="{wall_y:.0f}" stroke="#eb5757" '
+        'stroke-width="1" stroke-dasharray="4 4" opacity=".55"/>',
+        svg_text(pl + 4, wall_y - 4, f"latency wall {MIDDOT} {runs[-1].latency_wall_s:g}s",
+              "#eb5757", "start", 9),
+    ]
+    # Older runs fade; the newest is drawn last, on top, in the accent colour.
+    for i, r in enumerate(series):
+        newest = i == len(series) - 1
+        line = svg_polyline([xy(u, p) for u, p, *_ in r.levels],
+                         "#5e6ad2" if newest else "#8a8f98", 2 if newest else 1)
+        if not newest:
+            line = line.replace("/>", f' opacity="{0.15 + 0.5 * i / len(series):.2f}"/>')
+        parts.append(line)
+    parts += [svg_text(pl + plot_w * f, h - 8, f"{xmax * f:.0f} users" if f else "0")
+              for f in (0, 0.5, 1)]
+    return (f'<svg viewBox="0 0 {w} {h}" preserveAspectRatio="none">'
+            f'{"".join(parts)}</svg>')
+
+
+def _runs_table(runs: list[RunDigest]) -> str:
+    rows = "".join(
+        f"<tr><td>{esc(_label(r))}</td><td>{esc((r.facts.get('created_at') or '')[:16])}"
+        f"</td><td>{r.facts['survives_users']}</td><td>{r.facts['peak_rps']:.0f}</td>"
+        f"<td>{r.facts['onset_users'] if r.facts['onset_users'] is not None else '—'}</td>"
+        "</tr>"
+        for r in reversed(runs)
+    )
+    return ("<table><thead><tr><th>Run</th><th>When</th><th>Survives</th><th>Peak req/s</th>"
+            f"<th>Breaks at</th></tr></thead><tbody>{rows}</tbody></table>")
+
+
+def _delta_rows(deltas: list[dict]) -> str:
+    return "".join(
+        f"<tr><td>{esc(d['route'])}</td><td>{d['users']}</td>"
+        f"<td>{fmt_ms(d['p95_ms'][0])} {RARROW} {fmt_ms(d['p95_ms'][1])}</td>"
+        f"<td>{d['error_rate'][0]:.1%} {RARROW} {d['error_rate'][1]:.1%}</td>"
+        f"<td>{esc(', '.join(d['reasons']))}</td></tr>"
+        for d in deltas
+    )
+
+
+def _deltas(overlay: Overlay) -> str:
+    deltas = overlay.route_deltas
+    first, last = overlay.runs[0], overlay.runs[-1]
+    title = (f"Route regressions {MIDDOT} {esc(_label(first))} {RARROW} "
+             f"{esc(_label(last))}")
+    if not deltas:
+        return (f'<div class="section"><h3>{title}</h3><div class="cause"><p>No route got '
+                "significantly slower or more error-prone at any level both runs tested."
+                "</p></div></div>")
+    head = ("<table><thead><tr><th>Route</th><th>Users</th><th>p95</th><th>Errors</th>"
+            "<th>Why</th></tr></thead><tbody>")
+    rest = deltas[TOP_ROUTES:]
+    more = (f"<details><summary>+{len(rest)} more</summary>{head}{_delta_rows(rest)}"
+            "</tbody></table></details>" if rest else "")
+    return (f'<div class="section"><h3>{title}</h3><div class="panel clip">{head}'
+            f"{_delta_rows(deltas[:TOP_ROUTES])}</tbody></table>{more}</div></div>")
+
+
+def render_overlay_html(overlay: Overlay) -> str:
+    runs = overlay.runs
+    first, last = runs[0].facts, runs[-1].facts
+    delta = last["survives_users"] - first["survives_users"]
+    pct = f" ({delta / first['survives_users']:+.0%})" if first["survives_users"] else ""
+    return f"""<!doctype html>
+<html lang="en"><head><meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>PreScale — Capacity across runs</title>
+<style>{CSS}</style></head>
+<body><div class="wrap">
+  <div class="topbar">
+    <div class="brand"><span class="mark"></span> PreScale</div>
+    <div class="meta">prescale report {MIDDOT} {len(runs)} runs</div>
+  </div>
+  <h1>Capacity across runs</h1>
+  <div class="sub"><span class="url">{esc(last.get("target") or "")}</span>
+    <span>{MIDDOT} survives {first["survives_users"]} {RARROW} {last["survives_users"]} users{pct}
+    </span></div>
+  <div class="section"><h3>Capacity over commits</h3>
+    <div class="panel clip"><div class="chart">{_capacity_chart(runs)}</div>
+      {_runs_table(runs)}</div></div>
+  <div class="section"><h3>p95 per level {MIDDOT} newest highlighted</h3>
+    <div class="panel clip"><div class="chart">{_levels_chart(runs)}</div></div></div>
+  {_deltas(overlay)}
+  <footer><span>Generated by prescale {__version__}</span>
+    <span>{esc(runs[0].facts["id"])} {RARROW} {esc(runs[-1].facts["id"])}</span></footer>
+</div></body></html>
+"""
@@ -14,6 +14,7 @@ class Profile:
     label: str
     peak_users: int
     think_time_s: float
+    think_dist: str = "exponential"  # real users don't pause in lockstep
 
 
 PROFILES: dict[str, Profile] = {
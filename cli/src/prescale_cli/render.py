@@ -1,18 +1,39 @@
 """Terminal rendering of a Result — shared by `run` and `show` so both print
-identically from the same stored shape, with no need for raw per-request data."""
+identically from the same stored shape, with no need for raw per-request data.
+
+The plain-English summary helpers are also used by the HTML report and the MCP
+tools, so rich is only imported once something is actually printed."""
 
 from __future__ import annotations
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+import functools
+import heapq
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Route tables show this many of the worst routes; a sitemap or log-import run
+# can have hundreds, and nobody reads past the first screen.
+TOP_ROUTES = 15
 
-console = Console()
 
+@functools.cache
+def _console() -> Console:
+    from rich.console import Console
 
-def render_terminal(result: dict, *, show_ramp: bool = True) -> None:
+    return Console()
+
+
+def render_terminal(result: dict, *, show_ramp: bool = True,
+                    all_routes: bool = False) -> None:
     """Print the load-ramp table and readiness verdict for a Result. Set
-    `show_ramp=False` when a live ramp table has already been drawn (a TTY run)."""
+    `show_ramp=False` when a live ramp table has already been drawn (a TTY run);
+    `all_routes` lists every route instead of the worst `TOP_ROUTES`."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _console()
     verdict = result["verdict"]
     stages = result["stages"]
     warning = result.get("warning")
@@ -59,7 +80,10 @@ def render_terminal(result: dict, *, show_ramp: bool = True) -> None:
                     f"{_u(verdict['survives_users'])}.")
 
     lines = [f"[bold]Scale readiness:[/bold] {emoji} {headline}"]
-    if onset_users is not None:
+    slo = verdict.get("slo")
+    if slo is not None:
+        lines += [f"SLO  {line}" for line in slo_summary(slo)]
+    elif onset_users is not None:
         culprit = f"{verdict['culprit_route']}  " if (multi and verdict["culprit_route"]) else ""
         if verdict["onset_reason"] == "latency":
             lines.append(f"Latency wall  {culprit}p95 crosses "
@@ -67,10 +91,21 @@ def render_terminal(result: dict, *, show_ramp: bool = True) -> None:
         else:
             lines.append(f"First failure  {culprit}errors climb at "
                          f"~{onset_users} {_u(onset_users)}.")
+    if verdict.get("changepoint"):
+        lines.append(f"Degradation  {changepoint_summary(verdict['changepoint'])}")
     if verdict["saturated"]:
         lines.append(f"Throughput  plateaued ~{verdict['peak_rps']:.0f} req/s around "
                      f"{verdict['saturation_users']} {_u(verdict['saturation_users'])} "
                      "(capacity ceiling).")
+    if verdict.get("saturated_route") and multi:
+        lines.append(f"Throughput  {route_ceiling(verdict)}")
+    projection = scalability_summary(verdict.get("scalability"))
+    if projection:
+        lines.append(f"Projection  {projection}")
+    if verdict.get("spike"):
+        lines.append(f"Spike  {spike_summary(verdict['spike'])}")
+    if verdict.get("soak"):
+        lines.append(f"Soak  {soak_summary(verdict['soak'])}")
     if verdict["bottleneck"]:
         lines.append(f"Likely cause  {verdict['bottleneck']}")
     if verdict["marginal"]:
@@ -92,40 +127,89 @@ def render_terminal(result: dict, *, show_ramp: bool = True) -> None:
     console.print(Panel("\n".join(lines), title="📈 Readiness report", border_style=color))
 
     if multi and stages:
-        _render_routes(result)
+        _render_routes(result, all_routes=all_routes)
 
 
-def _render_routes(result: dict) -> None:
-    verdict = result["verdict"]
+def decisive_stage(result: dict) -> dict | None:
+    """The stage per-route views describe: the onset level, else the last."""
     stages = result["stages"]
-    decisive = next((s for s in stages if s["users"] == verdict["onset_users"]), stages[-1])
+    if not stages:
+        return None
+    onset_users = result["verdict"]["onset_users"]
+    return next((s for s in stages if s["users"] == onset_users), stages[-1])
+
+
+def _badness(item: tuple[str, dict]) -> tuple[float, float]:
+    return item[1]["error_rate"], item[1]["p95_ms"]
+
+
+def worst_routes(stage: dict, k: int | None = None) -> list[tuple[str, dict]]:
+    """A stage's (label, route) pairs worst-first — error rate, then p95. With
+    `k`, only the worst `k`, picked with a heap instead of sorting them all."""
+    routes = stage["routes"]
+    if k is None or k >= len(routes):
+        return sorted(routes.items(), key=_badness, reverse=True)
+    return heapq.nlargest(k, routes.items(), key=_badness)
+
+
+def shown_routes(stage: dict, culprit: str | None,
+                 k: int | None = TOP_ROUTES) -> list[tuple[str, dict]]:
+    """The routes a table lists: the worst `k`, plus the verdict's culprit at
+    the end if it didn't make the cut — the table must never hide it."""
+    shown = worst_routes(stage, k)
+    routes = stage["routes"]
+    if culprit in routes and all(label != culprit for label, _ in shown):
+        shown.append((culprit, routes[culprit]))
+    return shown
+
+
+def _render_routes(result: dict, *, all_routes: bool = False) -> None:
+    from rich.table import Table
+
+    console = _console()
+    verdict = result["verdict"]
+    decisive = decisive_stage(result)
+    routes = decisive["routes"]
+    ranked = shown_routes(decisive, verdict["culprit_route"], None if all_routes else TOP_ROUTES)
+    caption = None
+    if len(ranked) < len(routes):
+        shown = {label for label, _ in ranked}
+        rest = [r for label, r in routes.items() if label not in shown]
+        caption = (f"+{len(rest)} more, none over "
+                   f"{max(r['error_rate'] for r in rest):.0%} errors or "
+                   f"{_ms(max(r['p95_ms'] for r in rest))} p95 · "
+                   "prescale show --all-routes lists them")
     table = Table(show_header=True, header_style="bold magenta",
-                  title=f"Per route @ {decisive['users']} users")
+                  title=f"Per route @ {decisive['users']} users", caption=caption)
     table.add_column("Route")
     table.add_column("Req/s", justify="right")
     table.add_column("p95", justify="right")
     table.add_column("Errors", justify="right")
+    knees = verdict.get("routes") or {}
+    if any(k["saturated"] for k in knees.values()):
+        table.add_column("Plateaus", justify="right")
 
-    ranked = sorted(decisive["routes"].items(),
-                    key=lambda kv: (kv[1]["error_rate"], kv[1]["p95_ms"]), reverse=True)
     for label, stat in ranked:
         is_culprit = label == verdict["culprit_route"]
         shown = f"[bold red]{label}[/bold red]" if is_culprit else label
-        table.add_row(
-            shown,
-            f"{stat['rps']:.0f}",
-            _ms(stat["p95_ms"]),
-            _err(stat["error_rate"]),
-        )
+        cells = [shown, f"{stat['rps']:.0f}", _ms(stat["p95_ms"]), _err(stat["error_rate"])]
+        if len(table.columns) > len(cells):
+            knee = knees.get(label, {})
+            cells.append(f"~{knee['saturation_users']} users" if knee.get("saturated")
+                         else "[dim]—[/dim]")
+        table.add_row(*cells)
     console.print()
     console.print(table)
 
 
 def render_investigation(result: dict) -> None:
     """Print the Diagnosis panel for an investigated Result (no-op if absent)."""
+    from rich.panel import Panel
+
     inv = result.get("investigation")
     if not inv:
         return
+    console = _console()
     color = {"high": "red", "medium": "yellow", "low": "blue"}.get(inv["confidence"], "yellow")
     lines = [
         f"[bold]Likely cause:[/bold] {inv['summary']}",
@@ -144,6 +228,127 @@ def render_investigation(result: dict) -> None:
     console.print(Panel("\n".join(lines), title="🔬 Diagnosis", border_style=color))
 
 
+def spike_summary(spike: dict) -> str:
+    """One plain-English line for a spike run's degrade / peak / recovery."""
+    head = f"{spike['spike_users']} users for {spike['spike_seconds']:g}s: "
+    if spike["time_to_degrade_s"] is None:
+        head += f"held within {spike['tolerance']:.0%} of baseline"
+    else:
+        head += f"degraded after {spike['time_to_degrade_s']}s"
+    peak = (f", p95 peaked {_ms(spike['peak_p95_ms'])} "
+            f"(baseline {_ms(spike['baseline_p95_ms'])})")
+    if spike["peak_error_rate"] > 0:
+        peak += f", errors peaked {spike['peak_error_rate']:.0%}"
+    if spike["recovered"]:
+        tail = f"; recovered {spike['time_to_recover_s']}s after it ended."
+    else:
+        tail = "; did not recover within the window."
+    return head + peak + tail
+
+
+def _slo_value(kind: str, value: float) -> str:
+    if kind == "errors":
+        return f"{value:.1%} errors"
+    if kind == "min_rps":
+        return f"{value:.0f} req/s"
+    return f"{kind} {_ms(value)}"
+
+
+def slo_summary(slo: dict) -> list[str]:
+    """Plain-English lines for the per-route SLOs that broke (or all held)."""
+    lines = []
+    breaches = slo["breaches"]
+    if breaches:
+        b = breaches[0]
+        if b["slo"] == "min_rps":
+            what = (f"{b['route']} fell to {_slo_value('min_rps', b['actual'])}, under "
+                    f"its {b['limit']:g} req/s floor")
+        else:
+            what = (f"{b['route']} {_slo_value(b['slo'], b['actual'])} broke its "
+                    f"{_slo_value(b['slo'], b['limit'])} limit")
+        more = f" (+{len(breaches) - 1} more)" if len(breaches) > 1 else ""
+        lines.append(f"{what} at ~{b['users']} {_u(b['users'])}{more}.")
+    else:
+        lines.append("every route held its own SLO.")
+    for u in slo.get("unmet", []):
+        lines.append(f"{u['route']} never reached its {u['limit']:g} req/s floor "
+                     f"(peaked {u['actual']:.0f} req/s).")
+    return lines
+
+
+def changepoint_summary(cp: dict) -> str:
+    """When inside a level latency or errors shifted, e.g. 'began 3.2s into the
+    150-user stage (mean latency 40ms → 900ms).'"""
+    if cp["metric"] == "errors":
+        shift = f"errors {cp['before']:.1%} → {cp['after']:.1%}"
+    else:
+        shift = f"mean latency {_ms(cp['before'])} → {_ms(cp['after'])}"
+    return (f"began {cp['offset_s']:.1f}s into the {cp['users']}-user stage "
+            f"({shift}).")
+
+
+def route_ceiling(verdict: dict) -> str:
+    """The route users piled up on once throughput stopped climbing."""
+    label = verdict["saturated_route"]
+    knee = verdict["routes"][label]
+    return (f"{label} topped out ~{knee['peak_rps']:.0f} req/s around "
+            f"{knee['saturation_users']} {_u(knee['saturation_users'])}; users added "
+            "past that queued on it (that route's ceiling).")
+
+
+_MIN_FIT_R2 = 0.8
+
+
+def scalability_summary(usl: dict | None) -> str | None:
+    """One line projecting the USL fit past the tested range, or None when the
+    fit is missing or too loose (r² < 0.8) to extrapolate from."""
+    if not usl or usl["r_squared"] < _MIN_FIT_R2:
+        return None
+
+    def rng(band: list) -> str:
+        lo, hi = band
+        return f" ({lo}–{hi})" if lo is not None and hi is not None and lo != hi else ""
+
+    parts = []
+    if usl["peak_users"] is not None:
+        parts.append(f"throughput peaks ~{usl['peak_rps']:.0f} req/s at "
+                     f"~{usl['peak_users']}{rng(usl['peak_users_band'])} users")
+    else:
+        parts.append("throughput keeps rising with load (no coherency peak)")
+    if usl["wall_users"] is not None:
+        parts.append(f"p95 would cross the wall near "
+                     f"~{usl['wall_users']}{rng(usl['wall_users_band'])} users")
+    return "; ".join(parts) + f" (USL fit, r²={usl['r_squared']:.2f})."
+
+
+def soak_summary(soak: dict) -> str:
+    """One plain-English line for a soak run's drift / leak trend tests."""
+    secs = soak["duration_s"]
+    span = (f"{secs / 3600:.1f}h" if secs >= 3600 else
+            f"{secs / 60:.0f}m" if secs >= 60 else f"{secs:.0f}s")
+    parts = []
+    for key, label, fmt in (("latency_p95_ms", "p95", "{:+.1f}ms/min"),
+                            ("error_rate", "errors", "{:+.2%}/min"),
+                            ("rss_bytes", "RSS", None),
+                            ("fds", "open FDs", "{:+.1f}/min")):
+        t = soak.get(key)
+        if not t:
+            continue
+        if not t["drifting"]:
+            if key in ("latency_p95_ms", "error_rate"):
+                parts.append(f"{label} steady")
+            continue
+        slope = (f"{t['slope_per_min'] / 2**20:+.1f}MB/min" if fmt is None
+                 else fmt.format(t["slope_per_min"]))
+        parts.append(f"{label} drifting {slope} (p={t['p_value']:.3f})")
+    if not parts:
+        parts.append("too few windows to test for drift")
+    line = f"{soak['users']} users for {span}: " + ", ".join(parts) + "."
+    if soak["leak_suspected"]:
+        line += " Possible leak in the watched process."
+    return line
+
+
 def _band(verdict: dict) -> str:
     conf = verdict.get("confidence") or {}
     lo, hi = conf.get("survives_low"), conf.get("survives_high")
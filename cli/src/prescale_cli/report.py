@@ -1,16 +1,32 @@
 """Self-contained HTML readiness report for `prescale run --html` and `show`.
 
 Linear-styled (dark canvas, lavender accent, hairline borders), built from a
-Result with no external dependencies — inline CSS, system font stack, an
-inline-SVG chart. One file you can open offline, email, or attach to a PR.
+Result with no external dependencies — inline CSS, system font stack,
+inline-SVG charts. One file you can open offline, email, or attach to a PR.
+Long series (a soak's windows, a spike's seconds) are LTTB-downsampled before
+they're drawn, so a two-hour run renders as fast as a two-minute one.
 """
 
 from __future__ import annotations
 
 import html
+import math
 from datetime import datetime
 
-_CSS = """
+from prescale_cli.downsample import lttb
+from prescale_cli.render import (
+    changepoint_summary,
+    decisive_stage,
+    route_ceiling,
+    scalability_summary,
+    shown_routes,
+    slo_summary,
+    soak_summary,
+    spike_summary,
+    worst_routes,
+)
+
+CSS = """
 :root{
   --canvas:#010102;--s1:#0f1011;--s2:#141516;--hair:#23252a;
   --ink:#f7f8f8;--muted:#d0d6e0;--subtle:#8a8f98;--tertiary:#62666d;
@@ -61,6 +77,9 @@ h1{font-size:30px;font-weight:600;letter-spacing:-.8px;}
 .chart{padding:20px 22px 8px;}
 .chart .legend{display:flex;gap:16px;font-size:12px;color:var(--subtle);margin-bottom:6px;}
 .chart .legend b{color:var(--ink);font-family:var(--mono);font-weight:500;}
+.chart .legend i{display:inline-block;width:9px;height:2px;margin-right:6px;
+  vertical-align:middle;}
+.chart+.chart{border-top:1px solid var(--hair);}
 svg{display:block;width:100%;height:auto;}
 table{width:100%;border-collapse:collapse;font-size:13px;}
 thead th{text-align:right;font-weight:500;color:var(--subtle);font-size:11.5px;
@@ -72,6 +91,9 @@ tbody td{text-align:right;padding:11px 18px;border-top:1px solid var(--hair);
 tbody td:first-child{text-align:left;font-weight:500;color:var(--ink);}
 tbody tr.onset td{background:var(--red-bg);color:var(--red);}
 tbody tr.onset td:first-child{color:var(--red);}
+details summary{cursor:pointer;padding:11px 18px;border-top:1px solid var(--hair);
+  font-size:12px;color:var(--subtle);}
+details summary:hover{color:var(--ink);}
 tbody tr.onset td:first-child::after{content:"  ←  breaks here";color:var(--red);
   font-family:var(--sans);font-size:11px;font-weight:500;letter-spacing:0;}
 .ok{color:var(--green);}
@@ -89,12 +111,17 @@ footer{margin-top:44px;padding-top:20px;border-top:1px solid var(--hair);display
 MIDDOT = "·"
 RARROW = "→"
 
+_PALETTE = ("#5e6ad2", "#4ea7fc", "#3fbf5f", "#f2994a", "#c46ae6", "#eb5757")
+_MAX_POINTS = 300  # per polyline, after LTTB — past this an SVG line looks no different
+_MAX_HIST_ROUTES = len(_PALETTE)
+_HIST_GROWTH = math.log(1.05)  # bucket width of a stored route `latency_hist`
+
 
-def _esc(text: str) -> str:
+def esc(text: str) -> str:
     return html.escape(str(text), quote=True)
 
 
-def _ms(ms: float) -> str:
+def fmt_ms(ms: float) -> str:
     return "-" if ms <= 0 else f"{ms:.0f}ms"
 
 
@@ -161,6 +188,194 @@ def _svg_chart(result: dict) -> str:
     )
 
 
+def _duration(seconds: float) -> str:
+    if seconds >= 3600:
+        return f"{seconds / 3600:.3g}h"
+    if seconds >= 60:
+        return f"{seconds / 60:.3g}m"
+    return f"{seconds:.3g}s"
+
+
+def svg_text(x: float, y: float, label: str, fill: str = "#62666d",
+          anchor: str = "middle", size: int = 10) -> str:
+    return (f'<text x="{x:.0f}" y="{y:.0f}" font-family="monospace" font-size="{size}" '
+            f'fill="{fill}" text-anchor="{anchor}">{esc(label)}</text>')
+
+
+def svg_polyline(points: list[tuple[float, float]], color: str, width: float = 2) -> str:
+    coords = " ".join(f"{x:.1f},{y:.1f}" for x, y in points)
+    return (f'<polyline points="{coords}" fill="none" stroke="{color}" '
+            f'stroke-width="{width}" stroke-linejoin="round" stroke-linecap="round"/>')
+
+
+def _timeline_points(result: dict) -> list[dict]:
+    """The run over time: the stored `timeline` (per second for a spike or a
+    ramp, per window for a soak). Runs saved before ramps stored one have only
+    their levels, drawn as a flat step across each stage."""
+    if result.get("timeline"):
+        return result["timeline"]
+    step = result["config"].get("stage_seconds") or 1.0
+    points = []
+    for i, s in enumerate(result["stages"]):
+        for t in (i * step, (i + 1) * step):
+            points.append({"t": t, "rps": s["rps"], "p95_ms": s["p95_ms"],
+                           "error_rate": s["error_rate"]})
+    return points
+
+
+def _timeline(result: dict) -> str:
+    points = _timeline_points(result)
+    if len(points) < 2:
+        return ""
+    w, h, pl, pr, pt, pb = 600, 70, 40, 40, 8, 8
+    t_end = max(p["t"] for p in points) or 1.0
+    plot_w, plot_h = w - pl - pr, h - pt - pb
+    # Ramp points come from tick sums: mean latency, not p95.
+    latency = ("p95", "p95_ms") if "p95_ms" in points[0] else ("Mean latency", "mean_ms")
+    metrics = [
+        ("Req/s", "rps", "#5e6ad2", lambda v: f"{v:.0f}"),
+        (*latency, "#f2994a", lambda v: fmt_ms(v) if v else "0ms"),
+        ("Errors", "error_rate", "#eb5757", lambda v: f"{v:.0%}"),
+    ]
+    charts = []
+    for i, (name, key, color, fmt) in enumerate(metrics):
+        series = lttb([(p["t"], p[key]) for p in points], _MAX_POINTS)
+        peak = max(v for _, v in series)
+        ymax = peak or 1.0
+        line = svg_polyline([(pl + plot_w * t / t_end, h - pb - plot_h * v / ymax)
+                          for t, v in series], color, 1.5)
+        svg_h, axis = h, ""
+        if i == len(metrics) - 1:  # time labels under the last chart only
+            svg_h += 16
+            axis = "".join(svg_text(pl + plot_w * f, svg_h - 4, _duration(t_end * f))
+                           for f in (0, 0.5, 1))
+        charts.append(
+            f'<div class="chart"><div class="legend"><span><i style="background:{color}">'
+            f"</i>{name}</span><span>peak <b>{fmt(peak)}</b></span></div>"
+            f'<svg viewBox="0 0 {w} {svg_h}" preserveAspectRatio="none">'
+            f'<line x1="{pl}" y1="{h - pb}" x2="{w - pr}" y2="{h - pb}" '
+            f'stroke="#23252a" stroke-width="1"/>{line}{axis}</svg></div>'
+        )
+    return (f'<div class="section"><h3>Timeline {MIDDOT} {_duration(t_end)}</h3>'
+            f'<div class="panel clip">{"".join(charts)}</div></div>')
+
+
+def _density(hist: list[list]) -> list[tuple[float, float]]:
+    """A stored `latency_hist` as (ms, share of requests) points, with zeros
+    put back where empty buckets were left out, so the line drops to the floor
+    between modes instead of bridging them."""
+    total = sum(n for _, n in hist) or 1
+    points: list[tuple[float, float]] = []
+    for ms, n in hist:
+        if points and ms > 0 and points[-1][0] > 0 \
+                and math.log(ms / points[-1][0]) > 1.5 * _HIST_GROWTH:
+            points += [(points[-1][0] * math.exp(_HIST_GROWTH), 0.0),
+                       (ms * math.exp(-_HIST_GROWTH), 0.0)]
+        points.append((ms, n / total))
+    if points:  # grounded at both ends, so even a one-bucket route shows as a peak
+        points = [(points[0][0] * math.exp(-_HIST_GROWTH), 0.0), *points,
+                  (points[-1][0] * math.exp(_HIST_GROWTH), 0.0)]
+    return points
+
+
+def _hist_chart(result: dict) -> str:
+    stage = decisive_stage(result)
+    if stage is None:
+        return ""
+    routes = [(label, _density(r["latency_hist"]))
+              for label, r in worst_routes(stage, _MAX_HIST_ROUTES) if r.get("latency_hist")]
+    if not routes:
+        return ""
+    lo = max(min(p[0][0] for _, p in routes) / 1.5, 0.01)
+    hi = max(max(p[-1][0] for _, p in routes) * 1.5, lo * 10)
+    ymax = max(v for _, p in routes for _, v in p) or 1.0
+    w, h, pl, pr, pt, pb = 600, 150, 40, 40, 10, 24
+    plot_w, plot_h = w - pl - pr, h - pt - pb
+    span = math.log(hi / lo)
+
+    def x(ms: float) -> float:
+        return pl + plot_w * math.log(max(ms, lo) / lo) / span
+
+    lines, legend = [], []
+    for (label, points), color in zip(routes, _PALETTE):
+        lines.append(svg_polyline([(x(ms), h - pb - plot_h * v / ymax) for ms, v in points],
+                               color, 1.5))
+        p95 = stage["routes"][label]["p95_ms"]
+        legend.append(f'<span><i style="background:{color}"></i>{esc(label)} '
+                      f"<b>{fmt_ms(p95)}</b></span>")
+    ticks = []
+    decade = 10 ** math.floor(math.log10(lo))
+    while decade <= hi:
+        if decade >= lo:
+            ticks.append(svg_text(x(decade), h - 8, f"{decade / 1000:g}s" if decade >= 1000
+                               else f"{decade:g}ms"))
+        decade *= 10
+    more = len(stage["routes"]) - len(routes)
+    note = f" {MIDDOT} top {len(routes)} of {len(stage['routes'])}" if more > 0 else ""
+    return (
+        f'<div class="section"><h3>Latency distribution {MIDDOT} at {stage["users"]} users'
+        f'{note}</h3><div class="panel clip"><div class="chart">'
+        f'<div class="legend">{"".join(legend)}</div>'
+        f'<svg viewBox="0 0 {w} {h}" preserveAspectRatio="none">'
+        f'<line x1="{pl}" y1="{h - pb}" x2="{w - pr}" y2="{h - pb}" stroke="#23252a" '
+        f'stroke-width="1"/>{"".join(lines)}{"".join(ticks)}</svg></div></div></div>'
+    )
+
+
+def _curve_chart(result: dict) -> str:
+    """p95 against throughput, level by level: where extra users stop buying
+    req/s and start buying latency. The knee (or onset) and the USL's
+    projected peak are marked."""
+    stages = result["stages"]
+    if len(stages) < 2:
+        return ""
+    v = result["verdict"]
+    wall_ms = result["config"]["latency_wall_s"] * 1000
+    usl_peak = (v.get("scalability") or {}).get("peak_rps")
+    xmax = max(max(s["rps"] for s in stages), usl_peak or 0) * 1.08 or 1.0
+    ymax = max(max(s["p95_ms"] for s in stages), wall_ms) * 1.15 or 1.0
+    w, h, pl, pr, pt, pb = 600, 180, 40, 40, 24, 24
+    plot_w, plot_h = w - pl - pr, h - pt - pb
+
+    def xy(s: dict) -> tuple[float, float]:
+        return pl + plot_w * s["rps"] / xmax, h - pb - plot_h * s["p95_ms"] / ymax
+
+    knee_users = v["saturation_users"] if v["saturated"] else None
+    parts = [
+        f'<line x1="{pl}" y1="{h - pb}" x2="{w - pr}" y2="{h - pb}" stroke="#23252a" '
+        'stroke-width="1"/>',
+    ]
+    wall_y = h - pb - plot_h * wall_ms / ymax
+    parts.append(f'<line x1="{pl}" y1="{wall_y:.0f}" x2="{w - pr}" y2="{wall_y:.0f}" '
+                 'stroke="#eb5757" stroke-width="1" stroke-dasharray="4 4" opacity=".55"/>')
+    if usl_peak:
+        ux = pl + plot_w * usl_peak / xmax
+        parts.append(f'<line x1="{ux:.0f}" y1="{pt}" x2="{ux:.0f}" y2="{h - pb}" '
+                     'stroke="#c46ae6" stroke-width="1" stroke-dasharray="3 3" opacity=".7"/>')
+        parts.append(svg_text(ux - 4, pt + 8, f"USL peak {MIDDOT} {usl_peak:.0f} req/s",
+                           "#c46ae6", "end", 9))
+    parts.append(svg_polyline([xy(s) for s in stages], "#5e6ad2"))
+    for s in stages:
+        cx, cy = xy(s)
+        if s["users"] == v["onset_users"]:
+            parts.append(f'<circle cx="{cx:.0f}" cy="{cy:.0f}" r="4" fill="#eb5757" '
+                         'stroke="#010102" stroke-width="1.5"/>')
+            parts.append(svg_text(cx, cy - 9, f"onset {MIDDOT} {s['users']}", "#eb5757"))
+        elif s["users"] == knee_users:
+            parts.append(f'<circle cx="{cx:.0f}" cy="{cy:.0f}" r="4" fill="#f2994a" '
+                         'stroke="#010102" stroke-width="1.5"/>')
+            parts.append(svg_text(cx, cy - 9, f"knee {MIDDOT} {s['users']}", "#f2994a"))
+        else:
+            parts.append(f'<circle cx="{cx:.0f}" cy="{cy:.0f}" r="3" fill="#5e6ad2"/>')
+    parts += [svg_text(pl + plot_w * f, h - 8, f"{xmax * f:.0f} req/s" if f else "0")
+              for f in (0, 0.5, 1)]
+    return (
+        f'<div class="section"><h3>Latency vs throughput</h3><div class="panel clip">'
+        f'<div class="chart"><svg viewBox="0 0 {w} {h}" preserveAspectRatio="none">'
+        f'{"".join(parts)}</svg></div></div></div>'
+    )
+
+
 def _verdict(result: dict) -> tuple[str, str, str, str]:
     v = result["verdict"]
     if v["onset_users"] is None:
@@ -207,8 +422,8 @@ def _ramp_table(result: dict) -> str:
         cls = ' class="onset"' if s["users"] == onset_users else ""
         rows.append(
             f"<tr{cls}><td>{s['users']}</td><td>{s['rps']:.0f}</td>"
-            f"<td>{_ms(s['p50_ms'])}</td><td>{_ms(s['p95_ms'])}</td>"
-            f"<td>{_ms(s['p99_ms'])}</td>{_err_td(s['error_rate'])}</tr>"
+            f"<td>{fmt_ms(s['p50_ms'])}</td><td>{fmt_ms(s['p95_ms'])}</td>"
+            f"<td>{fmt_ms(s['p99_ms'])}</td>{_err_td(s['error_rate'])}</tr>"
         )
     return (
         "<table><thead><tr><th>Users</th><th>Req/s</th><th>p50</th><th>p95</th>"
@@ -217,43 +432,62 @@ def _ramp_table(result: dict) -> str:
     )
 
 
+def _route_rows(ranked: list[tuple[str, dict]], culprit: str | None) -> str:
+    onset = ' class="onset"'
+    return "".join(
+        f"<tr{onset if label == culprit else ''}><td>{esc(label)}</td>"
+        f"<td>{stat['rps']:.0f}</td><td>{fmt_ms(stat['p95_ms'])}</td>"
+        f"{_err_td(stat['error_rate'])}</tr>"
+        for label, stat in ranked
+    )
+
+
 def _route_table(result: dict) -> str:
-    v = result["verdict"]
-    stages = result["stages"]
-    if not stages:
-        return ""
-    decisive = next((s for s in stages if s["users"] == v["onset_users"]), stages[-1])
-    routes = decisive["routes"]
-    if len(routes) <= 1:
+    """The worst `TOP_ROUTES` routes (and the culprit, wherever it ranks), with
+    the rest folded into a collapsed table underneath so a thousand-route run
+    stays readable."""
+    culprit = result["verdict"]["culprit_route"]
+    decisive = decisive_stage(result)
+    if decisive is None or len(decisive["routes"]) <= 1:
         return ""
-    ranked = sorted(routes.items(),
-                    key=lambda kv: (kv[1]["error_rate"], kv[1]["p95_ms"]), reverse=True)
-    rows = []
-    for label, stat in ranked:
-        cls = ' class="onset"' if label == v["culprit_route"] else ""
-        rows.append(
-            f"<tr{cls}><td>{_esc(label)}</td><td>{stat['rps']:.0f}</td>"
-            f"<td>{_ms(stat['p95_ms'])}</td>{_err_td(stat['error_rate'])}</tr>"
-        )
+    shown = shown_routes(decisive, culprit)
+    head = ('<table><thead><tr><th>Route</th><th>Req/s</th><th>p95</th><th>Errors</th>'
+            "</tr></thead><tbody>")
+    listed = {label for label, _ in shown}
+    rest = [pair for pair in worst_routes(decisive) if pair[0] not in listed]
+    more = (f'<details><summary>+{len(rest)} more routes</summary>{head}'
+            f'{_route_rows(rest, culprit)}</tbody></table></details>' if rest else "")
     return (
         f'<div class="section"><h3>Per route {MIDDOT} at {decisive["users"]} users</h3>'
-        '<div class="panel clip"><table><thead><tr><th>Route</th><th>Req/s</th>'
-        "<th>p95</th><th>Errors</th></tr></thead><tbody>"
-        + "".join(rows) + "</tbody></table></div></div>"
+        f'<div class="panel clip">{head}{_route_rows(shown, culprit)}'
+        f"</tbody></table>{more}</div></div>"
     )
 
 
 def _cause(result: dict) -> str:
     v = result["verdict"]
     paras = []
+    if v.get("slo"):
+        paras += [f"<p><b>SLO</b> — {esc(line)}</p>" for line in slo_summary(v["slo"])]
+    if v.get("changepoint"):
+        paras.append(f"<p><b>Degradation</b> — {esc(changepoint_summary(v['changepoint']))}</p>")
     if v["bottleneck"]:
-        culprit = f"<b>{_esc(v['culprit_route'])}</b> — " if v["culprit_route"] else ""
-        paras.append(f"<p>{culprit}{_esc(v['bottleneck'])}</p>")
+        culprit = f"<b>{esc(v['culprit_route'])}</b> — " if v["culprit_route"] else ""
+        paras.append(f"<p>{culprit}{esc(v['bottleneck'])}</p>")
     if v["saturated"] and v["saturation_users"]:
         paras.append(
             f"<p>Throughput plateaued ~{v['peak_rps']:.0f} req/s around "
             f"{v['saturation_users']} users (capacity ceiling).</p>"
         )
+    if v.get("saturated_route") and len(result["target"]["routes"]) > 1:
+        paras.append(f"<p>{esc(route_ceiling(v))}</p>")
+    projection = scalability_summary(v.get("scalability"))
+    if projection:
+        paras.append(f"<p><b>Projection</b> — {esc(projection)}</p>")
+    if v.get("spike"):
+        paras.append(f"<p><b>Spike</b> — {esc(spike_summary(v['spike']))}</p>")
+    if v.get("soak"):
+        paras.append(f"<p><b>Soak</b> — {esc(soak_summary(v['soak']))}</p>")
     if v["marginal"]:
         paras.append("<p>Only wobbled at the very top of the ramp — you likely have "
                      "some headroom.</p>")
@@ -269,28 +503,28 @@ def render_html(result: dict) -> str:
     prof = result.get("profile")
     if prof:
         verb = "likely holds" if prof["would_survive"] else "unlikely to hold"
-        sub = f"{sub} · {_esc(prof['label'])}: {verb} (peaks ~{prof['peak_users']})."
+        sub = f"{sub} · {esc(prof['label'])}: {verb} (peaks ~{prof['peak_users']})."
     ts = datetime.strptime(result["created_at"], "%Y-%m-%dT%H:%M:%SZ").strftime(
         "%Y-%m-%d %H:%M UTC")
     n_routes = len(target["routes"])
     routes = f"{n_routes} route{'s' if n_routes != 1 else ''}"
-    warn_html = (f'<div class="cause"><p>{_esc(result["warning"])}</p></div>'
+    warn_html = (f'<div class="cause"><p>{esc(result["warning"])}</p></div>'
                  if result.get("warning") else "")
     max_users = config["max_users"]
-    meta = (f"{_esc(config['method'])} {MIDDOT} {config['stage_seconds']:g}s per level "
+    meta = (f"{esc(config['method'])} {MIDDOT} {config['stage_seconds']:g}s per level "
             f"{MIDDOT} max {max_users} users")
     return f"""<!doctype html>
 <html lang="en"><head><meta charset="utf-8">
 <meta name="viewport" content="width=device-width, initial-scale=1">
 <title>PreScale — Readiness report</title>
-<style>{_CSS}</style></head>
+<style>{CSS}</style></head>
 <body><div class="wrap">
   <div class="topbar">
     <div class="brand"><span class="mark"></span> PreScale</div>
     <div class="meta">prescale run {MIDDOT} {ts}</div>
   </div>
   <h1>Readiness report</h1>
-  <div class="sub"><span class="url">{_esc(target["url"])}</span>
+  <div class="sub"><span class="url">{esc(target["url"])}</span>
     <span>{MIDDOT} {routes} {MIDDOT} ramped 1 {RARROW} {max_users} users</span></div>
   <div class="panel verdict">
     <span class="dot {dot}"></span>
@@ -306,7 +540,10 @@ def render_html(result: dict) -> str:
     </div>
     {_cause(result)}
   </div>
+  {_curve_chart(result)}
+  {_timeline(result)}
   {_route_table(result)}
+  {_hist_chart(result)}
   <footer><span>Generated by prescale {result["tool_version"]}</span>
     <span>{meta}</span></footer>
 </div></body></html>
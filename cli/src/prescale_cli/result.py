@@ -7,27 +7,49 @@ rendered everywhere — `run --json`, `.prescale/runs/<id>.json`, `show`, and
 
 Everything here is local-only: results live under `.prescale/` on the user's
 machine and are never uploaded.
+
+A run is stored as `<id>.json`, or with `run --compress` as `<id>.json.gz`: a
+gzip of two JSON lines, the header (everything but the bulky series) and then
+the body (`stages`, `timeline`). Readers that only need the verdict stop after
+the first line. Either way the loaded Result is the same shape.
 """
 
 from __future__ import annotations
 
-import importlib.resources
+import gzip
+import itertools
 import json
+import math
 import os
 import secrets
 import subprocess
 import sys
+import zlib
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 from prescale_cli import __version__
-from prescale_cli.loadtest import RunReport, StageResult, route_label
+
+if TYPE_CHECKING:  # loadtest pulls in httpx and asyncio; reading the store shouldn't
+    from prescale_cli.loadtest import RouteStat, RunReport, SpikeInfo, StageResult
+    from prescale_cli.scalability import Interval, UslFit
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks; writes stay atomic via rename
+    fcntl = None
 
 SCHEMA_VERSION = 1
 
 _DEFAULT_STORE = ".prescale"
 _RUNS_SUBDIR = "runs"
+_INDEX_FILE = "index.jsonl"
+_ROLLUP_FILE = "rollup.jsonl"  # verdict-only records of runs compacted by `prescale gc`
+_LOCK_FILE = ".lock"
+_BODY_KEYS = ("stages", "timeline")  # stored after the header in a compressed run
 
 
 class ResultError(Exception):
@@ -45,11 +67,19 @@ class AmbiguousResultError(ResultError):
 # --- building -------------------------------------------------------------
 
 def build_result(report: RunReport, *, url: str, targets: list[str],
-                 config: dict, warning: str | None) -> dict:
-    """Turn a finished `RunReport` plus its inputs into the `Result` envelope."""
+                 config: dict, warning: str | None,
+                 timeline: list[StageResult] | None = None) -> dict:
+    """Turn a finished `RunReport` plus its inputs into the `Result` envelope.
+    `timeline` (consecutive slices of the run — per-second for a spike, per
+    window for a soak) is stored when given; otherwise a ramp's timeline is
+    rolled up from its stages' 100ms ticks."""
+    from prescale_cli.changepoint import changepoint_block
+    from prescale_cli.loadtest import route_label
+    from prescale_cli.slo import slo_block
+
     now = datetime.now(timezone.utc)
     parsed = urlparse(url)
-    return {
+    result = {
         "schema_version": SCHEMA_VERSION,
         "kind": "run",
         "id": f"{now.strftime('%Y%m%dT%H%M%SZ')}-{secrets.token_hex(3)}",
@@ -72,19 +102,139 @@ def build_result(report: RunReport, *, url: str, targets: list[str],
             "saturation_users": report.saturation_users,
             "peak_rps": round(report.peak_rps, 1),
             "marginal": report.marginal,
+            "saturated_route": report.saturated_route,
+            "routes": {
+                label: {
+                    "saturated": r.saturated,
+                    "saturation_users": r.knee_users,
+                    "peak_rps": round(r.peak_rps, 1),
+                    "latency_knee_users": r.latency_knee_users,
+                }
+                for label, r in report.routes.items()
+            },
             "confidence": {
                 "survives_low": report.survives_low,
                 "survives_high": report.survives_high,
                 "stable": report.stable,
+                "method": "bootstrap" if report.resamples else "analytic",
+                "resamples": report.resamples or None,
             },
         },
-        "stages": [_stage_dict(s) for s in report.stages],
+        "stages": [stage_dict(s, r) for s, r in
+                   itertools.zip_longest(report.stages, report.littles_residuals)],
         "warning": warning,
         "environment": _git_environment(),
     }
+    if report.spike is not None:
+        result["verdict"]["spike"] = _spike_dict(report.spike)
+    if report.usl is not None:
+        result["verdict"]["scalability"] = _usl_dict(report.usl)
+    if report.slos is not None:
+        result["verdict"]["slo"] = slo_block(report.slos, report.slo_breaches,
+                                             report.slo_unmet)
+    if report.changepoint is not None:
+        result["verdict"]["changepoint"] = changepoint_block(report.changepoint)
+    if timeline is not None:
+        points, t = [], 0.0
+        for stage in timeline:
+            points.append(_second_dict(round(t), stage))
+            t += stage.duration
+        result["timeline"] = points
+    elif report.stages and all(s.ticks for s in report.stages):
+        result["timeline"] = _tick_timeline(report.stages)
+    return result
+
+
+def _tick_timeline(stages: list[StageResult]) -> list[dict]:
+    """Per-second points across a ramp, from each stage's ticks: rps, error
+    rate and mean latency (ticks keep sums, not distributions, so no p95).
+    Repeats of a level are overlaid in the ticks, so rates are per pass, and
+    completions after a stage's deadline fold into its last second."""
+    from prescale_cli.changepoint import TICK_SECONDS, Tick
+
+    per_second = round(1 / TICK_SECONDS)
+    points, t0 = [], 0.0
+    for stage in stages:
+        passes = max(1, stage.samples)
+        length = stage.duration / passes
+        seconds = max(1, math.ceil(length - 1e-9))
+        buckets = [Tick() for _ in range(seconds)]
+        for i, tick in enumerate(stage.ticks):
+            buckets[min(i // per_second, seconds - 1)].merge(tick)
+        for sec, b in enumerate(buckets):
+            span = max(TICK_SECONDS, min(1.0, length - sec))  # a stage can end mid-second
+            points.append({
+                "t": round(t0) + sec,
+                "users": stage.users,
+                "rps": round(b.total / passes / span, 1),
+                "mean_ms": round(b.lat_sum / b.lat_n * 1000) if b.lat_n else 0,
+                "error_rate": round(b.errors / b.total, 4) if b.total else 0.0,
+                "total": b.total,
+            })
+        t0 += length
+    return points
+
+
+def _spike_dict(info: SpikeInfo) -> dict:
+    return {
+        "baseline_users": info.baseline_users,
+        "spike_users": info.spike_users,
+        "spike_seconds": info.spike_seconds,
+        "baseline_p95_ms": round(info.baseline_p95_ms),
+        "baseline_error_rate": round(info.baseline_error_rate, 4),
+        "peak_p95_ms": round(info.peak_p95_ms),
+        "peak_error_rate": round(info.peak_error_rate, 4),
+        "time_to_degrade_s": info.time_to_degrade_s,
+        "time_to_recover_s": info.time_to_recover_s,
+        "recovered": info.recovered,
+        "tolerance": info.tolerance,
+    }
+
+
+def _usl_dict(fit: UslFit) -> dict:
+    def num(v: float | None, digits: int = 0):
+        if v is None:
+            return None
+        return round(v) if digits == 0 else round(v, digits)
+
+    def band(ci: Interval, digits: int = 0) -> list:
+        return [num(ci.low, digits), num(ci.high, digits)]
+
+    return {
+        "model": "usl",
+        "lambda_rps": round(fit.lam, 2),
+        "sigma": round(fit.sigma, 5),
+        "kappa": round(fit.kappa, 7),
+        "sigma_band": band(fit.sigma_ci, 5),
+        "kappa_band": band(fit.kappa_ci, 7),
+        "r_squared": round(fit.r_squared, 4),
+        "points": fit.points,
+        "peak_users": num(fit.peak_users),
+        "peak_users_band": band(fit.peak_users_ci),
+        "peak_rps": num(fit.peak_rps, 1),
+        "peak_rps_band": band(fit.peak_rps_ci, 1),
+        "wall_users": num(fit.wall_users),
+        "wall_users_band": band(fit.wall_users_ci),
+    }
+
+
+def _second_dict(t: int, stage: StageResult) -> dict:
+    """One timeline point starting `t`s into the run (aggregate only; routes
+    live in `stages`)."""
+    return {
+        "t": t,
+        "users": stage.users,
+        "rps": round(stage.rps, 1),
+        "p50_ms": round(stage.pct(0.50) * 1000),
+        "p95_ms": round(stage.pct(0.95) * 1000),
+        "p99_ms": round(stage.pct(0.99) * 1000),
+        "error_rate": round(stage.error_rate, 4),
+        "total": stage.total,
+    }
 
 
-def _stage_dict(stage: StageResult) -> dict:
+def stage_dict(stage: StageResult, residual: float | None = None) -> dict:
+    """One ramp level as it's stored in a Result's `stages`."""
     return {
         "users": stage.users,
         "rps": round(stage.rps, 1),
@@ -95,6 +245,7 @@ def _stage_dict(stage: StageResult) -> dict:
         "errors": stage.errors,
         "total": stage.total,
         "samples": stage.samples,
+        "littles_residual": round(residual, 3) if residual is not None else None,
         "routes": {
             label: {
                 "total": r.total,
@@ -104,12 +255,30 @@ def _stage_dict(stage: StageResult) -> dict:
                 "p50_ms": round(r.pct(0.50) * 1000),
                 "p95_ms": round(r.pct(0.95) * 1000),
                 "p99_ms": round(r.pct(0.99) * 1000),
+                "latency_hist": _latency_hist(r),
             }
             for label, r in stage.routes.items()
         },
     }
 
 
+_HIST_FLOOR_S = 1e-4
+_HIST_LOG_GROWTH = math.log(1.05)
+
+
+def _latency_hist(stat: RouteStat) -> list[list]:
+    """A route's latencies as [bucket ms, count] pairs in 5% log buckets — small
+    enough to store with every stage, fine enough to test for a shift."""
+    items = stat.hist.buckets() if stat.hist is not None else ((v, 1) for v in stat.latencies)
+    counts: dict[int, int] = {}
+    for value, n in items:
+        i = 0 if value <= _HIST_FLOOR_S else int(
+            math.log(value / _HIST_FLOOR_S) / _HIST_LOG_GROWTH) + 1
+        counts[i] = counts.get(i, 0) + n
+    return [[round(_HIST_FLOOR_S * math.exp(max(i - 0.5, 0) * _HIST_LOG_GROWTH) * 1000, 2),
+             counts[i]] for i in sorted(counts)]
+
+
 def _git_environment() -> dict:
     return {
         "git_commit": _git("rev-parse", "--short", "HEAD"),
@@ -146,12 +315,34 @@ def _runs_dir(store: str | Path | None = None) -> Path:
     return store_dir(store) / _RUNS_SUBDIR
 
 
-def write_result(result: dict, *, store: str | Path | None = None) -> Path:
-    """Write a result to `<store>/runs/<id>.json`, creating dirs as needed."""
+def write_result(result: dict, *, store: str | Path | None = None,
+                 compress: bool = False) -> Path:
+    """Write a result to `<store>/runs/<id>.json` (`.json.gz` when `compress`),
+    creating dirs as needed, and record it in the run index.
+
+    Safe alongside other writers and readers (parallel CI jobs sharing one
+    PRESCALE_HOME): the file appears whole via rename, and the index is only
+    touched under the store lock."""
     runs = _runs_dir(store)
     runs.mkdir(parents=True, exist_ok=True)
-    path = runs / f"{result['id']}.json"
-    path.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+    plain, packed = runs / f"{result['id']}.json", runs / f"{result['id']}.json.gz"
+    if compress:
+        path, stale = packed, plain
+        header = {k: v for k, v in result.items() if k not in _BODY_KEYS}
+        body = {k: result[k] for k in _BODY_KEYS if k in result}
+        data = gzip.compress((json.dumps(header) + "\n" + json.dumps(body) + "\n")
+                             .encode("utf-8"))
+    else:
+        path, stale = plain, packed
+        data = (json.dumps(result, indent=2) + "\n").encode("utf-8")
+    with _store_lock(store):
+        fresh = _index_fresh(store)
+        _atomic_write(path, data)
+        stale.unlink(missing_ok=True)  # re-saved in the other format
+        if fresh:
+            _append_index(store, _summary(result, result["id"]))
+        else:  # first write, or files changed behind the index's back
+            _rebuild_index(store)
     return path
 
 
@@ -160,58 +351,266 @@ def load_result(id_or_path: str, *, store: str | Path | None = None) -> dict:
 
     Raises `ResultNotFoundError` / `AmbiguousResultError`. A stored result whose
     `schema_version` is newer than ours is loaded anyway, with a stderr warning.
+    A run compacted by `prescale gc` loads from the rollup with empty `stages`.
     """
+    return _load(id_or_path, store, header_only=False)
+
+
+def load_header(id_or_path: str, *, store: str | Path | None = None) -> dict:
+    """`load_result` without the per-stage and per-second series — everything a
+    verdict needs. Cheap for a compressed run, which stores the header first."""
+    return _load(id_or_path, store, header_only=True)
+
+
+def _load(id_or_path: str, store: str | Path | None, *, header_only: bool) -> dict:
     direct = Path(id_or_path)
-    if direct.suffix == ".json" and direct.exists():
-        return _read(direct)
+    if direct.name.endswith((".json", ".json.gz")) and direct.exists():
+        return _read(direct, header_only=header_only)
 
     runs = _runs_dir(store)
-    exact = runs / f"{id_or_path}.json"
-    if exact.exists():
-        return _read(exact)
+    path = _run_file(runs, id_or_path)
+    if path is not None:
+        return _read(path, header_only=header_only)
 
-    matches = sorted(runs.glob(f"{id_or_path}*.json")) if runs.exists() else []
+    matches = [r["id"] for r in _index(store) if r["id"].startswith(id_or_path)]
     if not matches:
         raise ResultNotFoundError(f"No saved run matching '{id_or_path}'.")
     if len(matches) > 1:
         raise AmbiguousResultError(
             f"'{id_or_path}' matches {len(matches)} runs — use a longer id."
         )
-    return _read(matches[0])
+    path = _run_file(runs, matches[0])
+    if path is not None:
+        return _read(path, header_only=header_only)
+    rolled = _rollup(store).get(matches[0])
+    if rolled is None:
+        raise ResultNotFoundError(f"No saved run matching '{id_or_path}'.")
+    _warn_schema(rolled)
+    return rolled
 
 
-def list_results(*, store: str | Path | None = None) -> list[dict]:
-    """Lightweight metadata for every stored result, newest-first."""
-    runs = _runs_dir(store)
-    if not runs.exists():
-        return []
-    out: list[dict] = []
-    for path in sorted(runs.glob("*.json"), reverse=True):
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
+def _run_file(runs: Path, run_id: str) -> Path | None:
+    for name in (f"{run_id}.json", f"{run_id}.json.gz"):
+        if (runs / name).exists():
+            return runs / name
+    return None
+
+
+def _run_files(runs: Path) -> list[tuple[str, Path]]:
+    """(id, path) for every stored run, newest first."""
+    files = {}
+    for path in runs.glob("*.json*"):
+        if path.name.endswith(".json.gz"):
+            files[path.name[:-len(".json.gz")]] = path
+        elif path.suffix == ".json":
+            files.setdefault(path.stem, path)
+    return sorted(files.items(), reverse=True)
+
+
+def list_results(*, store: str | Path | None = None, host: str | None = None,
+                 branch: str | None = None, since: str | None = None,
+                 until: str | None = None) -> list[dict]:
+    """Lightweight metadata for every stored result, newest-first, from the run
+    index. `since`/`until` are inclusive ISO dates or timestamps (a prefix of
+    `created_at`, e.g. "2026-06" or "2026-06-28")."""
+    out = []
+    for row in _index(store):
+        created = row.get("created_at") or ""
+        if host is not None and row.get("host") != host:
+            continue
+        if branch is not None and row.get("branch") != branch:
+            continue
+        if since is not None and created[:len(since)] < since:
             continue
-        verdict = data.get("verdict", {})
-        target = data.get("target", {})
-        out.append({
-            "id": data.get("id", path.stem),
-            "created_at": data.get("created_at"),
-            "host": target.get("host"),
-            "kind": data.get("kind", "run"),
-            "survives_users": verdict.get("survives_users"),
-            "onset_users": verdict.get("onset_users"),
-            "onset_reason": verdict.get("onset_reason"),
-        })
+        if until is not None and created[:len(until)] > until:
+            continue
+        out.append(row)
     return out
 
 
 def latest_id(*, store: str | Path | None = None) -> str | None:
     """The id of the most recent stored result, or None if the store is empty."""
+    rows = _index(store)
+    return rows[0]["id"] if rows else None
+
+
+def rebuild_index(*, store: str | Path | None = None) -> list[dict]:
+    """Re-scan every stored result into a fresh run index (newest-first rows).
+    Done automatically when the runs directory has changed since the index was
+    last written; `prescale history --reindex` forces it."""
+    if not _runs_dir(store).exists():
+        return []
+    with _store_lock(store):
+        return _rebuild_index(store)
+
+
+def _scan_index(store: str | Path | None) -> list[dict]:
+    """Index rows built from the run files themselves, newest first."""
     runs = _runs_dir(store)
-    if not runs.exists():
-        return None
-    files = sorted(runs.glob("*.json"), reverse=True)
-    return files[0].stem if files else None
+    found = {}
+    for stem, path in _run_files(runs):
+        try:
+            data = _parse(path, header_only=True)
+        except (OSError, EOFError, ValueError, zlib.error):
+            continue  # unreadable, or a torn write
+        found[stem] = _summary(data, stem)
+    for run_id, data in _rollup(store).items():
+        found.setdefault(run_id, _summary(data, run_id))  # a full run file wins
+    return [found[k] for k in sorted(found, reverse=True)]
+
+
+def _rebuild_index(store: str | Path | None) -> list[dict]:
+    rows = _scan_index(store)
+    _atomic_write(_index_path(store),
+                  "".join(json.dumps(r) + "\n" for r in reversed(rows)).encode("utf-8"))
+    return rows
+
+
+def _summary(data: dict, stem: str) -> dict:
+    verdict = data.get("verdict", {})
+    target = data.get("target", {})
+    env = data.get("environment") or {}
+    return {
+        "id": data.get("id", stem),
+        "created_at": data.get("created_at"),
+        "host": target.get("host"),
+        "kind": data.get("kind", "run"),
+        "survives_users": verdict.get("survives_users"),
+        "onset_users": verdict.get("onset_users"),
+        "onset_reason": verdict.get("onset_reason"),
+        "branch": env.get("git_branch"),
+        "commit": env.get("git_commit"),
+        "compacted": bool(data.get("compacted")),
+    }
+
+
+def _rollup_path(store: str | Path | None = None) -> Path:
+    return store_dir(store) / _ROLLUP_FILE
+
+
+def _rollup(store: str | Path | None) -> dict[str, dict]:
+    """Compacted runs by id: each is a Result with its series dropped."""
+    try:
+        fh = _rollup_path(store).open(encoding="utf-8")
+    except FileNotFoundError:
+        return {}
+    out = {}
+    with fh:
+        for line in fh:
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(data, dict) and data.get("id"):
+                out[data["id"]] = data
+    return out
+
+
+def compact_results(*, drop: set[str] = frozenset(), compact: set[str] = frozenset(),
+                    store: str | Path | None = None) -> None:
+    """Apply a retention plan: delete the `drop` runs outright and fold the
+    `compact` runs into the rollup (verdict and metadata kept, per-stage and
+    per-second series dropped). Rewrites the rollup and index under the store
+    lock, so it's safe alongside running writers."""
+    runs = _runs_dir(store)
+    with _store_lock(store):
+        rolled = _rollup(store)
+        for run_id in compact:
+            path = _run_file(runs, run_id)
+            if path is None:
+                continue  # already compacted, or gone
+            data = _parse(path, header_only=True)
+            data["stages"] = []
+            data["compacted"] = True
+            rolled[run_id] = data
+        for run_id in drop:
+            rolled.pop(run_id, None)
+        _atomic_write(_rollup_path(store), "".join(
+            json.dumps(rolled[k]) + "\n" for k in sorted(rolled)).encode("utf-8"))
+        for run_id in set(drop) | set(compact):
+            for name in (f"{run_id}.json", f"{run_id}.json.gz"):
+                (runs / name).unlink(missing_ok=True)
+        _rebuild_index(store)
+
+
+def _index_path(store: str | Path | None = None) -> Path:
+    return store_dir(store) / _INDEX_FILE
+
+
+def _index_fresh(store: str | Path | None) -> bool:
+    """The index is current unless a run file was added, removed or renamed
+    since it was last written (any of which bumps the directory's mtime)."""
+    try:
+        runs = _runs_dir(store).stat().st_mtime_ns
+        index = _index_path(store).stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    return index >= runs
+
+
+@contextmanager
+def _store_lock(store: str | Path | None):
+    """Exclusive advisory lock on the store, held while the index changes."""
+    if fcntl is None:
+        yield
+        return
+    root = store_dir(store)
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / _LOCK_FILE, "a") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write via a temp file and rename, so readers see the old file or the new
+    one and never half of either."""
+    tmp = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        with open(tmp, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _append_index(store: str | Path | None, row: dict) -> None:
+    # One O_APPEND write per row, so a reader never sees two rows interleaved.
+    fd = os.open(_index_path(store), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, (json.dumps(row) + "\n").encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def _index(store: str | Path | None) -> list[dict]:
+    """Index rows, newest first; a later row for the same id replaces earlier ones."""
+    if not _runs_dir(store).exists():
+        return []
+    if not _index_fresh(store):
+        try:
+            with _store_lock(store):
+                if not _index_fresh(store):  # another process may have just rebuilt it
+                    return _rebuild_index(store)
+        except OSError:
+            # A store we can't write to (a mounted CI artifact, someone else's
+            # PRESCALE_HOME): list it from the run files and leave it untouched.
+            return _scan_index(store)
+    rows: dict[str, dict] = {}
+    with _index_path(store).open(encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a torn line from a crashed writer
+            if isinstance(row, dict) and row.get("id"):
+                rows[row["id"]] = row
+    return [rows[k] for k in sorted(rows, reverse=True)]
 
 
 def schema_warning(result: dict) -> str | None:
@@ -229,13 +628,33 @@ def schema_warning(result: dict) -> str | None:
 
 def schema_json() -> str:
     """The packaged JSON Schema for the Result envelope, as a string."""
+    import importlib.resources
+
     return (importlib.resources.files("prescale_cli.schema")
             .joinpath("result.schema.json").read_text(encoding="utf-8"))
 
 
-def _read(path: Path) -> dict:
+def _parse(path: Path, *, header_only: bool = False) -> dict:
+    if path.name.endswith(".gz"):
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            data = json.loads(fh.readline())
+            if not header_only:
+                data.update(json.loads(fh.readline()))
+        return data
     data = json.loads(path.read_text(encoding="utf-8"))
+    if header_only:
+        for key in _BODY_KEYS:
+            data.pop(key, None)
+    return data
+
+
+def _read(path: Path, *, header_only: bool = False) -> dict:
+    data = _parse(path, header_only=header_only)
+    _warn_schema(data)
+    return data
+
+
+def _warn_schema(data: dict) -> None:
     warning = schema_warning(data)
     if warning:
         print(f"warning: {warning}", file=sys.stderr)
-    return data
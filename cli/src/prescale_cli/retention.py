@@ -0,0 +1,76 @@
+"""Retention policy for the run store — the planning half of `prescale gc`.
+
+Runs are grouped by host and git branch. Within a group the newest `keep_last`
+runs are always kept whole. Older than `daily_after_days`, only the newest run
+of each day survives; older than `compact_after_days`, the survivors keep their
+verdict and metadata but drop their per-stage series (folded into the rollup).
+Pure: works on `list_results` rows and a clock, touches nothing on disk.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+
+@dataclass
+class RetentionPolicy:
+    keep_last: int = 20
+    daily_after_days: int = 30
+    compact_after_days: int = 90
+
+
+@dataclass
+class GcPlan:
+    keep: list[str] = field(default_factory=list)
+    compact: list[str] = field(default_factory=list)  # keep the verdict, drop the series
+    drop: list[str] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not self.compact and not self.drop
+
+
+def _created(row: dict) -> datetime | None:
+    try:
+        return datetime.strptime(row.get("created_at") or "", "%Y-%m-%dT%H:%M:%SZ").replace(
+            tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def plan_gc(rows: list[dict], policy: RetentionPolicy,
+            now: datetime | None = None) -> GcPlan:
+    """Decide what `prescale gc` keeps, compacts and drops. `rows` are
+    `list_results` rows (newest first); runs with no readable timestamp are
+    kept untouched."""
+    now = now or datetime.now(timezone.utc)
+    daily_cutoff = now - timedelta(days=policy.daily_after_days)
+    compact_cutoff = now - timedelta(days=policy.compact_after_days)
+    groups: dict[tuple, list[dict]] = {}
+    for row in sorted(rows, key=lambda r: r["id"], reverse=True):
+        groups.setdefault((row.get("host"), row.get("branch")), []).append(row)
+
+    plan = GcPlan()
+    for group in groups.values():
+        days_seen: set[str] = set()
+        for rank, row in enumerate(group):
+            created = _created(row)
+            if created is None:
+                plan.keep.append(row["id"])
+                continue
+            day = created.date().isoformat()
+            if rank < policy.keep_last:
+                plan.keep.append(row["id"])
+                days_seen.add(day)  # already that day's newest run
+                continue
+            if created < daily_cutoff:
+                if day in days_seen:
+                    plan.drop.append(row["id"])
+                    continue
+                days_seen.add(day)
+            if created < compact_cutoff and not row.get("compacted"):
+                plan.compact.append(row["id"])
+            else:
+                plan.keep.append(row["id"])
+    return plan
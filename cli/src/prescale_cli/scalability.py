@@ -0,0 +1,230 @@
+"""Universal Scalability Law fit over a ramp's levels.
+
+    X(N) = lambda * N / (1 + sigma * (N - 1) + kappa * N * (N - 1))
+
+`sigma` is contention (serialized work: locks, a single DB writer), `kappa` is
+coherency (crosstalk that makes throughput *fall* past a peak). Fitted over the
+measured (users, throughput) points, the curve lets the verdict say where the
+target would peak, and where p95 would cross the wall, beyond the highest level
+actually tested. Pure Python, deterministic (a seeded bootstrap), no numpy.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+
+_MIN_POINTS = 4
+_BOOTSTRAP = 400
+_BAND = (0.10, 0.90)  # ~80% band, matching the survives band
+_SEED = 0
+_LOG_KAPPA_MIN = -8.0  # kappa below 1e-8 is taken as 0
+_REFIT_STEPS = 200
+_MIN_RESAMPLES = _BOOTSTRAP // 4  # fewer fits than this and there's no band
+_MIN_SHARE = 0.5  # of fits that must have a peak / wall before it gets a band
+
+
+@dataclass
+class Interval:
+    low: float | None
+    high: float | None
+
+
+@dataclass
+class UslFit:
+    lam: float                 # single-user throughput (req/s)
+    sigma: float
+    kappa: float
+    r_squared: float
+    points: int
+    peak_users: float | None   # None = no throughput peak (kappa ~ 0)
+    peak_rps: float | None
+    wall_users: float | None   # predicted users where p95 crosses the wall
+    sigma_ci: Interval
+    kappa_ci: Interval
+    peak_users_ci: Interval
+    peak_rps_ci: Interval
+    wall_users_ci: Interval
+
+
+def usl_throughput(n: float, lam: float, sigma: float, kappa: float) -> float:
+    return lam * n / (1 + sigma * (n - 1) + kappa * n * (n - 1))
+
+
+def _shape(n: float, sigma: float, kappa: float) -> float:
+    return n / (1 + sigma * (n - 1) + kappa * n * (n - 1))
+
+
+def _best_lambda(pts, sigma: float, kappa: float) -> tuple[float, float]:
+    """For fixed (sigma, kappa) the model is linear in lambda: closed-form
+    least squares. Returns (lambda, SSE)."""
+    fs = [_shape(n, sigma, kappa) for n, _ in pts]
+    denom = sum(f * f for f in fs)
+    lam = sum(x * f for (_, x), f in zip(pts, fs)) / denom if denom else 0.0
+    sse = sum((x - lam * f) ** 2 for (_, x), f in zip(pts, fs))
+    return lam, sse
+
+
+def _fit_points(pts) -> tuple[float, float, float, float]:
+    """Least-squares (lambda, sigma, kappa, SSE) by a coarse-to-fine grid over
+    sigma in [0, 1] and log-spaced kappa, solving lambda exactly at each node."""
+    sigmas = [i / 20 for i in range(21)]
+    kappas = [0.0] + [10 ** (e / 4) for e in range(-32, 1)]  # 1e-8 .. 1
+    best = (math.inf, 0.0, 0.0, 0.0)
+    for s in sigmas:
+        for k in kappas:
+            lam, sse = _best_lambda(pts, s, k)
+            if sse < best[0]:
+                best = (sse, lam, s, k)
+    _, _, s0, k0 = best
+    s_step, k_span = 0.05, 10 ** 0.25
+    for _ in range(4):  # zoom in around the current best
+        s_grid = [min(1.0, max(0.0, s0 + s_step * i / 4)) for i in range(-4, 5)]
+        k_grid = ([k0 * k_span ** (i / 4) for i in range(-4, 5)] if k0 > 0
+                  else [0.0] + [1e-8 * 10 ** (i / 4) for i in range(-4, 1)])
+        for s in s_grid:
+            for k in k_grid:
+                lam, sse = _best_lambda(pts, s, k)
+                if sse < best[0]:
+                    best = (sse, lam, s, k)
+        _, _, s0, k0 = best
+        s_step, k_span = s_step / 4, k_span ** 0.25
+    sse, lam, s, k = best
+    return lam, s, k, sse
+
+
+def _refit(pts, sigma: float, kappa: float) -> tuple[float, float, float, float]:
+    """The same least-squares fit as `_fit_points`, found by Nelder-Mead over
+    (sigma, log10 kappa) started from a nearby fit instead of a full grid. A
+    bootstrap resample's minimum sits near the full data's, so this reaches it
+    in well under a tenth of the grid's evaluations."""
+    def clamp(v: tuple[float, float]) -> tuple[float, float]:
+        return min(1.0, max(0.0, v[0])), min(0.0, max(_LOG_KAPPA_MIN, v[1]))
+
+    def kappa_of(e: float) -> float:
+        return 10 ** e if e > _LOG_KAPPA_MIN else 0.0
+
+    def sse_at(v: tuple[float, float]) -> float:
+        return _best_lambda(pts, v[0], kappa_of(v[1]))[1]
+
+    e0 = math.log10(kappa) if kappa > 0 else _LOG_KAPPA_MIN
+    simplex = [clamp(v) for v in ((sigma, e0), (sigma + 0.05, e0), (sigma, e0 + 0.5))]
+    scored = sorted((sse_at(v), v) for v in simplex)
+    for _ in range(_REFIT_STEPS):
+        (f0, best), (f1, _), (fw, worst) = scored
+        mid = ((best[0] + scored[1][1][0]) / 2, (best[1] + scored[1][1][1]) / 2)
+
+        def toward(t: float) -> tuple[float, float]:
+            return clamp((mid[0] + t * (worst[0] - mid[0]), mid[1] + t * (worst[1] - mid[1])))
+
+        r = toward(-1.0)
+        fr = sse_at(r)
+        if fr < f0:
+            e = toward(-2.0)
+            fe = sse_at(e)
+            scored[2] = (fe, e) if fe < fr else (fr, r)
+        elif fr < f1:
+            scored[2] = (fr, r)
+        else:
+            c = toward(0.5)
+            fc = sse_at(c)
+            if fc < fw:
+                scored[2] = (fc, c)
+            else:  # shrink toward the best vertex
+                scored = [scored[0]] + [
+                    (sse_at(v), v) for v in (clamp(((best[0] + p[0]) / 2, (best[1] + p[1]) / 2))
+                                             for _, p in scored[1:])]
+        scored.sort()
+        (_, a), (_, b), (_, c) = scored
+        if max(abs(a[0] - v[0]) for v in (b, c)) < 1e-4 and \
+                max(abs(a[1] - v[1]) for v in (b, c)) < 1e-3:
+            break
+    s, e = scored[0][1]
+    lam, sse = _best_lambda(pts, s, kappa_of(e))
+    return lam, s, kappa_of(e), sse
+
+
+def _peak(lam: float, sigma: float, kappa: float) -> tuple[float | None, float | None]:
+    if kappa <= 0 or sigma >= 1:
+        return None, None
+    n = math.sqrt((1 - sigma) / kappa)
+    return n, usl_throughput(n, lam, sigma, kappa)
+
+
+def _wall(lam: float, sigma: float, kappa: float, *, wall: float, think: float,
+          ratio: float) -> float | None:
+    """Smallest N where the predicted p95 reaches `wall`. Little's law gives the
+    mean response time R(N) = N/X(N) - think = (1 + sigma(N-1) + kappa N(N-1))/lambda
+    - think; p95 is taken as `ratio` x R, the p95/mean ratio observed in the run."""
+    if lam <= 0 or ratio <= 0:
+        return None
+    c = lam * (wall / ratio + think)  # solve 1 + sigma(N-1) + kappa N(N-1) = c
+    a, b, d = kappa, sigma - kappa, 1 - sigma - c
+    if a > 0:
+        disc = b * b - 4 * a * d
+        return (-b + math.sqrt(disc)) / (2 * a) if disc >= 0 else None
+    if b > 0:
+        return -d / b
+    return None
+
+
+def _quantiles(vals: list[float | None], fits: int) -> Interval:
+    """The bootstrap band over `fits` successful resamples. None (no band) when
+    too few resamples fit, or when fewer than `_MIN_SHARE` of them have the
+    value at all (no peak, or no wall crossing) — a band over the minority that
+    happen to have one would overstate what the data says."""
+    vals = sorted(v for v in vals if v is not None)
+    if fits < _MIN_RESAMPLES or len(vals) < _MIN_SHARE * fits:
+        return Interval(None, None)
+
+    def at(q: float) -> float:
+        return vals[min(len(vals) - 1, int(q * (len(vals) - 1) + 0.5))]
+
+    return Interval(at(_BAND[0]), at(_BAND[1]))
+
+
+def fit_usl(points: list[tuple[int, float, float]], *, latency_wall: float,
+            think_time: float = 0.0) -> UslFit | None:
+    """Fit the USL to (users, goodput req/s, p95 seconds) per level, with an
+    ~80% bootstrap band on every derived number. None when there are too few
+    distinct levels (or no throughput) to fit a 3-parameter curve."""
+    pts = [(float(n), x) for n, x, _ in points if x > 0]
+    if len({n for n, _ in pts}) < _MIN_POINTS:
+        return None
+    lam, sigma, kappa, sse = _fit_points(pts)
+    mean_x = sum(x for _, x in pts) / len(pts)
+    sst = sum((x - mean_x) ** 2 for _, x in pts)
+    r2 = 1 - sse / sst if sst > 0 else 1.0
+
+    # p95 / mean-response ratio, from levels where Little's law gives a usable mean.
+    ratios = sorted(p95 / (n / x - think_time) for n, x, p95 in points
+                    if x > 0 and p95 > 0 and n / x - think_time > 0)
+    ratio = ratios[len(ratios) // 2] if ratios else 1.0
+
+    def derived(lam: float, s: float, k: float):
+        pu, pr = _peak(lam, s, k)
+        wu = _wall(lam, s, k, wall=latency_wall, think=think_time, ratio=ratio)
+        return s, k, pu, pr, wu
+
+    _, _, peak_users, peak_rps, wall_users = derived(lam, sigma, kappa)
+
+    # Each resample is refitted by the same least-squares estimator as the
+    # point, lambda included, so the band describes the number it surrounds.
+    rng = random.Random(_SEED)
+    boots: list[tuple] = []
+    for _ in range(_BOOTSTRAP):
+        sample = [pts[rng.randrange(len(pts))] for _ in pts]
+        if len({n for n, _ in sample}) < 3:
+            continue
+        b_lam, b_sigma, b_kappa, _ = _refit(sample, sigma, kappa)
+        boots.append(derived(b_lam, b_sigma, b_kappa))
+    sigma_ci, kappa_ci, pu_ci, pr_ci, wu_ci = (
+        _quantiles([b[i] for b in boots], len(boots)) for i in range(5))
+
+    return UslFit(
+        lam=lam, sigma=sigma, kappa=kappa, r_squared=r2, points=len(pts),
+        peak_users=peak_users, peak_rps=peak_rps, wall_users=wall_users,
+        sigma_ci=sigma_ci, kappa_ci=kappa_ci, peak_users_ci=pu_ci, peak_rps_ci=pr_ci,
+        wall_users_ci=wu_ci,
+    )
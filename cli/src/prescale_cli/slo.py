@@ -0,0 +1,221 @@
+"""Per-route SLOs from `prescale.yaml` — so `/api/*` can be held to 300ms while
+a report export gets 10s, instead of one global latency wall for everything.
+
+    slos:
+      default: {p95_ms: 2000, error_budget: 0.02}
+      /api/*: {p95_ms: 300, p99_ms: 800, error_budget: 0.01}
+      /reports/export: {p95_ms: 10000, min_rps: 5}
+
+Route keys are exact labels or globs (first match wins); a route's unset limits
+inherit `default`, which itself falls back to `--latency-wall` and
+`--error-threshold`. `min_rps` is a throughput floor: once a route has reached
+it, dropping back below it at a higher level is a breach (a collapse); never
+reaching it at all is reported as unmet. Pure; evaluation only reads stages.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import yaml
+
+if TYPE_CHECKING:
+    from prescale_cli.loadtest import StageResult
+
+DEFAULT_FILE = "prescale.yaml"
+
+# Which verdict onset_reason each kind of breach maps to.
+REASONS = {"p95": "latency", "p99": "latency", "errors": "errors", "min_rps": "throughput"}
+
+
+class SloError(ValueError):
+    """The SLO file is unreadable or malformed."""
+
+
+@dataclass(frozen=True)
+class RouteSLO:
+    p95_ms: float | None = None
+    p99_ms: float | None = None
+    error_budget: float | None = None  # max error rate, 0-1
+    min_rps: float | None = None
+
+
+@dataclass
+class SloConfig:
+    default: RouteSLO
+    routes: list[tuple[str, RouteSLO]]  # (label or glob, limits), in file order
+    source: str | None = None
+
+    def for_route(self, label: str) -> RouteSLO:
+        for pattern, slo in self.routes:
+            if label == pattern or fnmatch.fnmatchcase(label, pattern):
+                return slo
+        return self.default
+
+
+@dataclass
+class Breach:
+    route: str
+    slo: str            # "p95" | "p99" | "errors" | "min_rps"
+    limit: float        # ms for p95/p99, a rate for errors, req/s for min_rps
+    actual: float
+    users: int
+
+    @property
+    def severity(self) -> float:
+        """How far past the limit (>1 = breached), comparable across SLO kinds."""
+        if self.slo == "min_rps":
+            return self.limit / self.actual if self.actual else float("inf")
+        return self.actual / self.limit if self.limit else float("inf")
+
+
+def _limits(raw, where: str) -> dict:
+    if not isinstance(raw, dict):
+        raise SloError(f"{where}: expected a mapping of limits.")
+    known = {f.name for f in fields(RouteSLO)}
+    unknown = set(raw) - known
+    if unknown:
+        raise SloError(f"{where}: unknown limit(s) {', '.join(sorted(unknown))} "
+                       f"(expected {', '.join(sorted(known))}).")
+    out = {}
+    for key, value in raw.items():
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            raise SloError(f"{where}: {key} must be a non-negative number.")
+        out[key] = float(value)
+    if "error_budget" in out and out["error_budget"] > 1:
+        raise SloError(f"{where}: error_budget is a rate between 0 and 1.")
+    return out
+
+
+def parse_slos(text: str, *, fallback: RouteSLO, source: str | None = None) -> SloConfig:
+    """Parse the `slos:` block of a prescale.yaml."""
+    try:
+        doc = yaml.safe_load(text) or {}
+    except yaml.YAMLError as exc:
+        raise SloError(f"{source or DEFAULT_FILE}: not valid YAML ({exc}).") from exc
+    if not isinstance(doc, dict) or not isinstance(doc.get("slos"), dict):
+        raise SloError(f"{source or DEFAULT_FILE}: expected a top-level 'slos:' mapping.")
+    block = dict(doc["slos"])
+    default = replace(fallback, **_limits(block.pop("default", {}), "slos.default"))
+    routes = []
+    for pattern, raw in block.items():
+        pattern = str(pattern)
+        if not pattern.startswith("/"):
+            raise SloError(f"slos.{pattern}: route keys start with '/' (or use 'default').")
+        routes.append((pattern, replace(default, **_limits(raw, f"slos.{pattern}"))))
+    return SloConfig(default=default, routes=routes, source=source)
+
+
+def load_slos(path: str | Path, *, fallback: RouteSLO) -> SloConfig:
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+    except OSError as exc:
+        raise SloError(f"can't read {path}: {exc.strerror or exc}.") from exc
+    return parse_slos(text, fallback=fallback, source=str(path))
+
+
+def _bound(value: float, bounds, side: int) -> float:
+    """The point value (side 0), or its pessimistic (+1) / optimistic (-1) bound."""
+    if side == 0 or bounds is None:
+        return value
+    return bounds[1] if side > 0 else bounds[0]
+
+
+def check_stage(stage: StageResult, slos: SloConfig, *, peaks: dict[str, float] | None = None,
+                side: int = 0) -> list[Breach]:
+    """Every SLO a stage breaks, worst first. `peaks` (route -> best rps so far)
+    arms the min_rps collapse check; `side` checks against pessimistic (+1) or
+    optimistic (-1) bounds instead of point estimates, for the confidence band."""
+    breaches = []
+    for label, stat in stage.routes.items():
+        slo = slos.for_route(label)
+        if stat.successes:
+            for name, q, limit in (("p95", 0.95, slo.p95_ms), ("p99", 0.99, slo.p99_ms)):
+                if limit is None:
+                    continue
+                ms = _bound(stat.pct(q), stat.pct_bounds(q) if side else None, side) * 1000
+                if ms >= limit:
+                    breaches.append(Breach(label, name, limit, ms, stage.users))
+        if slo.error_budget is not None and stat.total:
+            rate = _bound(stat.error_rate, stat.error_rate_bounds() if side else None, side)
+            if rate >= slo.error_budget:
+                breaches.append(Breach(label, "errors", slo.error_budget, rate, stage.users))
+        if slo.min_rps is not None and peaks is not None and stage.duration > 0:
+            rps = stat.total / stage.duration
+            if peaks.get(label, 0.0) >= slo.min_rps and rps < slo.min_rps:
+                breaches.append(Breach(label, "min_rps", slo.min_rps, rps, stage.users))
+    return sorted(breaches, key=lambda b: -b.severity)
+
+
+def _rps_peaks(peaks: dict[str, float], stage: StageResult) -> None:
+    if stage.duration > 0:
+        for label, stat in stage.routes.items():
+            peaks[label] = max(peaks.get(label, 0.0), stat.total / stage.duration)
+
+
+def slo_onset(stages: list[StageResult], slos: SloConfig,
+              side: int = 0) -> tuple[StageResult | None, list[Breach]]:
+    """The first stage where any route breaks its own SLO, and what broke."""
+    peaks: dict[str, float] = {}
+    for stage in stages:
+        breaches = check_stage(stage, slos, peaks=peaks, side=side)
+        if breaches:
+            return stage, breaches
+        _rps_peaks(peaks, stage)
+    return None, []
+
+
+def unmet_min_rps(stages: list[StageResult], slos: SloConfig) -> list[Breach]:
+    """Routes whose min_rps was never reached anywhere in the run."""
+    peaks: dict[str, float] = {}
+    best_at: dict[str, int] = {}
+    for stage in stages:
+        before = dict(peaks)
+        _rps_peaks(peaks, stage)
+        for label, rps in peaks.items():
+            if rps > before.get(label, -1.0):
+                best_at[label] = stage.users
+    out = []
+    for label, rps in peaks.items():
+        floor = slos.for_route(label).min_rps
+        if floor is not None and rps < floor:
+            out.append(Breach(label, "min_rps", floor, rps, best_at[label]))
+    return out
+
+
+def slo_band(stages: list[StageResult], slos: SloConfig, *, survives_point: int,
+             max_tested: int) -> tuple[int, int, bool]:
+    """`confidence_band`, but re-finding onset against each route's own SLO."""
+    def survives(onset):
+        if onset is None:
+            return max_tested
+        idx = stages.index(onset)
+        return stages[idx - 1].users if idx > 0 else 0
+
+    low = min(survives(slo_onset(stages, slos, side=1)[0]), survives_point)
+    high = max(survives(slo_onset(stages, slos, side=-1)[0]), survives_point)
+    return low, high, low == high
+
+
+def slo_block(slos: SloConfig, breaches: list[Breach], unmet: list[Breach]) -> dict:
+    """The `verdict.slo` block: the limits in force and what broke at onset."""
+    def limits(slo: RouteSLO) -> dict:
+        return {f.name: getattr(slo, f.name) for f in fields(RouteSLO)}
+
+    def breach(b: Breach) -> dict:
+        digits = 4 if b.slo == "errors" else 1
+        return {"route": b.route, "slo": b.slo, "limit": b.limit,
+                "actual": round(b.actual, digits), "users": b.users}
+
+    return {
+        "source": slos.source,
+        "default": limits(slos.default),
+        "routes": {pattern: limits(slo) for pattern, slo in slos.routes},
+        "breaches": [breach(b) for b in breaches],
+        "unmet": [breach(b) for b in unmet],
+    }
@@ -0,0 +1,369 @@
+"""Soak / endurance runs for `prescale run --soak`.
+
+Holds one concurrency level for a long time and watches for drift: latency or
+errors creeping up, or a local server's memory / file descriptors growing (a
+leak). Every outcome streams into per-window histograms, so memory stays flat
+however many requests a multi-hour soak fires — no raw samples are kept.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import random
+import re
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+from prescale_cli.loadtest import (
+    _USER_AGENT,
+    THINK_DISTRIBUTIONS,
+    LatencyHistogram,
+    LoadError,
+    RouteStat,
+    StageResult,
+    _metrics,
+    _preflight,
+    _RateGate,
+    _run_stage,
+    _Sink,
+    _warmup_plan,
+)
+
+DEFAULT_WINDOW_SECONDS = 60.0
+
+# A trend only counts as drift when it's significant *and* material over the
+# whole soak: +10% for latency / RSS / FDs, +1 percentage point for errors.
+_ALPHA = 0.05
+_MIN_RELATIVE_DRIFT = 0.10
+_MIN_ERROR_DRIFT = 0.01
+_MIN_TREND_POINTS = 4
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)([hms])")
+
+
+def parse_duration(text: str) -> float:
+    """'2h', '90m', '1h30m', '45s' or plain seconds ('600') -> seconds."""
+    text = text.strip().lower()
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(text)
+    if not parts or "".join(n + u for n, u in parts) != text:
+        raise ValueError(f"Can't read '{text}' as a duration (try 2h, 90m, 1h30m, 45s).")
+    scale = {"h": 3600.0, "m": 60.0, "s": 1.0}
+    return sum(float(n) * scale[u] for n, u in parts)
+
+
+@dataclass
+class SoakWindow:
+    """Aggregate outcome of one window (no per-route split, no raw samples)."""
+
+    index: int
+    total: int = 0
+    errors: int = 0
+    hist: LatencyHistogram = field(default_factory=LatencyHistogram)
+    rss_bytes: int | None = None
+    fds: int | None = None
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.total if self.total else 0.0
+
+
+@dataclass
+class SoakRun:
+    stage: StageResult
+    windows: list[SoakWindow]
+    window_seconds: float
+
+
+@dataclass
+class Trend:
+    """Mann-Kendall trend test plus a Theil-Sen slope (units per minute)."""
+
+    slope_per_min: float
+    z: float
+    p_value: float
+    drifting: bool
+
+
+@dataclass
+class SoakInfo:
+    users: int
+    duration_s: float
+    window_s: float
+    latency: Trend | None
+    errors: Trend | None
+    rss: Trend | None = None
+    fds: Trend | None = None
+
+    @property
+    def drifting(self) -> bool:
+        return any(t is not None and t.drifting for t in (self.latency, self.errors))
+
+    @property
+    def leak_suspected(self) -> bool:
+        return any(t is not None and t.drifting for t in (self.rss, self.fds))
+
+
+class _WindowSink(_Sink):
+    """A streaming `_Sink` (whole-soak per-route histograms) that also files
+    each outcome into the aggregate window it completed in. Its 100ms ticks are
+    a rolling `LIVE_WINDOW`, not a whole-soak record: the windows are the soak's
+    time series."""
+
+    def __init__(self, start: float, window_seconds: float, duration: float) -> None:
+        super().__init__(streaming=True, keep_ticks=False)
+        self.start = start
+        self.window_seconds = window_seconds
+        # Requests still in flight at the deadline land in the last real window
+        # rather than a sliver of a window that would inflate its rps.
+        self.last_index = max(0, math.ceil(duration / window_seconds) - 1)
+        self.windows: dict[int, SoakWindow] = {}
+
+    def window(self, index: int) -> SoakWindow:
+        w = self.windows.get(index)
+        if w is None:
+            w = SoakWindow(index)
+            self.windows[index] = w
+        return w
+
+    def _current(self) -> SoakWindow:
+        index = int((time.monotonic() - self.start) / self.window_seconds)
+        return self.window(min(index, self.last_index))
+
+    def record_response(self, target: str, status: int, latency: float) -> None:
+        super().record_response(target, status, latency)
+        w = self._current()
+        w.total += 1
+        if status >= 500 or status == 429:
+            w.errors += 1
+        else:
+            w.hist.add(latency)
+
+    def record_error(self, target: str, kind: str, latency: float = 0.0) -> None:
+        super().record_error(target, kind, latency)
+        w = self._current()
+        w.total += 1
+        w.errors += 1
+
+
+def read_process(pid: int) -> tuple[int | None, int | None]:
+    """(RSS bytes, open FD count) for a local PID via /proc. Best-effort: either
+    is None where unavailable (non-Linux, no permission, process gone)."""
+    rss: int | None = None
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    rss = int(line.split()[1]) * 1024
+                    break
+    except (OSError, ValueError, IndexError):
+        rss = None
+    try:
+        fds: int | None = len(os.listdir(f"/proc/{pid}/fd"))
+    except OSError:
+        fds = None
+    return rss, fds
+
+
+async def run_soak(
+    targets: list[str],
+    *,
+    users: int,
+    duration: float,
+    window_seconds: float = DEFAULT_WINDOW_SECONDS,
+    watch_pid: int | None = None,
+    method: str = "GET",
+    timeout: float = 10.0,
+    max_rps: float | None = None,
+    warmup: bool = True,
+    think_time: float = 0.0,
+    think_dist: str = "fixed",
+    seed: int | None = None,
+    progress_cb=None,
+    on_stage=None,
+    transport: httpx.AsyncBaseTransport | None = None,
+    metrics_port: int | None = None,
+    metrics_host: str = "127.0.0.1",
+) -> tuple[SoakRun, str | None]:
+    """Hold `users` VUs for `duration` seconds, streaming outcomes into windows
+    of `window_seconds`. At each window boundary the target PID (if any) is
+    sampled and `on_stage` gets the cumulative stage so far. `metrics_port`
+    serves the soak as OpenMetrics, as in `run_loadtest`. Returns
+    (soak run, warning)."""
+    if not targets:
+        raise LoadError("No targets to test.")
+    if think_dist not in THINK_DISTRIBUTIONS:
+        raise ValueError(f"Unknown think-time distribution '{think_dist}'.")
+    rng = random.Random(seed)
+    max_conns = users + 50
+    limits = httpx.Limits(max_connections=max_conns, max_keepalive_connections=max_conns)
+    gate = _RateGate(max_rps) if max_rps else None
+
+    async with _metrics(metrics_port, metrics_host) as exporter, httpx.AsyncClient(
+        timeout=timeout, limits=limits, follow_redirects=True,
+        headers={"User-Agent": _USER_AGENT}, transport=transport,
+    ) as client:
+        warning = await _preflight(client, method, targets[0])
+        if warmup:
+            warmup_users, warmup_seconds = _warmup_plan([users], min(duration, 5.0))
+            await _run_stage(client, targets, method, warmup_users, warmup_seconds,
+                             gate, think_time, think_dist,
+                             random.Random(rng.getrandbits(64)))
+
+        start = time.monotonic()
+        sink = _WindowSink(start, window_seconds, duration)
+        if exporter is not None:
+            exporter.watch(users, sink)
+        if progress_cb:
+            progress_cb(users)
+
+        def sample(index: int) -> None:
+            if watch_pid is not None:
+                w = sink.window(index)
+                w.rss_bytes, w.fds = read_process(watch_pid)
+
+        async def ticker() -> None:
+            index = 0
+            while True:
+                await asyncio.sleep(start + (index + 1) * window_seconds - time.monotonic())
+                sample(min(index, sink.last_index))
+                if on_stage:
+                    on_stage(StageResult(users=users, duration=time.monotonic() - start,
+                                         routes=sink.routes))
+                index += 1
+
+        tick = asyncio.create_task(ticker())
+        try:
+            stage = await _run_stage(client, targets, method, users, duration, gate,
+                                     think_time, think_dist,
+                                     random.Random(rng.getrandbits(64)), sink=sink)
+        finally:
+            tick.cancel()
+
+    last = max(sink.windows, default=-1)
+    windows = [sink.window(i) for i in range(last + 1)]
+    if windows:
+        sample(last)  # a closing sample, so the last window sees the end state
+    if on_stage:
+        on_stage(stage)
+    return SoakRun(stage=stage, windows=windows, window_seconds=window_seconds), warning
+
+
+def _sign(x: float) -> int:
+    return (x > 0) - (x < 0)
+
+
+def mann_kendall(values: list[float]) -> tuple[float, float]:
+    """Mann-Kendall trend test: (z, two-sided p-value). Non-parametric, so one
+    noisy window can't fake a trend the way it can with least squares."""
+    n = len(values)
+    if n < 3:
+        return 0.0, 1.0
+    s = sum(_sign(values[j] - values[i]) for i in range(n - 1) for j in range(i + 1, n))
+    ties: dict[float, int] = {}
+    for v in values:
+        ties[v] = ties.get(v, 0) + 1
+    var = (n * (n - 1) * (2 * n + 5)
+           - sum(t * (t - 1) * (2 * t + 5) for t in ties.values())) / 18
+    if var <= 0:
+        return 0.0, 1.0
+    z = (s - _sign(s)) / math.sqrt(var)  # continuity correction
+    return z, math.erfc(abs(z) / math.sqrt(2))
+
+
+def theil_sen(values: list[float]) -> float:
+    """Median pairwise slope (per step) — robust to outlier windows."""
+    slopes = sorted((values[j] - values[i]) / (j - i)
+                    for i in range(len(values) - 1) for j in range(i + 1, len(values)))
+    if not slopes:
+        return 0.0
+    mid = len(slopes) // 2
+    return slopes[mid] if len(slopes) % 2 else (slopes[mid - 1] + slopes[mid]) / 2
+
+
+def trend(values: list[float], *, window_seconds: float,
+          min_change: float, relative: bool = True) -> Trend | None:
+    """Is `values` (one per window) rising materially and significantly? A
+    change counts when slope x span exceeds `min_change` — relative to the
+    median if `relative`, else absolute."""
+    if len(values) < _MIN_TREND_POINTS:
+        return None
+    z, p = mann_kendall(values)
+    slope = theil_sen(values)
+    change = slope * (len(values) - 1)
+    if relative:
+        median = sorted(values)[len(values) // 2]
+        material = median > 0 and change / median >= min_change
+    else:
+        material = change >= min_change
+    return Trend(slope_per_min=slope * 60.0 / window_seconds, z=z, p_value=p,
+                 drifting=p < _ALPHA and slope > 0 and material)
+
+
+def analyze_soak(run: SoakRun) -> SoakInfo:
+    """Trend tests over the per-window p95, error rate, and (if sampled) the
+    watched process's RSS and FD count."""
+    busy = [w for w in run.windows if w.total]
+    p95s = [w.hist.percentile(0.95) * 1000 for w in busy if w.hist.count]
+    errs = [w.error_rate for w in busy]
+    rss = [float(w.rss_bytes) for w in run.windows if w.rss_bytes is not None]
+    fds = [float(w.fds) for w in run.windows if w.fds is not None]
+    win = run.window_seconds
+    return SoakInfo(
+        users=run.stage.users, duration_s=run.stage.duration, window_s=win,
+        latency=trend(p95s, window_seconds=win, min_change=_MIN_RELATIVE_DRIFT),
+        errors=trend(errs, window_seconds=win, min_change=_MIN_ERROR_DRIFT, relative=False),
+        rss=trend(rss, window_seconds=win, min_change=_MIN_RELATIVE_DRIFT),
+        fds=trend(fds, window_seconds=win, min_change=_MIN_RELATIVE_DRIFT),
+    )
+
+
+def window_stages(run: SoakRun) -> list[StageResult]:
+    """Each window as an aggregate StageResult, for the Result `timeline`."""
+    out = []
+    for w in run.windows:
+        end = (run.stage.duration if w is run.windows[-1]
+               else (w.index + 1) * run.window_seconds)
+        duration = max(end - w.index * run.window_seconds, 0.0) or run.window_seconds
+        stat = RouteStat(total=w.total, errors=w.errors, hist=w.hist)
+        out.append(StageResult(users=run.stage.users, duration=duration,
+                               routes={"*": stat}))
+    return out
+
+
+def _trend_dict(t: Trend | None, digits: int = 2) -> dict | None:
+    if t is None:
+        return None
+    return {"slope_per_min": round(t.slope_per_min, digits), "z": round(t.z, 2),
+            "p_value": round(t.p_value, 4), "drifting": t.drifting}
+
+
+def soak_block(info: SoakInfo) -> dict:
+    """The `verdict.soak` block attached to a Result."""
+    return {
+        "users": info.users,
+        "duration_s": round(info.duration_s, 1),
+        "window_s": info.window_s,
+        "latency_p95_ms": _trend_dict(info.latency),
+        "error_rate": _trend_dict(info.errors, digits=5),
+        "rss_bytes": _trend_dict(info.rss, digits=0),
+        "fds": _trend_dict(info.fds),
+        "drifting": info.drifting,
+        "leak_suspected": info.leak_suspected,
+    }
+
+
+def annotate_timeline(result: dict, run: SoakRun) -> None:
+    """Add the watched process's RSS / FD samples to the Result's timeline points."""
+    for point, w in zip(result.get("timeline") or [], run.windows):
+        if w.rss_bytes is not None:
+            point["rss_bytes"] = w.rss_bytes
+        if w.fds is not None:
+            point["fds"] = w.fds
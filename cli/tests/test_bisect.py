@@ -0,0 +1,124 @@
+"""Tests for `prescale bisect`."""
+
+import json
+import shutil
+import socket
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from prescale_cli.bisection import BisectError, commits_between, first_bad, server
+from prescale_cli.main import cli
+from prescale_cli.result import list_results
+
+_SERVER = """\
+import http.server, pathlib, sys, time
+
+DELAY = float(pathlib.Path("delay.txt").read_text())
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(DELAY)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+http.server.ThreadingHTTPServer(("127.0.0.1", int(sys.argv[1])), Handler).serve_forever()
+"""
+
+
+def test_first_bad_probes_only_the_interior():
+    commits = list("abcdefgh")
+    probed = []
+
+    def is_bad(c):
+        probed.append(c)
+        return c >= "e"
+
+    assert first_bad(commits, is_bad) == "e"
+    assert len(probed) == 3 and "h" not in probed
+    assert first_bad(["z"], is_bad) == "z"  # nothing left to probe
+
+
+def _repo(path, delays):
+    def git(*args):
+        subprocess.run(["git", *args], cwd=path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "dev@example.com")
+    git("config", "user.name", "dev")
+    (path / "server.py").write_text(_SERVER)
+    shas = []
+    for i, delay in enumerate(delays):
+        (path / "delay.txt").write_text(str(delay))
+        git("add", ".")
+        git("commit", "-q", "--allow-empty", "-m", f"change {i}")
+        shas.append(subprocess.run(["git", "rev-parse", "HEAD"], cwd=path, check=True,
+                                   capture_output=True, text=True).stdout.strip())
+    return shas
+
+
+needs_git = pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+
+
+@needs_git
+def test_commits_between(tmp_path):
+    shas = _repo(tmp_path, [0, 0, 0])
+    assert commits_between(shas[0], shas[2], cwd=tmp_path) == shas[1:]
+    with pytest.raises(BisectError, match="ancestor"):
+        commits_between(shas[2], shas[0], cwd=tmp_path)
+    with pytest.raises(BisectError, match="not a commit"):
+        commits_between("nope", shas[0], cwd=tmp_path)
+
+
+@needs_git
+def test_bisect_finds_the_slow_commit(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    shas = _repo(repo, [0, 0, 0.3, 0.3])
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    monkeypatch.chdir(repo)
+    store = tmp_path / "store"
+    res = CliRunner().invoke(cli, [
+        "bisect", f"http://127.0.0.1:{port}", "--good", shas[0], "--users", "2",
+        "--start", f"{sys.executable} server.py {port}", "--stage-seconds", "0.5",
+        "--latency-wall", "0.15", "--no-warmup", "--boot-timeout", "20",
+        "--json", "--store", str(store)])
+    assert res.exit_code == 0, res.output
+    out = json.loads(res.stdout)
+    assert out["first_bad"] == shas[2]
+    assert [p["bad"] for p in out["probes"]] == [True, False, False, True]
+    commits = {r["id"]: r["commit"] for r in list_results(store=store)}
+    assert len(commits) == 4
+    for probe in out["probes"]:
+        assert probe["commit"].startswith(commits[probe["result_id"]])
+    assert not subprocess.run(["git", "worktree", "list", "--porcelain"], cwd=repo,
+                              capture_output=True, text=True).stdout.count("\nworktree ")
+
+
+def test_server_refuses_a_port_already_in_use(tmp_path):
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        s.listen()
+        url = f"http://127.0.0.1:{s.getsockname()[1]}"
+        with pytest.raises(BisectError, match="already listening"):
+            with server("sleep 5", cwd=tmp_path, url=url, boot_timeout=5):
+                pass
+    assert not (tmp_path / ".prescale-bisect.log").exists()  # never launched
+
+
+def test_bisect_refuses_remote_hosts():
+    res = CliRunner().invoke(cli, ["bisect", "https://example.com", "--good", "HEAD~1",
+                                   "--start", "true"])
+    assert res.exit_code == 1
+    assert "local" in res.output
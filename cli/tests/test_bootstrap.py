@@ -0,0 +1,79 @@
+"""Tests for the bootstrap band on the breaking level (`run --bootstrap N`)."""
+
+import math
+import random
+
+from prescale_cli.bootstrap import binom_cdf, error_table, quantile_table
+from prescale_cli.loadtest import LatencyHistogram, RouteStat, StageResult, analyze, percentile
+
+
+def _route(total, errors, latency):
+    return RouteStat(total=total, errors=errors, latencies=[latency] * (total - errors))
+
+
+def _stage(users, route):
+    return StageResult(users=users, duration=5.0, routes={"/": route})
+
+
+def test_binom_cdf_matches_exact_sum():
+    n, p = 30, 0.27
+    for k in (0, 5, 8, 15, 30):
+        exact = sum(math.comb(n, i) * p**i * (1 - p) ** (n - i) for i in range(k + 1))
+        assert abs(binom_cdf(k, n, p) - exact) < 1e-10
+
+
+def test_error_table_matches_naive_resampling():
+    rng = random.Random(0)
+    table = error_table(30, 1000)
+    exact = [table.draw(rng) for _ in range(4000)]
+    pool = [1] * 30 + [0] * 970
+    naive = [sum(rng.choices(pool, k=1000)) / 1000 for _ in range(4000)]
+    assert abs(sum(exact) / 4000 - sum(naive) / 4000) < 0.001
+    assert abs(percentile(sorted(exact), 0.9) - percentile(sorted(naive), 0.9)) < 0.003
+
+
+def test_quantile_table_matches_naive_resampling():
+    rng = random.Random(1)
+    vals = sorted(rng.expovariate(1.0) for _ in range(500))
+    table = quantile_table(len(vals), vals.__getitem__, 0.95)
+    exact = sorted(table.draw(rng) for _ in range(3000))
+    naive = sorted(percentile(sorted(rng.choices(vals, k=500)), 0.95) for _ in range(3000))
+    for q in (0.1, 0.5, 0.9):
+        assert abs(percentile(exact, q) - percentile(naive, q)) < 0.1
+
+
+def test_bootstrap_band_tight_when_failure_is_decisive():
+    stages = [_stage(10, _route(2000, 0, 0.05)), _stage(50, _route(2000, 0, 0.05)),
+              _stage(100, _route(2000, 1000, 0.05))]
+    report = analyze(stages, latency_wall=2.0, error_threshold=0.02, bootstrap=2000)
+    assert (report.survives_low, report.survives_high) == (50, 50)
+    assert report.stable and report.resamples == 2000
+
+
+def test_bootstrap_band_widens_when_onset_is_marginal():
+    stages = [_stage(10, _route(200, 0, 0.05)), _stage(50, _route(200, 6, 0.05))]
+    report = analyze(stages, latency_wall=2.0, error_threshold=0.02, bootstrap=2000, seed=3)
+    assert report.survives_users == 10
+    assert (report.survives_low, report.survives_high) == (10, 50)
+    assert not report.stable
+
+
+def test_bootstrap_band_is_seeded():
+    rng = random.Random(2)
+    stages = [_stage(u, RouteStat(total=300, errors=0,
+                                  latencies=[rng.uniform(0.5, 1.5 + u / 40) for _ in range(300)]))
+              for u in (10, 25, 50, 75)]
+    a = analyze(stages, latency_wall=2.0, error_threshold=0.02, bootstrap=500, seed=7)
+    b = analyze(stages, latency_wall=2.0, error_threshold=0.02, bootstrap=500, seed=7)
+    assert (a.survives_low, a.survives_high) == (b.survives_low, b.survives_high)
+
+
+def test_bootstrap_works_on_histogram_stages():
+    hist = LatencyHistogram()
+    hist.add(0.05, 900)
+    hist.add(3.0, 100)  # p95 well past the wall
+    stages = [_stage(10, _route(1000, 0, 0.05)),
+              _stage(50, RouteStat(total=1000, hist=hist))]
+    report = analyze(stages, latency_wall=2.0, error_threshold=0.02, bootstrap=500)
+    assert report.onset_reason == "latency"
+    assert (report.survives_low, report.survives_high) == (10, 10)
@@ -0,0 +1,71 @@
+"""Tests for in-stage changepoint detection."""
+
+import random
+
+from prescale_cli.changepoint import Tick, detect
+from prescale_cli.loadtest import RouteStat, StageResult, _merge_stages, analyze
+from prescale_cli.render import changepoint_summary
+from prescale_cli.result import build_result
+
+
+def _ticks(n_ticks, shift_at, before, after, per_tick=20, errors_after=0.0, seed=1):
+    """A stream of `per_tick` requests per 100ms tick whose latency jumps from
+    ~`before` to ~`after` seconds (and error rate to `errors_after`) at tick
+    `shift_at`."""
+    rng = random.Random(seed)
+    ticks = []
+    for i in range(n_ticks):
+        tick = Tick()
+        late = i >= shift_at
+        for _ in range(per_tick):
+            if late and rng.random() < errors_after:
+                tick.add(None)
+            else:
+                tick.add(rng.gauss(after if late else before, 0.005))
+        ticks.append(tick)
+    return ticks
+
+
+def test_finds_the_latency_cliff_inside_a_stage():
+    cp = detect(_ticks(50, 32, 0.04, 0.9), users=150)
+    assert cp is not None and cp.metric == "latency"
+    assert cp.offset_s == 3.2 and cp.users == 150
+    assert 0.035 < cp.before < 0.045 and cp.after > 0.85
+
+
+def test_steady_stage_has_no_changepoint():
+    assert detect(_ticks(50, 50, 0.04, 0.04), users=50) is None
+
+
+def test_small_shift_is_not_worth_reporting():
+    # Statistically clear, but 4ms on 40ms isn't degradation.
+    assert detect(_ticks(50, 25, 0.040, 0.044), users=50) is None
+
+
+def test_error_burst_is_detected():
+    cp = detect(_ticks(40, 10, 0.04, 0.04, errors_after=0.3), users=75)
+    assert cp is not None and cp.metric == "errors"
+    assert cp.offset_s == 1.0 and cp.after > 0.2 and cp.before == 0
+
+
+def _stage(users, lat, ticks=None):
+    n = 400
+    return StageResult(users=users, duration=5.0,
+                       routes={"/": RouteStat(total=n, latencies=[lat] * n)},
+                       ticks=ticks or [])
+
+
+def test_verdict_reports_where_degradation_began():
+    stages = [_stage(50, 0.04, _ticks(50, 50, 0.04, 0.04)),
+              _stage(150, 2.5, _ticks(50, 32, 0.04, 2.5))]
+    report = analyze(stages, latency_wall=2.0, error_threshold=0.02)
+    assert report.changepoint is not None and report.changepoint.users == 150
+    cp = build_result(report, url="http://x", targets=["http://x/"],
+                      config={}, warning=None)["verdict"]["changepoint"]
+    assert cp["offset_s"] == 3.2 and cp["metric"] == "latency"
+    assert changepoint_summary(cp).startswith("began 3.2s into the 150-user stage")
+
+
+def test_repeats_overlay_ticks_by_offset():
+    a, b = _stage(10, 0.04, [Tick(total=2), Tick(total=1)]), _stage(10, 0.04, [Tick(total=3)])
+    assert [t.total for t in _merge_stages([a, b]).ticks] == [5, 1]
@@ -1,6 +1,8 @@
 """Tests for the PreScale CLI surface."""
 
 import json
+import subprocess
+import sys
 
 from click.testing import CliRunner
 
@@ -48,6 +50,13 @@ def test_run_rejects_non_url():
     assert result.exit_code == 1
 
 
+def test_run_refuses_repeat_with_a_spike():
+    for repeat in ("3", "auto"):
+        result = CliRunner().invoke(cli, ["run", "http://localhost:9", "--shape", "spike",
+                                          "--repeat", repeat])
+        assert result.exit_code == 1 and "--repeat" in result.output
+
+
 def test_group_help_lists_audit():
     result = CliRunner().invoke(cli, ["--help"])
     assert result.exit_code == 0
@@ -71,3 +80,41 @@ def test_schema_command_outputs_valid_json():
     doc = json.loads(result.output)
     assert doc["title"] == "PreScale Result"
     assert doc["properties"]["schema_version"]["const"] == 1
+
+
+# Import time of everything past interpreter startup, for `prescale history --json`.
+_STARTUP_BUDGET_MS = 250
+_HEAVY = ("httpx", "asyncio", "yaml", "prescale_cli.loadtest", "prescale_cli.report",
+          "prescale_cli.audit", "prescale_cli.investigate")
+
+
+def _import_times(*args: str, cwd) -> dict[str, int]:
+    """Top-level imports (name -> cumulative us) while running `prescale ARGS`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         "from prescale_cli.main import main; main()", *args],
+        capture_output=True, text=True, cwd=cwd, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name[1:].rstrip()] = int(cumulative)  # leading spaces mark nesting
+    return times
+
+
+def test_history_json_skips_the_load_engine(tmp_path):
+    loaded = _import_times("history", "--json", "--store", str(tmp_path), cwd=tmp_path)
+    names = {m.strip() for m in loaded}
+    assert "prescale_cli.result" in names
+    assert names.isdisjoint(_HEAVY)
+
+
+def test_startup_budget(tmp_path):
+    loaded = _import_times("history", "--json", "--store", str(tmp_path), cwd=tmp_path)
+    after_site = list(loaded)[list(loaded).index("site") + 1:]
+    top_level = [m for m in after_site if not m.startswith(" ")]
+    total_ms = sum(loaded[m] for m in top_level) / 1000
+    assert "prescale_cli.main" in top_level
+    assert total_ms < _STARTUP_BUDGET_MS, f"{total_ms:.0f}ms: {top_level}"
@@ -1,6 +1,7 @@
 """Tests for prescale compare — capacity diff + regression gating."""
 
 import json
+import random
 
 from click.testing import CliRunner
 
@@ -87,3 +88,101 @@ def test_compare_command_needs_two_runs(tmp_path):
     write_result(_result(100, run_id="20260629T140000Z-aaaaaa"), store=tmp_path)
     res = CliRunner().invoke(cli, ["compare", "--store", str(tmp_path)])
     assert res.exit_code == 1
+
+
+# --- --baseline history:N ---
+
+def _history(tmp_path, survives: list[int], new: int) -> str:
+    for i, s in enumerate(survives):
+        r = _result(s, run_id=f"20260629T1{i:02d}000Z-aaaaaa")
+        r["config"]["max_users"] = 200
+        write_result(r, store=tmp_path)
+    r = _result(new, run_id="20260630T120000Z-bbbbbb")
+    r["config"]["max_users"] = 200
+    write_result(r, store=tmp_path)
+    return r["id"]
+
+
+def test_history_baseline_absorbs_a_noisy_drop(tmp_path):
+    _history(tmp_path, [100, 140, 70, 120, 90], 75)  # -30%, but inside the spread
+    res = CliRunner().invoke(cli, ["compare", "--baseline", "history:5", "--json",
+                                   "--fail-on-regression", "--store", str(tmp_path)])
+    assert res.exit_code == 0, res.output
+    cmp = json.loads(res.output)
+    assert not cmp["regressed"] and len(cmp["baseline"]["runs"]) == 5
+    assert cmp["old"]["survives_users"] == 104
+
+
+def test_history_baseline_flags_a_drop_outside_the_spread(tmp_path):
+    new_id = _history(tmp_path, [500, 100, 102, 98, 101, 99], 60)
+    res = CliRunner().invoke(cli, ["compare", new_id, "--baseline", "history:5", "--json",
+                                   "--store", str(tmp_path)])
+    cmp = json.loads(res.output)
+    assert cmp["regressed"] and cmp["confident"]
+    assert "20260629T100000Z-aaaaaa" not in cmp["baseline"]["runs"]  # the 500 is too old
+    assert cmp["baseline"]["p_value"] < 0.01
+
+
+def test_history_baseline_skips_runs_with_other_settings(tmp_path):
+    new_id = _history(tmp_path, [100, 100], 100)
+    other = _result(10, run_id="20260629T200000Z-cccccc")  # different max_users
+    write_result(other, store=tmp_path)
+    res = CliRunner().invoke(cli, ["compare", new_id, "--baseline", "history:3", "--json",
+                                   "--store", str(tmp_path)])
+    assert "20260629T200000Z-cccccc" not in json.loads(res.output)["baseline"]["runs"]
+    bad = CliRunner().invoke(cli, ["compare", "--baseline", "history:x",
+                                   "--store", str(tmp_path)])
+    assert bad.exit_code == 1
+
+
+# --- per-route, per-level ---
+
+def _routed(p95s: dict, *, errors=0, shift=1.0, run_id=None):
+    """A one-level result whose routes have ~lognormal latencies around p95s/2."""
+    rng = random.Random(7 if shift == 1.0 else 8)
+    routes = {}
+    for label, base in p95s.items():
+        rs = RouteStat(total=400, errors=errors)
+        rs.latencies = [base / 2 * rng.lognormvariate(0, 0.35) for _ in range(400 - errors)]
+        routes[label] = rs
+    report = RunReport(stages=[StageResult(users=50, duration=5.0, routes=routes)],
+                       survives_users=50, max_tested=50, peak_rps=80.0)
+    r = build_result(report, url="http://localhost:8000",
+                     targets=[f"http://localhost:8000{p}" for p in p95s],
+                     config={"method": "GET", "max_users": 50}, warning=None)
+    if run_id:
+        r["id"] = run_id
+    return r
+
+
+def test_route_regression_surfaces_behind_steady_capacity():
+    old = _routed({"/": 0.05, "/api/search": 0.08})
+    new = _routed({"/": 0.05, "/api/search": 0.16}, shift=2.0)
+    c = compare_results(old, new)
+    assert not c["regressed"]  # same survives_users
+    [row] = c["route_regressions"]
+    assert row["route"] == "/api/search" and row["users"] == 50
+    assert row["reasons"] == ["latency"] and row["p_latency"] < 0.001
+    md = to_markdown(c)
+    assert "Routes that regressed" in md and "`/api/search`" in md
+
+
+def test_route_noise_is_not_a_regression():
+    c = compare_results(_routed({"/": 0.05}), _routed({"/": 0.05}, shift=1.01))
+    assert c["route_regressions"] == []
+
+
+def test_route_error_rise_is_flagged():
+    c = compare_results(_routed({"/": 0.05}), _routed({"/": 0.05}, errors=40))
+    assert c["route_regressions"][0]["reasons"] == ["errors"]
+
+
+def test_fail_on_route_regression_gates(tmp_path):
+    write_result(_routed({"/a": 0.05}, run_id="20260629T140000Z-aaaaaa"), store=tmp_path)
+    write_result(_routed({"/a": 0.2}, shift=4.0, run_id="20260629T150000Z-bbbbbb"),
+                 store=tmp_path)
+    ok = CliRunner().invoke(cli, ["compare", "--fail-on-regression", "--store", str(tmp_path)])
+    assert ok.exit_code == 0 and "Routes that regressed" in ok.output
+    res = CliRunner().invoke(cli, ["compare", "--fail-on-route-regression",
+                                   "--store", str(tmp_path)])
+    assert res.exit_code == 1
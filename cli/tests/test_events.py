@@ -0,0 +1,81 @@
+"""Tests for the NDJSON event stream (`--events ndjson`)."""
+
+import asyncio
+import http.server
+import json
+import threading
+
+import httpx
+from click.testing import CliRunner
+
+from prescale_cli.events import EventStream
+from prescale_cli.main import cli
+from prescale_cli.mcp_tools import investigate_summary, run_summary
+
+
+def _capture():
+    lines = []
+    return lines, EventStream(lines.append)
+
+
+def test_mcp_run_streams_stages_then_verdict(tmp_path):
+    lines, events = _capture()
+    transport = httpx.MockTransport(lambda req: httpx.Response(200, text="ok"))
+    s = asyncio.run(run_summary("http://localhost:9/", allow=set(), max_users=2,
+                                stage_seconds=0.02, store=tmp_path, transport=transport,
+                                events=events))
+    records = [json.loads(line) for line in lines]
+    kinds = [r["event"] for r in records]
+    assert kinds[0] == "stage_start" and kinds[-1] == "verdict"
+    assert kinds.count("stage_start") == kinds.count("stage_end") >= 1
+    end = next(r for r in records if r["event"] == "stage_end")
+    assert end["stage"]["users"] == end["users"] and "/" in end["stage"]["routes"]
+    assert records[-1]["id"] == s["id"]
+    assert [r["t"] for r in records] == sorted(r["t"] for r in records)
+
+
+def test_investigate_streams_each_probe(tmp_path):
+    lines, events = _capture()
+    transport = httpx.MockTransport(lambda req: httpx.Response(500, text="x"))
+    asyncio.run(investigate_summary("http://localhost:9/", allow=set(), max_users=2,
+                                    stage_seconds=0.02, store=tmp_path,
+                                    transport=transport, events=events))
+    records = [json.loads(line) for line in lines]
+    assert [r["name"] for r in records if r["event"] == "probe"] == [
+        "headers", "baseline", "static"]
+    assert records[-1]["event"] == "verdict"
+    assert records[-1]["investigation"]["culprit_route"] == "/"
+
+
+class _Ok(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+def test_run_events_ndjson_is_the_whole_stdout(tmp_path):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Ok)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        res = CliRunner().invoke(cli, [
+            "run", f"http://127.0.0.1:{server.server_port}", "-u", "2", "-s", "0.1",
+            "--no-warmup", "--ignore-robots", "--events", "ndjson",
+            "--store", str(tmp_path)])
+    finally:
+        server.shutdown()
+    assert res.exit_code == 0, res.output
+    records = [json.loads(line) for line in res.output.splitlines()]
+    assert records[-1]["event"] == "verdict"
+    assert records[-1]["verdict"]["onset_users"] is None
+    assert {r["event"] for r in records[:-1]} == {"stage_start", "stage_end"}
+
+
+def test_events_and_json_are_exclusive():
+    res = CliRunner().invoke(cli, ["run", "http://localhost:9", "--json",
+                                   "--events", "ndjson"])
+    assert res.exit_code == 1 and "pick one" in res.output
@@ -49,6 +49,17 @@ def test_history_json_newest_first(tmp_path):
     assert ids == ["20260628T150000Z-bbbbbb", "20260628T140000Z-aaaaaa"]
 
 
+def test_history_filters_by_date(tmp_path):
+    _write(tmp_path, run_id="20260628T140000Z-aaaaaa")
+    _write(tmp_path, run_id="20260628T150000Z-bbbbbb")
+    res = CliRunner().invoke(cli, ["history", "--json", "--since", "2099",
+                                   "--store", str(tmp_path)])
+    assert res.exit_code == 0 and json.loads(res.output) == []
+    res = CliRunner().invoke(cli, ["history", "--json", "--reindex", "--host", "localhost",
+                                   "--store", str(tmp_path)])
+    assert len(json.loads(res.output)) == 2
+
+
 def test_show_latest(tmp_path):
     _write(tmp_path, run_id="20260628T140000Z-aaaaaa")
     _write(tmp_path, run_id="20260628T150000Z-bbbbbb")
@@ -5,6 +5,7 @@ import asyncio
 
 import httpx
 
+from prescale_cli import investigate as investigate_mod
 from prescale_cli.investigate import (
     Diagnosis,
     Probes,
@@ -12,6 +13,7 @@ from prescale_cli.investigate import (
     investigate,
     remediate,
 )
+from prescale_cli.loadtest import StageResult
 
 
 def _p(**kw) -> Probes:
@@ -52,6 +54,19 @@ def test_classify_concurrency_ceiling_on_plateau():
     assert d.bottleneck_class == "concurrency_ceiling" and d.confidence == "high"
 
 
+def test_classify_harness_bound_when_littles_law_breaks():
+    d = classify(_p(baseline_p95_ms=30.0, loaded_p95_ms=2500.0, littles_residual=0.6))
+    assert d.bottleneck_class == "harness_bound"
+    assert any("Little's law explains only 40%" in e for e in d.evidence)
+
+
+def test_littles_law_evidence_backs_a_real_wall():
+    d = classify(_p(baseline_p95_ms=30.0, loaded_p95_ms=2500.0, throughput_plateaued=True,
+                    littles_residual=0.03))
+    assert d.bottleneck_class == "concurrency_ceiling"
+    assert any("the target set the pace" in e for e in d.evidence)
+
+
 def test_classify_unknown_when_no_clear_signal():
     d = classify(_p(baseline_p95_ms=30.0, loaded_p95_ms=40.0))
     assert d.bottleneck_class == "unknown" and d.confidence == "low"
@@ -89,3 +104,57 @@ def test_investigate_no_diagnosis_when_held_up(tmp_path):
         "http://localhost:9/", max_users=2, stage_seconds=0.02, store=tmp_path,
         transport=transport))
     assert result.get("investigation") is None
+
+
+def _one_at_a_time(delay=0.0, page="ok"):
+    """200 while only one request is in flight, 500 once two overlap — a
+    target whose onset is 2 users."""
+    state = {"in_flight": 0}
+
+    async def handler(req):
+        state["in_flight"] += 1
+        try:
+            await asyncio.sleep(delay)
+            ok = state["in_flight"] == 1
+        finally:
+            state["in_flight"] -= 1
+        return httpx.Response(200 if ok else 500, text=page)
+
+    return httpx.MockTransport(handler)
+
+
+def test_investigate_reuses_the_ramps_one_user_baseline(tmp_path, monkeypatch):
+    measured = []
+
+    async def fake_measure(client, url, *, users, seconds):
+        measured.append((url, users))
+        return StageResult(users=users, duration=seconds, routes={})
+
+    monkeypatch.setattr(investigate_mod, "measure_route", fake_measure)
+    result = asyncio.run(investigate(
+        "http://localhost:9/", max_users=2, stage_seconds=0.1, store=tmp_path,
+        transport=_one_at_a_time()))
+    assert result["investigation"]["culprit_route"] == "/"
+    assert result["stages"][0]["users"] == 1 and result["stages"][0]["total"] >= 20
+    assert measured == []  # no asset to probe, and the baseline came from the ramp
+
+
+def test_investigate_fetches_each_page_once(tmp_path, monkeypatch):
+    fetched = []
+    real = investigate_mod._get
+
+    async def spy(client, url):
+        fetched.append(url)
+        return await real(client, url)
+
+    async def fake_measure(client, url, *, users, seconds):
+        return StageResult(users=users, duration=seconds, routes={})
+
+    monkeypatch.setattr(investigate_mod, "_get", spy)
+    monkeypatch.setattr(investigate_mod, "measure_route", fake_measure)
+    page = '<script src="/static/app.js"></script>'
+    result = asyncio.run(investigate(
+        "http://localhost:9/", max_users=2, stage_seconds=0.02, store=tmp_path,
+        transport=_one_at_a_time(0.01, page)))
+    assert result["investigation"]["culprit_route"] == "/"
+    assert fetched == ["http://localhost:9/"]  # headers and asset list share one GET
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import re
+import time
 from io import StringIO
 
+import httpx
 from rich.console import Console
 
 from prescale_cli.live import LiveRamp, _ramp_table
-from prescale_cli.loadtest import RouteStat, StageResult
+from prescale_cli.loadtest import RouteStat, StageResult, _Sink, run_loadtest
 
 
 def _text(renderable) -> str:
@@ -70,3 +74,43 @@ def test_live_ramp_caption_phases():
         live.diagnosing()
         assert "diagnosing" in (live._caption or "")
     assert "warming up" in _text(_ramp_table([(10, None)], 2.0, caption="warming up…"))
+
+
+def _inflight(n_ok: int, n_err: int, latency: float = 0.05) -> _Sink:
+    sink = _Sink()
+    sink.start = time.monotonic()
+    for _ in range(n_ok):
+        sink.record_response("http://t/checkout", 200, latency)
+    for _ in range(n_err):
+        sink.record_response("http://t/checkout", 503, latency)
+    return sink
+
+
+def test_sink_live_reads_the_stage_so_far():
+    stats = _inflight(95, 5).live(20)
+    assert stats.requests == 100
+    assert stats.error_rate == 0.05
+    assert abs(stats.pct(0.95) - 0.05) < 0.05 * 0.02  # histogram precision
+    assert stats.rps > 0
+
+
+def test_live_ramp_fills_the_row_in_flight():
+    console = Console(file=StringIO(), force_terminal=False)
+    with LiveRamp(console, latency_wall=2.0) as live:
+        live.starting(20)
+        assert "running" in _text(live._render())  # nothing answered yet
+        live.streaming(20, _inflight(50, 0, latency=0.25))
+        text = _text(live._render())
+        assert "20…" in text and re.search(r"25\dms", text)  # bucket precision
+        live.finished(_stage(20, total=50, errors=0, p95_s=0.25))
+        assert "20…" not in _text(live._render())
+
+
+def test_run_loadtest_hands_over_each_measured_sink():
+    seen = []
+    transport = httpx.MockTransport(lambda req: httpx.Response(200, text="ok"))
+    asyncio.run(run_loadtest(["http://t/"], levels=[1, 2], stage_seconds=0.02,
+                             transport=transport,
+                             on_live=lambda users, sink: seen.append((users, sink))))
+    assert [u for u, _ in seen] == [1, 2]  # not the warmup
+    assert all(sink.live(u).requests > 0 for u, sink in seen)
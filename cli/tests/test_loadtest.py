@@ -1,24 +1,34 @@
 """Tests for the pure logic of the prescale run load engine."""
 
 import asyncio
+import random
 
 import httpx
+import pytest
 
 from prescale_cli.loadtest import (
     RouteStat,
+    SpikeRun,
     StageResult,
+    _merge_stages,
     _RateGate,
     _warmup_plan,
     analyze,
+    analyze_spike,
     build_targets,
     default_levels,
     detect_saturation,
     disallowed_targets,
+    littles_residual,
     parse_sitemap,
     percentile,
     quantile_bounds,
     route_label,
+    route_saturation,
     run_loadtest,
+    run_spike,
+    think_sampler,
+    unsettled_levels,
     wilson_bounds,
 )
 
@@ -238,6 +248,89 @@ def test_rate_capped_suppresses_saturation():
     assert report.saturated is False
 
 
+def _queue_on_checkout():
+    """A real ramp where /checkout is served one request at a time (~50 req/s
+    ceiling) and / answers at once."""
+    async def main():
+        checkout = asyncio.Lock()
+
+        async def handler(request):
+            if request.url.path == "/checkout":
+                async with checkout:
+                    await asyncio.sleep(0.02)
+            return httpx.Response(200, text="ok")
+
+        return await run_loadtest(
+            ["http://localhost:9/", "http://localhost:9/checkout"], levels=[1, 4, 12],
+            stage_seconds=0.4, warmup=False, transport=httpx.MockTransport(handler))
+
+    stages, _ = asyncio.run(main())
+    return stages
+
+
+def test_route_saturation_names_the_route_users_queue_on():
+    stages = _queue_on_checkout()
+    for stage in stages:  # round-robin: both routes always get the same share
+        assert abs(stage.routes["/"].total - stage.routes["/checkout"].total) <= stage.users
+    routes = route_saturation(stages)
+    assert routes["/checkout"].saturated and routes["/checkout"].knee_users == 1
+    assert routes["/checkout"].queued_users > 5
+    assert not routes["/"].saturated and routes["/"].queued_users < 1
+    report = analyze(stages, latency_wall=0.1, error_threshold=0.02)
+    assert report.saturated_route == "/checkout"
+    assert report.culprit_route == "/checkout"
+    assert "ceiling" in report.bottleneck.lower()
+
+
+def test_worst_route_prefers_saturated_route_over_the_wall():
+    stage = StageResult(users=50, duration=1.0, routes={
+        "/slow": RouteStat(total=10, latencies=[4.0] * 10),
+        "/capped": RouteStat(total=10, latencies=[2.5] * 10),
+    })
+    assert stage.worst_route("latency")[0] == "/slow"
+    assert stage.worst_route("latency", saturated=frozenset({"/capped"}),
+                             wall=2.0)[0] == "/capped"
+
+
+def test_rate_capped_suppresses_route_saturation():
+    stages = _queue_on_checkout()
+    report = analyze(stages, latency_wall=2.0, error_threshold=0.02, rate_capped=True)
+    assert report.saturated_route is None
+
+
+def test_littles_residual_closed_loop_is_near_zero():
+    # 10 users, 100 req/s at 0.05s + 0.05s think: 100 * 0.1 = 10 users explained.
+    rs = RouteStat(total=100, latencies=[0.05] * 100, busy=5.0)
+    stage = StageResult(users=10, duration=1.0, routes={"/": rs})
+    assert abs(littles_residual(stage, think_time=0.05)) < 1e-9
+
+
+def test_littles_residual_flags_unexplained_time():
+    # 10 users but only 4 requests in flight on average: 60% of VU-time is missing.
+    rs = RouteStat(total=40, latencies=[0.1] * 40, busy=4.0)
+    stage = StageResult(users=10, duration=1.0, routes={"/": rs})
+    assert abs(littles_residual(stage) - 0.6) < 1e-9
+    assert littles_residual(StageResult(users=10, duration=1.0)) is None
+    report = analyze([stage], latency_wall=2.0, error_threshold=0.02)
+    assert report.littles_residuals == [littles_residual(stage)]
+
+
+def test_failed_requests_count_as_busy_time():
+    seen = []
+
+    def handler(req):
+        seen.append(req)
+        if len(seen) == 1:  # let the preflight through
+            return httpx.Response(200)
+        raise httpx.ConnectError("refused", request=req)
+
+    transport = httpx.MockTransport(handler)
+    stages, _ = asyncio.run(run_loadtest(
+        ["http://t/"], levels=[2], stage_seconds=0.05, warmup=False, transport=transport))
+    assert stages[0].errors == stages[0].total > 0
+    assert stages[0].busy > 0
+
+
 # --- M5 safety rails ---
 
 def test_rate_gate_paces_starts():
@@ -352,6 +445,39 @@ def test_repeat_pools_samples_per_level():
     assert stages[0].samples == 3        # three ramps pooled into the one level
 
 
+def test_unsettled_levels_are_the_ones_straddling_the_threshold():
+    stages = [
+        _stage(10, {"/": _route(200, 0, 0.05)}),
+        _stage(50, {"/": _route(200, 6, 0.05)}),    # 3% on n=200 — could be either side
+        _stage(100, {"/": _route(200, 100, 0.05)}),  # 50% — fails however you slice it
+    ]
+    assert unsettled_levels(stages, latency_wall=2.0, error_threshold=0.02) == [50]
+    stages[1] = _stage(50, {"/": _route(20000, 600, 0.05)})  # same rate, 100x the data
+    assert unsettled_levels(stages, latency_wall=2.0, error_threshold=0.02) == []
+
+
+def test_resample_reruns_only_the_levels_it_names():
+    asked = []
+
+    def resample(pooled):
+        asked.append([s.samples for s in pooled])
+        return [2] if len(asked) < 3 else []
+
+    stages, _ = asyncio.run(run_loadtest(
+        ["http://t/"], levels=[1, 2, 4], stage_seconds=0.02, warmup=False,
+        resample=resample, transport=_counting_transport([])))
+    assert [s.samples for s in stages] == [1, 3, 1]
+    assert asked[0] == [1, 1, 1]
+
+
+def test_resample_stops_at_the_budget():
+    stages, _ = asyncio.run(run_loadtest(
+        ["http://t/"], levels=[1, 2], stage_seconds=0.02, warmup=False,
+        resample=lambda pooled: [1], resample_budget=0.1,
+        transport=_counting_transport([])))
+    assert 1 < stages[0].samples <= 6 and stages[1].samples == 1
+
+
 def test_think_time_throttles_a_worker():
     fast, slow = [], []
     asyncio.run(run_loadtest(["http://t/"], levels=[1], stage_seconds=0.1, warmup=False,
@@ -361,6 +487,35 @@ def test_think_time_throttles_a_worker():
     assert len(slow) < len(fast)
 
 
+def test_think_sampler_shapes_keep_the_mean():
+    assert think_sampler(0.5)() == 0.5                       # fixed: legacy behaviour
+    for dist in ("exponential", "uniform", "lognormal"):
+        draw = think_sampler(0.5, dist, random.Random(7))
+        vals = [draw() for _ in range(20000)]
+        assert min(vals) >= 0
+        assert abs(sum(vals) / len(vals) - 0.5) < 0.05
+        assert len(set(vals)) > 1                             # actually stochastic
+
+
+def test_think_sampler_is_seeded():
+    a = think_sampler(0.3, "exponential", random.Random(42))
+    b = think_sampler(0.3, "exponential", random.Random(42))
+    assert [a() for _ in range(5)] == [b() for _ in range(5)]
+
+
+def test_think_sampler_rejects_unknown_shape():
+    with pytest.raises(ValueError):
+        think_sampler(0.5, "gaussian")
+
+
+def test_stochastic_think_time_runs_end_to_end():
+    counter = []
+    stages, _ = asyncio.run(run_loadtest(
+        ["http://t/"], levels=[3], stage_seconds=0.1, warmup=False, think_time=0.02,
+        think_dist="exponential", seed=1, transport=_counting_transport(counter)))
+    assert stages[0].total > 0
+
+
 def test_verdict_is_deterministic():
     stages = [_stage(10, {"/": _route(200, 0, 0.05)}),
               _stage(50, {"/": _route(200, 6, 0.05)})]
@@ -368,3 +523,53 @@ def test_verdict_is_deterministic():
     b = analyze(stages, latency_wall=2.0, error_threshold=0.02)
     assert (a.survives_users, a.survives_low, a.survives_high, a.stable) == \
            (b.survives_users, b.survives_low, b.survives_high, b.stable)
+
+
+# --- spike shape ---
+
+def _spike_run(per_second):
+    """A SpikeRun from (users, latency, errors) per second: 3s baseline, then the
+    spike for as long as users stay high, then baseline again."""
+    seconds = [_lvl(u, 100, latency=lat, errors=err) for u, lat, err in per_second]
+    users = [u for u, _, _ in per_second]
+    start = next(i for i, u in enumerate(users) if u > users[0])
+    end = next(i for i in range(start, len(users)) if users[i] == users[0])
+    return SpikeRun(baseline=_merge_stages(seconds[:start]),
+                    spike=_merge_stages(seconds[start:end]),
+                    recovery=_merge_stages(seconds[end:]),
+                    seconds=seconds, spike_start=start, spike_end=end)
+
+
+def test_analyze_spike_measures_degrade_peak_and_recovery():
+    run = _spike_run([(10, 0.05, 0)] * 3 + [(100, 0.05, 0), (100, 0.4, 0), (100, 0.9, 5)]
+                     + [(10, 0.5, 0), (10, 0.2, 0), (10, 0.05, 0), (10, 0.05, 0),
+                        (10, 0.05, 0)])
+    info = analyze_spike(run, tolerance=0.2)
+    assert info.time_to_degrade_s == 1          # second 1 of the spike
+    assert info.peak_p95_ms == 900
+    assert info.peak_error_rate == 0.05
+    assert info.time_to_recover_s == 2          # healthy streak starts 2s after
+    assert info.recovered
+
+
+def test_analyze_spike_never_recovers():
+    run = _spike_run([(10, 0.05, 0)] * 3 + [(100, 1.0, 0)] * 2 + [(10, 1.0, 0)] * 4)
+    info = analyze_spike(run)
+    assert info.time_to_degrade_s == 0
+    assert info.time_to_recover_s is None and not info.recovered
+
+
+def test_analyze_spike_held_up():
+    run = _spike_run([(10, 0.05, 0)] * 3 + [(100, 0.05, 0)] * 2 + [(10, 0.05, 0)] * 3)
+    info = analyze_spike(run)
+    assert info.time_to_degrade_s is None and info.time_to_recover_s == 0
+
+
+def test_run_spike_end_to_end():
+    run, warning = asyncio.run(run_spike(
+        ["http://t/"], baseline_users=1, spike_users=4, baseline_seconds=0.05,
+        spike_seconds=0.05, recover_seconds=0.05, warmup=False,
+        transport=_counting_transport([])))
+    assert warning is None
+    assert run.baseline.users == 1 and run.spike.users == 4
+    assert sum(s.total for s in run.seconds) > 0
@@ -1,6 +1,7 @@
 """Tests for the MCP tool logic (no `mcp` package needed) and the server wiring."""
 
 import asyncio
+import json
 
 import httpx
 import pytest
@@ -13,6 +14,7 @@ from prescale_cli.mcp_tools import (
     host_allowed,
     investigate_summary,
     list_runs,
+    notifying,
     parse_allow,
     run_summary,
     summarize_result,
@@ -86,6 +88,25 @@ def test_run_summary_local_runs_and_persists(tmp_path):
     assert len(list_runs(store=tmp_path)) == 1    # persisted
 
 
+def test_notifications_arrive_in_order_before_the_tool_returns(tmp_path):
+    sent = []
+
+    async def slow_info(line):
+        await asyncio.sleep(0.001)  # a client round-trip; later events must still wait
+        sent.append(json.loads(line)["event"])
+
+    async def main():
+        async with notifying(slow_info) as events:
+            await run_summary("http://localhost:9/", allow=set(), max_users=2,
+                              stage_seconds=0.02, store=tmp_path,
+                              transport=_mock_ok([]), events=events)
+        return list(sent)
+
+    sent_by_return = asyncio.run(main())
+    assert sent_by_return[-1] == "verdict"
+    assert sent_by_return[0] == "stage_start" and "stage_end" in sent_by_return
+
+
 def test_run_summary_allows_listed_host(tmp_path):
     s = asyncio.run(run_summary(
         "https://staging.app/", allow={"staging.app"}, max_users=2, stage_seconds=0.02,
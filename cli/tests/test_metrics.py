@@ -0,0 +1,123 @@
+"""Tests for the OpenMetrics endpoint (`run --metrics-port`)."""
+
+import asyncio
+import re
+import socket
+import time
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from prescale_cli.loadtest import LoadError, _Sink, run_loadtest
+from prescale_cli.main import cli
+from prescale_cli.metrics import MetricsExporter, metrics_server
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _value(text, name, **labels):
+    want = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    pattern = rf"^{re.escape(name)}{re.escape('{' + want + '}') if want else ''} (\S+)$"
+    match = re.search(pattern, text, re.M)
+    return float(match.group(1)) if match else None
+
+
+async def _scrape(port, path="/metrics"):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: x\r\n\r\n".encode())
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, body = raw.decode().partition("\r\n\r\n")
+    return head, body
+
+
+def _sink(ok=0, slow=0, failed=0):
+    sink = _Sink()
+    sink.start = time.monotonic()
+    for _ in range(ok):
+        sink.record_response("http://x/", 200, 0.004)
+    for _ in range(slow):
+        sink.record_response("http://x/a", 200, 0.3)
+    for _ in range(failed):
+        sink.record_response("http://x/a", 503, 0.01)
+    sink.record_error("http://x/a", "timeout")
+    return sink
+
+
+def test_render_folds_finished_stages_into_the_totals():
+    exporter = MetricsExporter()
+    exporter.watch(5, _sink(ok=10, slow=2, failed=1))
+    exporter.watch(10, _sink(ok=4, slow=1, failed=3))
+    text = exporter.render()
+    assert _value(text, "prescale_users") == 10
+    assert _value(text, "prescale_requests_total", route="/", status=200) == 14
+    assert _value(text, "prescale_requests_total", route="/a", status=200) == 3
+    assert _value(text, "prescale_requests_total", route="/a", status=503) == 4
+    assert _value(text, "prescale_errors_total", route="/a", kind="5xx") == 4
+    assert _value(text, "prescale_errors_total", route="/a", kind="timeout") == 2
+    assert _value(text, "prescale_request_duration_seconds_bucket", le="0.005") == 14
+    assert _value(text, "prescale_request_duration_seconds_bucket", le="0.25") == 14
+    assert _value(text, "prescale_request_duration_seconds_bucket", le="0.5") == 17
+    assert _value(text, "prescale_request_duration_seconds_count") == 17
+    assert _value(text, "prescale_request_duration_seconds_sum") == pytest.approx(
+        14 * 0.004 + 3 * 0.3)
+    assert text.endswith("# EOF\n")
+    # Rendering twice mustn't double-count the stage in flight.
+    assert exporter.render() == text
+    # Scrapes read running sums, not the in-flight stage's ticks.
+    exporter._sink.ticks = []
+    assert exporter.render() == text
+
+
+def test_scrape_while_the_ramp_runs():
+    port = _free_port()
+
+    async def handler(request):
+        await asyncio.sleep(0.005)
+        return httpx.Response(200 if request.url.path == "/" else 404, text="ok")
+
+    async def main():
+        run = asyncio.create_task(run_loadtest(
+            ["http://localhost:9/", "http://localhost:9/gone"], levels=[2, 4],
+            stage_seconds=0.4, warmup=False, transport=httpx.MockTransport(handler),
+            metrics_port=port))
+        await asyncio.sleep(0.6)
+        during = await _scrape(port)
+        missing = await _scrape(port, "/nope")
+        stages, _ = await run
+        return during, missing, stages
+
+    (head, body), (missing, _), stages = asyncio.run(main())
+    assert head.startswith("HTTP/1.1 200") and "application/openmetrics-text" in head
+    assert _value(body, "prescale_users") == 4
+    assert _value(body, "prescale_requests_total", route="/", status=200) > \
+        stages[0].routes["/"].total
+    assert _value(body, "prescale_requests_total", route="/gone", status=404) > 0
+    assert _value(body, "prescale_loop_lag_seconds") is not None
+    assert missing.startswith("HTTP/1.1 404")
+    with pytest.raises(OSError):  # the endpoint goes away with the run
+        socket.create_connection(("127.0.0.1", port), timeout=1).close()
+
+
+def test_busy_port_is_a_load_error():
+    async def main():
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            s.listen()
+            async with metrics_server(s.getsockname()[1]):
+                pass
+
+    with pytest.raises(LoadError, match="metrics"):
+        asyncio.run(main())
+
+
+def test_metrics_port_refuses_spikes():
+    res = CliRunner().invoke(cli, ["run", "http://localhost:9", "--shape", "spike",
+                                   "--metrics-port", "9105"])
+    assert res.exit_code == 1 and "spike" in res.output
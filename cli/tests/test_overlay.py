@@ -0,0 +1,86 @@
+"""Tests for the multi-run overlay report (`prescale report --runs`)."""
+
+from click.testing import CliRunner
+
+from prescale_cli import overlay
+from prescale_cli.loadtest import RouteStat, StageResult, analyze
+from prescale_cli.main import cli
+from prescale_cli.overlay import build_overlay, render_overlay_html, select_runs
+from prescale_cli.result import build_result, write_result
+
+
+def _route(latency, n=200):
+    rs = RouteStat(total=n, errors=0)
+    rs.latencies = [latency * (1 + i / n / 10) for i in range(n)]
+    rs.status_counts = {200: n}
+    return rs
+
+
+def _save(store, run_id, commit, slow_latency):
+    stages = [StageResult(users=u, duration=5.0,
+                          routes={"/": _route(0.02), "/slow": _route(slow_latency * u / 10)})
+              for u in (10, 20, 40)]
+    result = build_result(
+        analyze(stages, latency_wall=2.0, error_threshold=0.02),
+        url="http://localhost:8000",
+        targets=["http://localhost:8000/", "http://localhost:8000/slow"],
+        config={"method": "GET", "max_users": 40, "latency_wall_s": 2.0}, warning=None)
+    result["id"] = run_id
+    result["environment"]["git_commit"] = commit
+    write_result(result, store=store)
+
+
+def _store(tmp_path, n=4):
+    for i in range(n):
+        _save(tmp_path, f"2026070{i + 1}T120000Z-{i:06x}", f"c0mm1t{i}", 0.05 * (1 + i))
+    return tmp_path
+
+
+def test_select_runs_oldest_first_without_repeats(tmp_path):
+    store = _store(tmp_path)
+    assert select_runs(["history:2"], store=store) == [
+        "20260703T120000Z-000002", "20260704T120000Z-000003"]
+    assert select_runs(["20260701", "history:2", "20260704"], store=store) == [
+        "20260701T120000Z-000000", "20260703T120000Z-000002", "20260704T120000Z-000003"]
+
+
+def test_build_overlay_reads_each_run_once(tmp_path, monkeypatch):
+    store = _store(tmp_path)
+    loads = []
+    real = overlay.load_result
+    monkeypatch.setattr(overlay, "load_result",
+                        lambda run_id, store: loads.append(run_id) or real(run_id, store=store))
+    ids = select_runs(["history:4"], store=store)
+    ov = build_overlay(ids, store=store)
+    assert loads == ids
+    assert [r.facts["commit"] for r in ov.runs] == [f"c0mm1t{i}" for i in range(4)]
+    assert [u for u, *_ in ov.runs[0].levels] == [10, 20, 40]
+    assert {d["route"] for d in ov.route_deltas} == {"/slow"}
+
+
+def test_render_overlay_html(tmp_path):
+    store = _store(tmp_path)
+    out = render_overlay_html(build_overlay(select_runs(["history:4"], store=store),
+                                            store=store))
+    assert out.lstrip().startswith("<!doctype html")
+    assert "Capacity over commits" in out and "p95 per level" in out
+    assert "c0mm1t0" in out and "c0mm1t3" in out
+    assert "Route regressions · c0mm1t0 → c0mm1t3" in out and "<td>/slow</td>" in out
+    assert out.count("<polyline") == 1 + 4  # capacity line + one per run
+
+
+def test_report_command(tmp_path):
+    store = _store(tmp_path)
+    html = tmp_path / "trend.html"
+    res = CliRunner().invoke(cli, ["report", "--runs", "20260701", "20260702,20260704",
+                                   "--store", str(store), "--html", str(html)])
+    assert res.exit_code == 0, res.output
+    assert "across 3 runs" in res.output
+    assert "c0mm1t1" in html.read_text() and "c0mm1t2" not in html.read_text()
+
+
+def test_report_needs_two_runs(tmp_path):
+    store = _store(tmp_path, n=1)
+    res = CliRunner().invoke(cli, ["report", "--runs", "history:5", "--store", str(store),
+                                   "--html", str(tmp_path / "r.html")])
+    assert res.exit_code == 1 and "at least two runs" in res.output
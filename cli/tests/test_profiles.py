@@ -2,6 +2,8 @@
 
 from click.testing import CliRunner
 
+from prescale_cli.commands import run as run_command
+from prescale_cli.loadtest import LoadError
 from prescale_cli.main import cli
 from prescale_cli.profiles import PROFILES, lookup, scenario_block
 
@@ -34,3 +36,21 @@ def test_profiles_command_lists_names():
     assert res.exit_code == 0
     for name in PROFILES:
         assert name in res.output
+
+
+def _think_dist(monkeypatch, *args):
+    seen = {}
+
+    async def fake_loadtest(targets, **kw):
+        seen.update(kw)
+        raise LoadError("stop here")
+
+    monkeypatch.setattr(run_command, "run_loadtest", fake_loadtest)
+    CliRunner().invoke(cli, ["run", "http://localhost:9", "--no-warmup", *args])
+    return seen["think_dist"]
+
+
+def test_explicit_think_dist_beats_the_profile(monkeypatch):
+    assert _think_dist(monkeypatch, "--profile", "reddit") == "exponential"
+    assert _think_dist(monkeypatch, "--profile", "reddit", "--think-dist", "fixed") == "fixed"
+    assert _think_dist(monkeypatch) == "fixed"
@@ -1,5 +1,14 @@
 """Tests for the HTML report renderer."""
 
+import io
+import re
+import time
+
+from rich.console import Console
+
+from prescale_cli import render
+from prescale_cli.changepoint import Tick
+from prescale_cli.downsample import lttb
 from prescale_cli.loadtest import RouteStat, StageResult, analyze
 from prescale_cli.report import render_html
 from prescale_cli.result import build_result, load_result, write_result
@@ -80,3 +89,133 @@ def test_render_html_is_pure_function_of_result(tmp_path):
     write_result(result, store=tmp_path)
     reloaded = load_result(result["id"], store=tmp_path)
     assert render_html(reloaded) == render_html(result)
+
+
+def test_lttb_keeps_ends_and_spikes():
+    points = [(float(i), 1.0) for i in range(10_000)]
+    points[4321] = (4321.0, 50.0)
+    out = lttb(points, 100)
+    assert len(out) == 100
+    assert out[0] == points[0] and out[-1] == points[-1]
+    assert (4321.0, 50.0) in out
+    assert lttb(points[:50], 100) == points[:50]
+
+
+def _result(stages):
+    report = analyze(stages, latency_wall=2.0, error_threshold=0.02)
+    return build_result(
+        report, url="https://app.com", targets=["https://app.com/"],
+        config={"method": "GET", "stage_seconds": 5.0, "max_users": 200,
+                "latency_wall_s": 2.0, "error_threshold": 0.02, "max_rps": None},
+        warning=None,
+    )
+
+
+def test_render_html_draws_curve_timeline_and_histograms():
+    out = _render([_stage(10, 1000, 0, 0.05), _stage(50, 1000, 200, 0.05)])
+    assert "Latency vs throughput" in out and "onset · 50" in out
+    assert "Timeline · 10s" in out
+    assert "Latency distribution · at 50 users" in out and ">100ms<" in out
+
+
+def test_ramp_timeline_rolls_ticks_up_to_seconds():
+    stages = [_stage(10, 1000, 0, 0.05), _stage(50, 1000, 200, 0.05)]
+    for stage in stages:  # 5s stages; the 50-user level starts failing at 3s
+        stage.duration = 5.0
+        stage.ticks = [Tick() for _ in range(51)]  # one straggler past the deadline
+        for i, tick in enumerate(stage.ticks):
+            for _ in range(20):
+                tick.add(None if stage.users == 50 and i >= 30 else 0.04)
+    result = _result(stages)
+    points = result["timeline"]
+    assert [p["t"] for p in points] == list(range(10))
+    assert points[0] == {"t": 0, "users": 10, "rps": 200.0, "mean_ms": 40,
+                         "error_rate": 0.0, "total": 200}
+    assert points[4]["total"] == 220  # the straggler folds into the last second
+    assert [p["error_rate"] for p in points[5:]] == [0.0, 0.0, 0.0, 1.0, 1.0]
+    out = render_html(result)
+    assert "Timeline · 9s" in out and "Mean latency" in out
+
+
+def test_render_html_marks_the_usl_peak():
+    result = _result([_stage(10, 1000, 0, 0.05), _stage(50, 1000, 0, 0.05)])
+    result["verdict"]["scalability"] = {"peak_rps": 1400.0, "r_squared": 0.5}
+    assert "USL peak · 1400 req/s" in render_html(result)
+
+
+def test_render_html_downsamples_a_long_soak():
+    result = _result([_stage(150, 1000, 0, 0.05)])
+    result["timeline"] = [
+        {"t": t, "users": 150, "rps": 100.0 + (t % 7), "p50_ms": 40, "p95_ms": 90,
+         "p99_ms": 120, "error_rate": 0.0, "total": 100}
+        for t in range(7200)
+    ]
+    start = time.perf_counter()
+    out = render_html(result)
+    assert time.perf_counter() - start < 1.0
+    assert "Timeline · 2h" in out
+    polylines = re.findall(r'<polyline points="([^"]*)"', out)
+    assert max(len(p.split()) for p in polylines) <= 300
+
+
+def _wide_result(n_routes=1000, n_levels=15):
+    """A sitemap-sized Result: every route at every level, as build_result lays
+    it out (histograms included), without running analyze over it."""
+    result = _result([_stage(10, 1000, 0, 0.05), _stage(50, 1000, 200, 0.05)])
+    hist = [[round(10 * 1.05 ** i, 2), 5] for i in range(40)]
+    result["stages"] = [
+        {"users": u, "rps": 5000.0, "p50_ms": 20, "p95_ms": 60, "p99_ms": 90,
+         "error_rate": 0.0, "errors": 0, "total": 25000, "samples": 25000,
+         "littles_residual": None,
+         "routes": {f"/page/{r}": {"total": 25, "errors": r % 7, "error_rate": (r % 7) / 25,
+                                   "rps": 5.0, "p50_ms": 20, "p95_ms": 20 + r % 300,
+                                   "p99_ms": 400, "latency_hist": hist}
+                    for r in range(n_routes)}}
+        for u in range(10, 10 * (n_levels + 1), 10)
+    ]
+    result["target"]["routes"] = list(result["stages"][0]["routes"])
+    result["verdict"]["onset_users"] = 150
+    result["verdict"]["culprit_route"] = "/page/5"
+    return result
+
+
+def test_render_html_folds_routes_past_the_worst():
+    out = render_html(_wide_result(40, 3))
+    top, _, rest = out.partition("<details>")
+    assert "+25 more routes" in rest
+    assert top.count('<td>/page/') == 15
+    assert '<tr class="onset"><td>/page/6</td>' not in out  # only the culprit is marked
+    assert '<tr class="onset"><td>/page/5</td>' in out
+
+
+def test_render_html_keeps_a_low_ranked_culprit_in_view():
+    result = _wide_result(40, 3)
+    result["verdict"]["culprit_route"] = "/page/0"  # no errors, fastest p95: ranks last
+    top, _, rest = render_html(result).partition("<details>")
+    assert '<tr class="onset"><td>/page/0</td>' in top
+    assert top.count("<td>/page/") == 16
+    assert "+24 more routes" in rest and "<td>/page/0</td>" not in rest
+
+
+def test_render_terminal_summarizes_the_rest(monkeypatch):
+    buf = io.StringIO()
+    monkeypatch.setattr(render, "_console", lambda: Console(file=buf, width=140))
+    render.render_terminal(_wide_result(40, 3))
+    table = buf.getvalue().partition("Per route")[2]
+    assert table.count("/page/") == 15
+    assert "+25 more" in table and "--all-routes" in table
+    buf.seek(0)
+    buf.truncate()
+    render.render_terminal(_wide_result(40, 3), all_routes=True)
+    assert buf.getvalue().partition("Per route")[2].count("/page/") == 40
+
+
+def test_render_benchmark_1000_routes_15_levels(monkeypatch):
+    result = _wide_result()
+    monkeypatch.setattr(render, "_console",
+                        lambda: Console(file=io.StringIO(), width=140))
+    start = time.perf_counter()
+    out = render_html(result)
+    render.render_terminal(result)
+    assert time.perf_counter() - start < 0.5
+    assert "+984 more routes" in out  # the culprit, ranked past 15, stays on top
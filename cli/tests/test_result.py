@@ -1,9 +1,13 @@
 """Tests for the Result contract and its on-disk store."""
 
 import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 
 import pytest
 
+from prescale_cli import result as result_module
 from prescale_cli.loadtest import RouteStat, RunReport, StageResult
 from prescale_cli.result import (
     SCHEMA_VERSION,
@@ -12,7 +16,9 @@ from prescale_cli.result import (
     build_result,
     latest_id,
     list_results,
+    load_header,
     load_result,
+    rebuild_index,
     schema_json,
     schema_warning,
     write_result,
@@ -92,6 +98,143 @@ def test_empty_store(tmp_path):
     assert latest_id(store=tmp_path) is None
 
 
+def test_index_tracks_writes_and_filters(tmp_path):
+    a = _result(id="20260601T140000Z-aaaaaa", created_at="2026-06-01T14:00:00Z",
+                environment={"git_commit": "abc1234", "git_branch": "main"})
+    b = _result(id="20260628T150000Z-bbbbbb", created_at="2026-06-28T15:00:00Z",
+                environment={"git_commit": "def5678", "git_branch": "feature"})
+    write_result(a, store=tmp_path)
+    write_result(b, store=tmp_path)
+    assert len((tmp_path / "index.jsonl").read_text().splitlines()) == 2
+    assert [r["id"] for r in list_results(store=tmp_path, branch="main")] == [a["id"]]
+    assert [r["id"] for r in list_results(store=tmp_path, since="2026-06-28")] == [b["id"]]
+    assert [r["id"] for r in list_results(store=tmp_path, until="2026-06-01")] == [a["id"]]
+    assert list_results(store=tmp_path, host="elsewhere") == []
+    assert list_results(store=tmp_path)[0]["commit"] == "def5678"
+
+
+def _age_index(store):
+    # mtimes are coarse; make "the index was written before this change" explicit.
+    os.utime(store / "index.jsonl", ns=(0, 0))
+
+
+def test_index_is_rebuilt_when_files_change(tmp_path):
+    write_result(_result(id="20260628T140000Z-aaaaaa"), store=tmp_path)
+    # A run copied in by hand (or from another store) isn't in the index yet.
+    copied = _result(id="20260628T150000Z-bbbbbb")
+    (tmp_path / "runs" / f"{copied['id']}.json").write_text(json.dumps(copied))
+    _age_index(tmp_path)
+    assert latest_id(store=tmp_path) == copied["id"]
+    (tmp_path / "runs" / f"{copied['id']}.json").unlink()
+    _age_index(tmp_path)
+    assert latest_id(store=tmp_path) == "20260628T140000Z-aaaaaa"
+    with pytest.raises(ResultNotFoundError):
+        load_result("20260628T150000Z", store=tmp_path)
+
+
+def test_read_only_store_lists_without_writing(tmp_path, monkeypatch):
+    for stamp in ("140000", "150000"):
+        write_result(_result(id=f"20260628T{stamp}Z-aaaaaa"), store=tmp_path)
+    (tmp_path / "index.jsonl").unlink()
+    (tmp_path / ".lock").unlink(missing_ok=True)
+    if os.geteuid() == 0:  # root ignores the mode bits; fail the way a read-only mount does
+        def denied(store):
+            raise PermissionError(13, "Permission denied", str(tmp_path / ".lock"))
+        monkeypatch.setattr(result_module, "_store_lock", denied)
+    os.chmod(tmp_path / "runs", 0o555)
+    os.chmod(tmp_path, 0o555)
+    try:
+        assert [r["id"] for r in list_results(store=tmp_path)] == [
+            "20260628T150000Z-aaaaaa", "20260628T140000Z-aaaaaa"]
+        assert latest_id(store=tmp_path) == "20260628T150000Z-aaaaaa"
+        assert load_header("20260628T14", store=tmp_path)["id"] == "20260628T140000Z-aaaaaa"
+    finally:
+        os.chmod(tmp_path, 0o755)
+        os.chmod(tmp_path / "runs", 0o755)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["runs"]  # nothing written
+
+
+def test_index_skips_torn_lines(tmp_path):
+    r = _result(id="20260628T140000Z-aaaaaa")
+    write_result(r, store=tmp_path)
+    with (tmp_path / "index.jsonl").open("a") as fh:
+        fh.write('{"id": "2026')
+    assert [m["id"] for m in list_results(store=tmp_path)] == [r["id"]]
+    assert [m["id"] for m in rebuild_index(store=tmp_path)] == [r["id"]]
+
+
+def test_compressed_run_roundtrips(tmp_path):
+    r = _result(timeline=[{"t": 0, "rps": 1.0}])
+    path = write_result(r, store=tmp_path, compress=True)
+    assert path.name == f"{r['id']}.json.gz"
+    assert load_result(r["id"], store=tmp_path) == r
+    assert load_result(str(path)) == r
+    assert latest_id(store=tmp_path) == r["id"]
+
+
+def test_header_skips_the_series(tmp_path):
+    r = _result(timeline=[{"t": 0, "rps": 1.0}])
+    write_result(r, store=tmp_path, compress=True)
+    header = load_header(r["id"], store=tmp_path)
+    assert "stages" not in header and "timeline" not in header
+    assert header["verdict"] == r["verdict"]
+    # A torn compressed run only loses its body; the header (first line) still lists.
+    path = tmp_path / "runs" / f"{r['id']}.json.gz"
+    path.write_bytes(path.read_bytes()[:-40])
+    assert load_header(r["id"], store=tmp_path)["id"] == r["id"]
+    assert [m["id"] for m in rebuild_index(store=tmp_path)] == [r["id"]]
+
+
+def test_resaving_in_the_other_format_replaces_the_file(tmp_path):
+    r = _result()
+    write_result(r, store=tmp_path, compress=True)
+    write_result(r, store=tmp_path)
+    assert sorted(p.name for p in (tmp_path / "runs").iterdir()) == [f"{r['id']}.json"]
+
+
+def _write_many(store: str, worker: int, n: int) -> None:
+    for i in range(n):
+        r = _result(id=f"20260628T{i:06d}Z-w{worker:05d}")
+        write_result(r, store=store, compress=bool(i % 2))
+
+
+def test_concurrent_writers_and_readers(tmp_path):
+    workers, per_worker = 4, 25
+    done = threading.Event()
+    seen: list[list[int]] = [[], []]
+    failures = []
+
+    def read(counts):
+        while not done.is_set():
+            try:
+                latest = latest_id(store=tmp_path)
+                if latest is not None:
+                    assert load_result(latest, store=tmp_path)["id"] == latest
+                counts.append(len(list_results(store=tmp_path)))
+            except Exception as exc:  # noqa: BLE001 - any failure is the finding
+                failures.append(exc)
+
+    readers = [threading.Thread(target=read, args=(counts,)) for counts in seen]
+    for t in readers:
+        t.start()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for f in [pool.submit(_write_many, str(tmp_path), w, per_worker)
+                      for w in range(workers)]:
+                f.result()
+    finally:
+        done.set()
+        for t in readers:
+            t.join()
+
+    assert failures == []
+    assert all(counts == sorted(counts) for counts in seen)  # the index only grows
+    runs = list_results(store=tmp_path)
+    assert len(runs) == workers * per_worker
+    assert len(rebuild_index(store=tmp_path)) == workers * per_worker
+    assert not list((tmp_path / "runs").glob(".*.tmp"))
+
+
 def test_schema_warning():
     assert schema_warning(_result()) is None
     assert schema_warning({"schema_version": SCHEMA_VERSION + 1}) is not None
@@ -0,0 +1,73 @@
+"""Tests for store retention (`prescale gc`)."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from click.testing import CliRunner
+
+from prescale_cli.loadtest import RouteStat, RunReport, StageResult
+from prescale_cli.main import cli
+from prescale_cli.result import build_result, list_results, load_result, write_result
+from prescale_cli.retention import RetentionPolicy, plan_gc
+
+NOW = datetime(2026, 10, 1, 12, tzinfo=timezone.utc)
+
+
+def _row(days_ago: float, *, host="a", branch="main", n=0):
+    ts = NOW - timedelta(days=days_ago)
+    return {"id": f"{ts:%Y%m%dT%H%M%S}Z-{n:06d}", "created_at": f"{ts:%Y-%m-%dT%H:%M:%SZ}",
+            "host": host, "branch": branch}
+
+
+def test_keeps_newest_per_group_and_thins_by_age():
+    rows = [_row(1), _row(2), _row(40), _row(40.1), _row(100), _row(100.2, branch="dev")]
+    plan = plan_gc(rows, RetentionPolicy(keep_last=2), NOW)
+    ids = {r["id"]: r for r in rows}
+    assert sorted(plan.drop) == [rows[3]["id"]]         # same day as a newer run, past 30d
+    assert plan.compact == [rows[4]["id"]]              # past 90d: verdict only
+    assert rows[5]["id"] in plan.keep                   # newest on its own branch
+    assert set(plan.keep) | set(plan.drop) | set(plan.compact) == set(ids)
+
+
+def test_kept_run_counts_as_its_days_newest():
+    rows = [_row(40), _row(40.1)]
+    plan = plan_gc(rows, RetentionPolicy(keep_last=1), NOW)
+    assert plan.keep == [rows[0]["id"]] and plan.drop == [rows[1]["id"]]
+
+
+def test_already_compacted_runs_stay_put():
+    row = dict(_row(200), compacted=True)
+    assert plan_gc([row], RetentionPolicy(keep_last=0), NOW).empty
+
+
+def _write(store, days_ago: float):
+    rs = RouteStat(total=100, errors=0, latencies=[0.02] * 100)
+    report = RunReport(stages=[StageResult(users=10, duration=5.0, routes={"/": rs})],
+                       survives_users=10, max_tested=10, peak_rps=20.0)
+    result = build_result(report, url="http://localhost:8000",
+                          targets=["http://localhost:8000/"],
+                          config={"method": "GET", "max_users": 10}, warning=None,
+                          timeline=[report.stages[0]])
+    row = _row(days_ago)
+    result.update(id=row["id"], created_at=row["created_at"])
+    write_result(result, store=store)
+    return result
+
+
+def test_gc_compacts_into_the_rollup(tmp_path):
+    old = _write(tmp_path, 400)
+    recent = _write(tmp_path, 1)
+    res = CliRunner().invoke(cli, ["gc", "--keep-last", "1", "--dry-run", "--json",
+                                   "--store", str(tmp_path)])
+    assert json.loads(res.output)["compact"] == [old["id"]]
+    assert (tmp_path / "runs" / f"{old['id']}.json").exists()  # dry run
+
+    res = CliRunner().invoke(cli, ["gc", "--keep-last", "1", "--store", str(tmp_path)])
+    assert res.exit_code == 0, res.output
+    assert not (tmp_path / "runs" / f"{old['id']}.json").exists()
+    assert [r["id"] for r in list_results(store=tmp_path)] == [recent["id"], old["id"]]
+    compacted = load_result(old["id"], store=tmp_path)
+    assert compacted["verdict"] == old["verdict"]
+    assert compacted["stages"] == [] and "timeline" not in compacted
+    res = CliRunner().invoke(cli, ["show", old["id"][:20], "--store", str(tmp_path)])
+    assert res.exit_code == 0 and "Scale readiness" in res.output
@@ -0,0 +1,104 @@
+"""Tests for the Universal Scalability Law fit."""
+
+from prescale_cli.loadtest import LatencyHistogram, RouteStat, StageResult, analyze
+from prescale_cli.render import scalability_summary
+from prescale_cli.result import build_result
+from prescale_cli.scalability import _fit_points, _quantiles, _refit, fit_usl, usl_throughput
+
+LEVELS = [1, 5, 10, 20, 40, 60, 80, 100]
+
+
+def _points(lam=100.0, sigma=0.05, kappa=0.0005, noise=0.0):
+    pts = []
+    for i, n in enumerate(LEVELS):
+        x = usl_throughput(n, lam, sigma, kappa) * (1 + noise * (-1) ** i)
+        pts.append((n, x, n / x))
+    return pts
+
+
+def test_fit_recovers_synthetic_parameters():
+    fit = fit_usl(_points(), latency_wall=2.0)
+    assert abs(fit.lam - 100) / 100 < 0.02
+    assert abs(fit.sigma - 0.05) < 0.01
+    assert abs(fit.kappa - 0.0005) / 0.0005 < 0.1
+    assert fit.r_squared > 0.999
+    assert abs(fit.peak_users - (0.95 / 0.0005) ** 0.5) < 3
+
+
+def test_fit_bands_bracket_estimate_and_are_deterministic():
+    a = fit_usl(_points(noise=0.03), latency_wall=2.0)
+    b = fit_usl(_points(noise=0.03), latency_wall=2.0)
+    assert a == b
+    assert a.peak_users_ci.low <= a.peak_users <= a.peak_users_ci.high
+    assert a.wall_users_ci.low <= a.wall_users <= a.wall_users_ci.high
+
+
+def test_resamples_refit_to_the_grid_minimum():
+    # The bootstrap's warm-started refit must land where the full grid does,
+    # or the band describes a different estimator than the point.
+    pts = [(float(n), x) for n, x, _ in _points(noise=0.1)]
+    lam, sigma, kappa, _ = _fit_points(pts)
+    for sample in (pts[:6], pts[2:], pts[::2] + pts[1:3]):
+        grid, refit = _fit_points(sample), _refit(sample, sigma, kappa)
+        assert refit[3] <= grid[3] * 1.001
+
+
+def test_noise_free_band_is_tight_around_the_point():
+    fit = fit_usl(_points(), latency_wall=2.0)
+    assert fit.peak_users_ci.low <= fit.peak_users <= fit.peak_users_ci.high
+    assert fit.peak_users_ci.high - fit.peak_users_ci.low < 0.5
+
+
+def test_no_band_without_enough_resamples_or_a_majority():
+    assert _quantiles([1.0, 2.0, 3.0], 3) == _quantiles([], 0)
+    assert _quantiles([], 0).low is None
+    many = [float(i) for i in range(100)]
+    assert _quantiles(many + [None] * 300, 400).low is None  # 25% have a peak
+    band = _quantiles(many + [None] * 50, 150)
+    assert band.low == 10.0 and band.high == 89.0
+
+
+def test_fit_needs_four_levels():
+    assert fit_usl(_points()[:3], latency_wall=2.0) is None
+
+
+def test_no_coherency_means_no_peak():
+    pts = [(n, usl_throughput(n, 50.0, 0.1, 0.0), 0.0) for n in LEVELS]
+    fit = fit_usl(pts, latency_wall=2.0)
+    assert fit.peak_users is None and fit.kappa < 1e-6
+    assert fit.peak_users_ci.low is None and fit.peak_users_ci.high is None
+
+
+def test_wall_projection_follows_littles_law():
+    fit = fit_usl(_points(), latency_wall=2.0)
+    # p95 == mean R here, so the wall is where N / X(N) reaches 2s.
+    n = fit.wall_users
+    assert abs(n / usl_throughput(n, 100.0, 0.05, 0.0005) - 2.0) < 0.05
+
+
+def _stage(users, rps, p95):
+    hist = LatencyHistogram()
+    hist.add(p95, int(rps * 5))
+    return StageResult(users=users, duration=5.0,
+                       routes={"/": RouteStat(total=int(rps * 5), hist=hist)})
+
+
+def test_analyze_attaches_fit_and_result_block():
+    stages = [_stage(n, x, n / x) for n, x, _ in _points()]
+    report = analyze(stages, latency_wall=2.0, error_threshold=0.02)
+    assert report.usl is not None
+    result = build_result(report, url="http://t/", targets=["http://t/"],
+                          config={}, warning=None)
+    block = result["verdict"]["scalability"]
+    assert block["model"] == "usl" and len(block["peak_users_band"]) == 2
+    assert "throughput peaks" in scalability_summary(block)
+
+
+def test_rate_capped_runs_skip_the_fit():
+    stages = [_stage(n, x, n / x) for n, x, _ in _points()]
+    report = analyze(stages, latency_wall=2.0, error_threshold=0.02, rate_capped=True)
+    assert report.usl is None
+
+
+def test_loose_fit_is_not_projected():
+    assert scalability_summary({"r_squared": 0.5}) is None
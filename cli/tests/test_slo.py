@@ -0,0 +1,101 @@
+"""Tests for per-route SLOs (prescale.yaml) driving the verdict."""
+
+import pytest
+from click.testing import CliRunner
+
+from prescale_cli.loadtest import RouteStat, StageResult, analyze
+from prescale_cli.main import cli
+from prescale_cli.render import slo_summary
+from prescale_cli.result import build_result
+from prescale_cli.slo import RouteSLO, SloError, parse_slos
+
+FALLBACK = RouteSLO(p95_ms=2000, error_budget=0.02)
+
+SLOS = """
+slos:
+  default: {error_budget: 0.05}
+  /api/*: {p95_ms: 300, error_budget: 0.01}
+  /reports/export: {p95_ms: 10000, min_rps: 5}
+"""
+
+
+def _stage(users, routes, duration=1.0):
+    return StageResult(users=users, duration=duration, routes=routes)
+
+
+def _ok(n, latency, errors=0):
+    return RouteStat(total=n, errors=errors, latencies=[latency] * (n - errors))
+
+
+def test_parse_inherits_default_and_matches_globs():
+    slos = parse_slos(SLOS, fallback=FALLBACK)
+    assert slos.default == RouteSLO(p95_ms=2000, error_budget=0.05)
+    assert slos.for_route("/api/search") == RouteSLO(p95_ms=300, error_budget=0.01)
+    assert slos.for_route("/reports/export").error_budget == 0.05  # inherited
+    assert slos.for_route("/pricing") == slos.default
+
+
+@pytest.mark.parametrize("text", [
+    "nope: 1",
+    "slos: {/api: {p95: 300}}",
+    "slos: {/api: {p95_ms: -1}}",
+    "slos: {api: {p95_ms: 300}}",
+    "slos: {default: {error_budget: 5}}",
+    "slos: [",
+])
+def test_parse_rejects_malformed_files(text):
+    with pytest.raises(SloError):
+        parse_slos(text, fallback=FALLBACK)
+
+
+def test_api_route_breaks_its_own_slo_under_the_global_wall():
+    slos = parse_slos(SLOS, fallback=FALLBACK)
+    stages = [
+        _stage(10, {"/api/search": _ok(100, 0.1), "/reports/export": _ok(10, 4.0)}),
+        _stage(50, {"/api/search": _ok(100, 0.45), "/reports/export": _ok(10, 6.0)}),
+    ]
+    plain = analyze(stages, latency_wall=2.0, error_threshold=0.02)
+    assert plain.culprit_route == "/reports/export"  # the global wall blames the export
+    report = analyze(stages, latency_wall=2.0, error_threshold=0.02, slos=slos)
+    assert report.onset_users == 50 and report.onset_reason == "latency"
+    assert report.culprit_route == "/api/search"
+    b = report.slo_breaches[0]
+    assert (b.route, b.slo, b.limit) == ("/api/search", "p95", 300)
+
+
+def test_error_budget_and_throughput_collapse():
+    slos = parse_slos(SLOS, fallback=FALLBACK)
+    stages = [
+        _stage(10, {"/reports/export": _ok(8, 1.0)}),
+        _stage(50, {"/reports/export": _ok(3, 1.0)}),  # fell below its 5 req/s floor
+    ]
+    report = analyze(stages, latency_wall=2.0, error_threshold=0.02, slos=slos)
+    assert report.onset_reason == "throughput"
+    assert report.slo_breaches[0].slo == "min_rps"
+
+    errs = [_stage(10, {"/api/x": _ok(1000, 0.05, errors=20)})]  # 2% > 1% budget
+    report = analyze(errs, latency_wall=2.0, error_threshold=0.05, slos=slos)
+    assert report.onset_reason == "errors"
+
+
+def test_unmet_floor_and_result_block():
+    slos = parse_slos(SLOS, fallback=FALLBACK)
+    stages = [_stage(10, {"/reports/export": _ok(2, 1.0)}),
+              _stage(50, {"/reports/export": _ok(3, 1.0)})]
+    report = analyze(stages, latency_wall=2.0, error_threshold=0.02, slos=slos)
+    assert report.onset_users is None
+    result = build_result(report, url="http://t/", targets=["http://t/reports/export"],
+                          config={}, warning=None)
+    block = result["verdict"]["slo"]
+    assert block["routes"]["/api/*"]["p95_ms"] == 300
+    assert block["unmet"][0]["route"] == "/reports/export"
+    lines = slo_summary(block)
+    assert "held" in lines[0] and "never reached" in lines[1]
+
+
+def test_run_reports_bad_slo_file(tmp_path):
+    bad = tmp_path / "prescale.yaml"
+    bad.write_text("slos: {api: {p95_ms: 1}}")
+    result = CliRunner().invoke(cli, ["run", "http://localhost:9", "--slo", str(bad)])
+    assert result.exit_code == 1
+    assert "route keys" in result.output
@@ -0,0 +1,164 @@
+"""Tests for soak mode — streaming histograms, trend tests, and the soak engine."""
+
+import asyncio
+import random
+import time
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from prescale_cli.loadtest import (
+    LatencyHistogram,
+    RouteStat,
+    StageResult,
+    _Sink,
+    analyze,
+    percentile,
+)
+from prescale_cli.main import cli
+from prescale_cli.soak import (
+    SoakRun,
+    SoakWindow,
+    _WindowSink,
+    analyze_soak,
+    mann_kendall,
+    parse_duration,
+    run_soak,
+    soak_block,
+    trend,
+)
+
+# --- durations ---
+
+def test_parse_duration_units():
+    assert parse_duration("2h") == 7200
+    assert parse_duration("90m") == 5400
+    assert parse_duration("1h30m") == 5400
+    assert parse_duration("45s") == 45
+    assert parse_duration("600") == 600
+
+
+def test_parse_duration_rejects_garbage():
+    with pytest.raises(ValueError):
+        parse_duration("2 hours")
+
+
+# --- streaming histogram ---
+
+def test_histogram_percentiles_track_exact_within_bucket_error():
+    rng = random.Random(3)
+    vals = [rng.lognormvariate(-3, 0.8) for _ in range(20000)]
+    hist = LatencyHistogram()
+    for v in vals:
+        hist.add(v)
+    exact = sorted(vals)
+    for p in (0.5, 0.95, 0.99):
+        assert abs(hist.percentile(p) - percentile(exact, p)) / percentile(exact, p) < 0.02
+
+
+def test_histogram_memory_is_bounded():
+    hist = LatencyHistogram()
+    for i in range(100000):
+        hist.add(0.001 + (i % 1000) * 0.0001)
+    assert hist.count == 100000
+    assert len(hist.counts) < 200  # buckets, not samples
+
+
+def test_streaming_sink_keeps_no_raw_samples():
+    sink = _Sink(streaming=True)
+    for _ in range(500):
+        sink.record_response("http://t/", 200, 0.05)
+    stat = sink.routes["/"]
+    assert stat.latencies == [] and stat.successes == 500
+    assert abs(stat.pct(0.95) - 0.05) < 0.001
+
+
+def test_soak_sink_keeps_a_rolling_window_of_ticks():
+    # Two hours in: a ramp sink would be holding 72,000 ticks by now.
+    sink = _WindowSink(time.monotonic() - 7200, 60.0, 7200)
+    for _ in range(300):
+        sink.record_response("http://t/", 200, 0.05)
+    sink.record_error("http://t/", "timeout")
+    assert len(sink.ticks) <= 20 and sink.first_tick >= 71000
+    stats = sink.live(5)
+    assert stats.requests == 301 and stats.rps > 0
+    assert sink.to_stage(5, 7200).ticks == []
+
+
+def test_analyze_works_on_histogram_stages():
+    hist = LatencyHistogram()
+    hist.add(3.0, 1000)
+    stages = [StageResult(users=50, duration=5.0,
+                          routes={"/": RouteStat(total=1000, hist=hist)})]
+    report = analyze(stages, latency_wall=2.0, error_threshold=0.02)
+    assert report.onset_reason == "latency"
+
+
+# --- trend tests ---
+
+def test_mann_kendall_detects_monotone_rise():
+    z, p = mann_kendall([float(i) for i in range(12)])
+    assert z > 0 and p < 0.01
+
+
+def test_mann_kendall_flat_series():
+    assert mann_kendall([5.0] * 10) == (0.0, 1.0)
+
+
+def test_trend_ignores_small_but_significant_rise():
+    vals = [100.0 + i * 0.1 for i in range(20)]  # +1.9% over the run
+    t = trend(vals, window_seconds=60, min_change=0.1)
+    assert t.p_value < 0.05 and not t.drifting
+
+
+def test_trend_needs_enough_points():
+    assert trend([1.0, 2.0, 3.0], window_seconds=60, min_change=0.1) is None
+
+
+def _window(i, p95_s, errors=0, total=1000, rss=None):
+    hist = LatencyHistogram()
+    hist.add(p95_s, total - errors)
+    return SoakWindow(index=i, total=total, errors=errors, hist=hist, rss_bytes=rss)
+
+
+def test_analyze_soak_flags_latency_drift_and_leak():
+    windows = [_window(i, 0.05 + 0.01 * i, rss=100_000_000 + i * 5_000_000)
+               for i in range(10)]
+    run = SoakRun(stage=StageResult(users=150, duration=600.0), windows=windows,
+                  window_seconds=60.0)
+    info = analyze_soak(run)
+    assert info.latency.drifting and info.drifting
+    assert info.rss.drifting and info.leak_suspected
+    assert info.errors is not None and not info.errors.drifting
+    block = soak_block(info)
+    assert block["drifting"] and block["leak_suspected"]
+
+
+def test_analyze_soak_steady():
+    rng = random.Random(1)
+    windows = [_window(i, 0.05 + rng.uniform(-0.002, 0.002)) for i in range(10)]
+    run = SoakRun(stage=StageResult(users=150, duration=600.0), windows=windows,
+                  window_seconds=60.0)
+    info = analyze_soak(run)
+    assert not info.drifting and not info.leak_suspected
+
+
+# --- engine ---
+
+def test_run_soak_windows_and_streams():
+    transport = httpx.MockTransport(lambda req: httpx.Response(200, text="ok"))
+    run, warning = asyncio.run(run_soak(
+        ["http://t/"], users=2, duration=0.3, window_seconds=0.1, warmup=False,
+        transport=transport))
+    assert warning is None
+    assert 1 <= len(run.windows) <= 3
+    assert sum(w.total for w in run.windows) == run.stage.total > 0
+    assert all(r.latencies == [] for r in run.stage.routes.values())
+
+
+def test_soak_refuses_repeat():
+    for repeat in ("2", "auto"):
+        res = CliRunner().invoke(cli, ["run", "http://localhost:9", "--soak", "10m",
+                                       "--repeat", repeat])
+        assert res.exit_code == 1 and "--repeat" in res.output